@@ -45,6 +45,10 @@ CONFIG = {
     # Default number of mel bands when scale='mel'
     "n_mels":       256,
 
+    # Minimum signal duration in seconds before the optional GPU STFT
+    # backend is used — short clips stay on the CPU path
+    "gpu_stft_min_duration_s": 30.0,
+
     ##    <(''<)  <( ' ' )>  (>'')>
     # PSD DEFAULTS
     ##    <(''<)  <( ' ' )>  (>'')>
@@ -86,6 +90,10 @@ CONFIG = {
     # Number of mel bands for grid spectrograms
     "grid_n_mels":         64,
 
+    # Worker threads for computing a grid page's spectrograms.
+    # None uses os.cpu_count(); 1 computes files one at a time.
+    "grid_load_workers":   None,
+
     ##    <(''<)  <( ' ' )>  (>'')>
     # HARMONIC ANNOTATOR DEFAULTS
     ##    <(''<)  <( ' ' )>  (>'')>
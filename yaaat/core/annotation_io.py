@@ -6,6 +6,7 @@ All functions operate on explicit arguments — no inheritance required.
 
 File structure per audio file (one file per tab, shared annotation directory):
     {prefix}_{stem}_changepoints.json   ← canonical geometry: contours, contour_metrics
+    {prefix}_{stem}_changepoints.npz    ← optional binary shadow of the contours
     {prefix}_{stem}_peaks.json          ← peak annotations and PSD peaks
     {prefix}_{stem}_harmonics.json      ← harmonic lines, ridges, contours
     {prefix}_{stem}_batch.json         ← batch grid selections
@@ -37,14 +38,29 @@ Global point annotation schema:
     }
 """
 
+import itertools
 import json
 import logging
+import os
 import traceback
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+# OPTIONAL FAST JSON BACKEND
+# orjson serializes to bytes several times faster than stdlib json.
+# Output stays plain indented JSON, so files remain interchangeable.
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 
 # (つ -' _ '- )つ    (つ -' _ '- )つ
 # FILE SUFFIX CONSTANTS
@@ -380,6 +396,106 @@ def _set_if_present(layer, attr, params_dict, key, cast):
 # All tabs use these for safe merge-write and checked load
 ##    <(''<)  <( ' ' )>  (>'')>
 
+def _tmp_path(path):
+    """Return the sibling temp path used for atomic writes of path.
+
+    Writers dump to <name>.tmp and os.replace() it over the target so a
+    crash mid-write never leaves a truncated annotation file behind.
+    """
+    return path.with_name(path.name + ".tmp")
+
+
+def _json_default(obj):
+    """stdlib json fallback for the NumPy values orjson serializes natively."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_bytes(data):
+    """Serialize data to indented JSON bytes — orjson when available.
+
+    NumPy arrays and scalars serialize on both paths — natively with orjson,
+    via tolist()/item() with stdlib json.
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+
+
+def _json_loads(raw):
+    """Parse JSON bytes or str — orjson when available."""
+    return orjson.loads(raw) if _ORJSON_AVAILABLE else json.loads(raw)
+
+
+def read_json(path):
+    """Read and parse a JSON file in one call.
+
+    Args:
+        path: Path or str
+
+    Returns:
+        parsed JSON value
+
+    Raises:
+        FileNotFoundError, or a decode error (ValueError subclass) on bad JSON
+    """
+    return _json_loads(Path(path).read_bytes())
+
+
+def write_json(path, data):
+    """Write data to path as indented JSON.
+
+    Args:
+        path: Path or str
+        data: JSON-serializable value; NumPy arrays allowed
+    """
+    Path(path).write_bytes(_json_bytes(data))
+
+
+# Items serialized per write when streaming a large list (contours)
+_STREAM_BATCH = 100
+
+
+def _write_json_streamed(f, data, stream_key, batch_size=_STREAM_BATCH):
+    """Write data to binary file f as indented JSON, streaming one list.
+
+    data[stream_key] may be any iterable (e.g. a generator of contour
+    dicts); only batch_size items are serialized and held at a time.
+    Output is byte-identical to _json_bytes(data) with that value as a list.
+
+    Args:
+        f:          binary file object
+        data:       dict — top-level object to write
+        stream_key: str  — key whose value is emitted in batches
+        batch_size: int  — items per serialized batch
+    """
+    f.write(b"{")
+    for i, (key, value) in enumerate(data.items()):
+        f.write(b"\n  " if i == 0 else b",\n  ")
+        f.write(_json_bytes(key) + b": ")
+
+        if key != stream_key:
+            f.write(_json_bytes(value).replace(b"\n", b"\n  "))
+            continue
+
+        items = iter(value)
+        sep   = b"["
+        while True:
+            batch = list(itertools.islice(items, batch_size))
+            if not batch:
+                break
+            # Drop the batch's own "[" and "\n]", indent one level deeper
+            body = _json_bytes(batch)[1:-2].replace(b"\n", b"\n  ")
+            f.write(sep + body)
+            sep = b","
+        f.write(b"[]" if sep == b"[" else b"\n  ]")
+    f.write(b"\n}" if data else b"}")
+
+
 def load_annotation_file(path):
     """Load an annotation JSON file, returning an empty dict if not found.
 
@@ -390,46 +506,62 @@ def load_annotation_file(path):
         dict — loaded annotation data, or empty dict
     """
     path = Path(path)
-    if not path.exists():
-        return {}
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        return read_json(path)
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         logger.error("Failed to load annotation file %s: %s", path, e)
         return {}
 
 
-def save_annotation_file(path, data):
+def save_annotation_file(path, data, stream_key=None):
     """Write annotation data to JSON, creating parent directories if needed.
 
     Args:
-        path: Path — annotation file path
-        data: dict — annotation data to write
+        path:       Path — annotation file path
+        data:       dict — annotation data to write
+        stream_key: str or None — key whose (possibly lazy) list is written
+                    in batches by _write_json_streamed() instead of being
+                    serialized in one piece
+
+    Returns:
+        bool — True if the file was written
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+        tmp = _tmp_path(path)
+        if stream_key is None:
+            tmp.write_bytes(_json_bytes(data))
+        else:
+            with open(tmp, 'wb') as f:
+                _write_json_streamed(f, data, stream_key)
+        os.replace(tmp, path)
         logger.debug("Saved annotation file: %s", path)
+        return True
     except Exception as e:
         logger.error("Failed to save annotation file %s: %s", path, e)
+        return False
 
 
-def merge_and_save(path, tab_data):
+def merge_and_save(path, tab_data, stream_key=None):
     """Merge tab_data into existing annotation file and write back.
 
     Reads existing content, updates only the keys present in tab_data,
     and writes the merged result. Preserves all keys from other tabs.
 
     Args:
-        path:     Path — annotation file path
-        tab_data: dict — keys and values owned by the calling tab
+        path:       Path — annotation file path
+        tab_data:   dict — keys and values owned by the calling tab
+        stream_key: str or None — passed through to save_annotation_file()
+
+    Returns:
+        bool — True if the file was written
     """
     existing = load_annotation_file(path)
     existing.update(tab_data)
-    save_annotation_file(path, existing)
+    return save_annotation_file(path, existing, stream_key=stream_key)
 
 
 def load_and_check_params(path, layer, suffix, annotation_dir):
@@ -448,9 +580,21 @@ def load_and_check_params(path, layer, suffix, annotation_dir):
         dict — loaded annotation data (may be empty)
     """
     data = load_annotation_file(path)
-    if not data:
-        return data
+    if data:
+        check_params(data, path, layer, suffix, annotation_dir)
+    return data
 
+
+def check_params(data, path, layer, suffix, annotation_dir):
+    """Check already-loaded spec/psd params against current layer state.
+
+    Args:
+        data:           dict — annotation data with optional spec/psd params
+        path:           Path — annotation file the params came from
+        layer:          BaseLayer instance
+        suffix:         str  — tab suffix constant
+        annotation_dir: Path — for mismatch log
+    """
     current_spec = build_spec_params(
         layer, orientation=_SUFFIX_ORIENTATION.get(suffix, "horizontal"))
     current_psd  = build_psd_params(layer)
@@ -477,7 +621,85 @@ def load_and_check_params(path, layer, suffix, annotation_dir):
                 layer, psd_result['differences'],
                 'psd_params', stored_psd, path)
 
-    return data
+
+##    <(''<)  <( ' ' )>  (>'')>
+# BINARY SHADOW FILES
+# A compressed .npz next to an annotation JSON holds the same geometry as
+# flat arrays, so large files load without parsing JSON. The JSON stays
+# canonical: the shadow is written after it and records the JSON's size and
+# mtime_ns. It is used only when both still match exactly — any later JSON
+# write (failed shadow write, external edit, skip marking) or a copy that
+# does not preserve mtimes falls back to the JSON. Comparing the two files'
+# mtimes is not enough: copies, rsync and checkouts can reorder them.
+##    <(''<)  <( ' ' )>  (>'')>
+
+# Meta key holding [st_size, st_mtime_ns] of the JSON the shadow was written for
+_SHADOW_STAMP_KEY = '_json_stat'
+
+
+def _json_stamp(path):
+    """[st_size, st_mtime_ns] of path — the shadow freshness stamp."""
+    st = Path(path).stat()
+    return [st.st_size, st.st_mtime_ns]
+
+def shadow_path(path):
+    """Return the .npz shadow path for an annotation JSON path."""
+    return Path(path).with_suffix(".npz")
+
+
+def save_shadow_arrays(path, arrays, meta):
+    """Write arrays and a small JSON-serializable meta dict to the shadow.
+
+    Call after the JSON at path has been written — its current size and
+    mtime are stamped into the stored meta.
+
+    Args:
+        path:   Path — annotation JSON path the shadow belongs to
+        arrays: dict — name -> np.ndarray (numeric dtypes only)
+        meta:   dict — non-array data stored as one JSON string
+
+    Returns:
+        bool — True if the shadow was written
+    """
+    shadow = shadow_path(path)
+    try:
+        meta = {**meta, _SHADOW_STAMP_KEY: _json_stamp(path)}
+        tmp  = _tmp_path(shadow)
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(
+                f, meta=np.array(_json_bytes(meta).decode()), **arrays)
+        os.replace(tmp, shadow)
+        logger.debug("Saved shadow file: %s", shadow)
+        return True
+    except Exception as e:
+        logger.error("Failed to save shadow file %s: %s", shadow, e)
+        return False
+
+
+def load_shadow_arrays(path):
+    """Load the shadow of path if it exists and was written for path as it is now.
+
+    Args:
+        path: Path — annotation JSON path
+
+    Returns:
+        (dict, dict) — (arrays, meta), or None if the shadow is missing,
+        stale or unreadable and the caller should fall back to the JSON
+    """
+    shadow = shadow_path(path)
+    try:
+        with np.load(shadow, allow_pickle=False) as z:
+            meta = json.loads(str(z['meta']))
+            if meta.pop(_SHADOW_STAMP_KEY, None) != _json_stamp(path):
+                logger.debug("Ignoring stale shadow file: %s", shadow)
+                return None
+            arrays = {name: z[name] for name in z.files if name != 'meta'}
+        return arrays, meta
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Failed to load shadow file %s: %s", shadow, e)
+        return None
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
@@ -544,23 +766,29 @@ def is_skipped(changepoints_path):
 def save_global_point_annotations(global_point_annotations, annotation_dir):
     """Persist the global point annotation dict to disk.
 
-    Writes to <annotation_dir>/_global_point_annotations.json.
-    No-ops silently if annotation_dir is None.
+    Writes to <annotation_dir>/_global_point_annotations.json via a temp
+    file and os.replace(). No-ops silently if annotation_dir is None.
 
     Args:
         global_point_annotations: dict — class-level shared annotation store
         annotation_dir:           Path or None
+
+    Returns:
+        bool — True if the file was written
     """
     if not annotation_dir:
-        return
+        return False
 
     out = Path(annotation_dir) / _GLOBAL_POINT_ANNOTATION_FILENAME
+    tmp = _tmp_path(out)
     try:
-        with open(out, 'w') as f:
-            json.dump(global_point_annotations, f, indent=2)
+        tmp.write_bytes(_json_bytes(global_point_annotations))
+        os.replace(tmp, out)
         logger.debug("Saved global point annotations to %s", out)
+        return True
     except Exception as e:
         logger.error("Failed to save global point annotations: %s", e)
+        return False
 
 
 def load_global_point_annotations(annotation_dir):
@@ -578,14 +806,14 @@ def load_global_point_annotations(annotation_dir):
         return {}
 
     inp = Path(annotation_dir) / _GLOBAL_POINT_ANNOTATION_FILENAME
-    if not inp.exists():
-        return {}
 
+    # One read — a missing file surfaces as FileNotFoundError, no separate stat
     try:
-        with open(inp, 'r') as f:
-            data = json.load(f)
+        data = read_json(inp)
         logger.debug("Loaded global point annotations from %s", inp)
         return data
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         logger.error("Failed to load global point annotations: %s", e)
         return {}
@@ -602,13 +830,15 @@ def load_global_point_annotations_into(layer):
     from yaaat.core.base_layer import BaseLayer
     BaseLayer.global_point_annotations = load_global_point_annotations(
         layer.annotation_dir)
+    BaseLayer.global_annotations_dirty = False
+    BaseLayer.global_annotations_version += 1
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
 # POINT BUCKET ACCESS
 ##    <(''<)  <( ' ' )>  (>'')>
 
-def get_point_bucket(global_point_annotations, audio_files,
+def get_point_bucket(global_point_annotations, audio_paths,
                      current_file_idx, scope, class_name):
     """Return the annotation list for the current file and scope.
 
@@ -616,7 +846,7 @@ def get_point_bucket(global_point_annotations, audio_files,
 
     Args:
         global_point_annotations: dict
-        audio_files:              list of Path
+        audio_paths:              list of str — str(path) per audio file
         current_file_idx:         int
         scope:                    str — 'global' or 'class'
         class_name:               str — calling tab class name
@@ -624,10 +854,10 @@ def get_point_bucket(global_point_annotations, audio_files,
     Returns:
         list or None
     """
-    if not audio_files:
+    if not audio_paths:
         return None
 
-    audio_path = str(audio_files[current_file_idx])
+    audio_path = audio_paths[current_file_idx]
     file_dict  = global_point_annotations.setdefault(audio_path, {})
 
     if scope == "global":
@@ -636,14 +866,14 @@ def get_point_bucket(global_point_annotations, audio_files,
     return file_dict.setdefault(class_name, [])
 
 
-def add_annotation_point(global_point_annotations, audio_files,
+def add_annotation_point(global_point_annotations, audio_paths,
                          current_file_idx, time_s, freq_hz,
                          label, scope, class_name):
     """Append a point annotation to the appropriate bucket.
 
     Args:
         global_point_annotations: dict
-        audio_files:              list of Path
+        audio_paths:              list of str — str(path) per audio file
         current_file_idx:         int
         time_s:                   float
         freq_hz:                  float
@@ -652,7 +882,7 @@ def add_annotation_point(global_point_annotations, audio_files,
         class_name:               str
     """
     bucket = get_point_bucket(
-        global_point_annotations, audio_files,
+        global_point_annotations, audio_paths,
         current_file_idx, scope, class_name)
 
     if bucket is None:
@@ -675,24 +905,27 @@ def add_annotation_point(global_point_annotations, audio_files,
 ##    <(''<)  <( ' ' )>  (>'')>
 
 def get_shared_point_annotations_for_file(global_point_annotations,
-                                          audio_files, current_file_idx,
+                                          audio_paths, current_file_idx,
                                           class_name):
     """Return global and class-scoped point annotations for the current file.
 
     Args:
         global_point_annotations: dict
-        audio_files:              list of Path
+        audio_paths:              list of str — str(path) per audio file
         current_file_idx:         int
         class_name:               str
 
     Returns:
         tuple(list, list) — (global_points, class_points)
     """
-    if not audio_files:
+    if not audio_paths:
+        return [], []
+
+    audio_path   = audio_paths[current_file_idx]
+    file_dict    = global_point_annotations.get(audio_path)
+    if not file_dict:
         return [], []
 
-    audio_path   = str(audio_files[current_file_idx])
-    file_dict    = global_point_annotations.get(audio_path, {})
     global_pts   = file_dict.get("global", [])
     class_pts    = file_dict.get(class_name, [])
 
@@ -713,7 +946,8 @@ def compute_contour_metrics(contours):
     contour dict.
 
     Args:
-        contours: list of dicts — each with 'points', 'onset_idx', 'offset_idx'
+        contours: iterable of dicts — each with 'points' (POINT_DTYPE array
+                  or list of {'time', 'freq'} dicts), 'onset_idx', 'offset_idx'
 
     Returns:
         list of dicts — one metrics dict per contour
@@ -730,7 +964,10 @@ def compute_contour_metrics(contours):
 
         onset_time  = points[onset_idx]['time']
         offset_time = points[offset_idx]['time']
-        all_freqs   = [p['freq'] for p in points]
+        if isinstance(points, np.ndarray):
+            all_freqs = points['freq']
+        else:
+            all_freqs = np.array([p['freq'] for p in points])
 
         metrics.append({
             "contour_index":    i,
@@ -738,9 +975,9 @@ def compute_contour_metrics(contours):
             "onset_time":       float(onset_time),
             "offset_time":      float(offset_time),
             "contour_duration": float(offset_time - onset_time),
-            "frequency_min":    float(min(all_freqs)),
-            "frequency_max":    float(max(all_freqs)),
-            "frequency_spread": float(max(all_freqs) - min(all_freqs)),
+            "frequency_min":    float(all_freqs.min()),
+            "frequency_max":    float(all_freqs.max()),
+            "frequency_spread": float(all_freqs.max() - all_freqs.min()),
             "num_points":       len(points),
         })
 
@@ -15,15 +15,65 @@ All functions are stateless and operate on explicit numpy array arguments.
 
 Dependencies:
     numpy, scipy.signal only — no librosa, no pysoniq, no tkinter
+    torch (optional) — batched GPU STFT for long files when CUDA is present
+    numba (optional) — frame/detrend/window kernel for the CPU STFT,
+                       and the mel filterbank triangle kernel
+    pyfftw (optional) — cached FFTW plans for the CPU STFT rfft
 """
 
+import functools
 import logging
+import os
+import threading
 
 import numpy as np
-from scipy.signal import spectrogram, welch
+from scipy.signal import spectrogram, welch, get_window
+
+from yaaat.config import CONFIG
 
 logger = logging.getLogger(__name__)
 
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+# OPTIONAL GPU STFT BACKEND
+# torch is not a hard dependency. When importable and a CUDA device is
+# present, long signals can be framed and transformed in one batched cuFFT.
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+try:
+    import torch
+    _TORCH_AVAILABLE = True
+except ImportError:
+    _TORCH_AVAILABLE = False
+
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+# OPTIONAL NUMBA KERNELS
+# When numba is importable, the CPU STFT stages frames with a compiled
+# loop instead of scipy's generic _spectral_helper, and mel
+# filterbank triangles are filled by a compiled loop per filter.
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+# OPTIONAL PYFFTW BACKEND
+# FFTW plans are cached per (frame length, dtype) over a fixed block of
+# frames, so a new file at the same STFT params skips planning whatever its
+# length. Plans hold their own I/O buffers and are not safe to share between
+# threads, so each thread (Tk, I/O pool, grid workers) keeps its own. Wisdom import/export is handled by file_nav.
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+try:
+    import pyfftw
+    import pyfftw.builders
+    _PYFFTW_AVAILABLE = True
+except ImportError:
+    _PYFFTW_AVAILABLE = False
+
+# scipy.signal.spectrogram default window — mirrored by the GPU path so both
+# backends produce identical magnitudes
+_STFT_WINDOW = ('tukey', 0.25)
+
 
 # (つ -' _ '- )つ    (つ -' _ '- )つ
 # MEL SCALE CONSTANTS
@@ -66,21 +116,46 @@ def mel_to_hz(mel):
 # MEL FILTERBANK
 ##    <(''<)  <( ' ' )>  (>'')>
 
-def create_mel_filterbank(sr, n_fft, n_mels=128, fmin=0, fmax=None):
+if _NUMBA_AVAILABLE:
+    # Serial and nogil, like the STFT framing kernel — grid workers can build
+    # filterbanks concurrently, and parallel launches must not overlap
+    @numba.njit(nogil=True, cache=True)
+    def _mel_triangles(hz_points, fft_freqs, out):
+        """Fill out[i] with the i-th triangular filter over fft_freqs.
+
+        Same clip-and-multiply form as the NumPy broadcast path.
+        """
+        for i in range(out.shape[0]):
+            left   = hz_points[i]
+            center = hz_points[i + 1]
+            right  = hz_points[i + 2]
+            for j in range(fft_freqs.shape[0]):
+                rising  = (fft_freqs[j] - left) / (center - left)
+                falling = (right - fft_freqs[j]) / (right - center)
+                rising  = min(max(rising, 0.0), 1.0)
+                falling = min(max(falling, 0.0), 1.0)
+                out[i, j] = rising * falling
+
+
+def create_mel_filterbank(sr, n_fft, n_mels=128, fmin=0, fmax=None,
+                          fft_freqs=None):
     """Construct a triangular mel filterbank matrix.
 
     Filterbank is built over mel-spaced center frequencies between
     fmin and fmax. Each filter is a triangular window in linear frequency.
 
     Args:
-        sr:     int   — sample rate in Hz
-        n_fft:  int   — FFT size; determines number of frequency bins
-        n_mels: int   — number of mel filter bands
-        fmin:   float — minimum frequency in Hz
-        fmax:   float or None — maximum frequency in Hz; defaults to sr/2
+        sr:        int   — sample rate in Hz
+        n_fft:     int   — FFT size; determines number of frequency bins
+        n_mels:    int   — number of mel filter bands
+        fmin:      float — minimum frequency in Hz
+        fmax:      float or None — maximum frequency in Hz; defaults to sr/2
+        fft_freqs: np.ndarray or None — linear bin frequencies to build the
+                   filters over, e.g. the actual STFT bins; defaults to
+                   n_fft//2 + 1 bins evenly spaced over [0, sr/2]
 
     Returns:
-        mel_basis: np.ndarray shape (n_mels, n_fft//2 + 1) — filterbank matrix
+        mel_basis: np.ndarray shape (n_mels, n_bins) — filterbank matrix
         mel_freqs: np.ndarray shape (n_mels,) — center frequency of each mel band in Hz
     """
     if fmax is None:
@@ -93,21 +168,26 @@ def create_mel_filterbank(sr, n_fft, n_mels=128, fmin=0, fmax=None):
     hz_points  = mel_to_hz(mel_points)
 
     # Linear FFT bin frequencies
-    fft_freqs = np.linspace(0, sr / 2.0, n_fft // 2 + 1)
-
-    mel_basis = np.zeros((n_mels, n_fft // 2 + 1))
-
-    for i in range(n_mels):
-        left   = hz_points[i]
-        center = hz_points[i + 1]
-        right  = hz_points[i + 2]
+    if fft_freqs is None:
+        fft_freqs = np.linspace(0, sr / 2.0, n_fft // 2 + 1)
+
+    if _NUMBA_AVAILABLE:
+        # One fused pass per filter, filters in parallel, no temporaries
+        fft_freqs = np.ascontiguousarray(fft_freqs, dtype=np.float64)
+        mel_basis = np.empty((n_mels, fft_freqs.shape[0]))
+        _mel_triangles(hz_points, fft_freqs, mel_basis)
+    else:
+        # All n_mels triangles at once: band edges as columns, bins as rows
+        left   = hz_points[:-2, None]
+        center = hz_points[1:-1, None]
+        right  = hz_points[2:, None]
 
         # Rising slope from left to center
-        rising  = np.clip((fft_freqs - left)   / (center - left),  0.0, 1.0)
+        rising  = np.clip((fft_freqs - left)  / (center - left),  0.0, 1.0)
         # Falling slope from center to right
-        falling = np.clip((right - fft_freqs)  / (right - center), 0.0, 1.0)
+        falling = np.clip((right - fft_freqs) / (right - center), 0.0, 1.0)
 
-        mel_basis[i] = rising * falling
+        mel_basis = rising * falling
 
     # Center frequencies exclude the two boundary points
     mel_freqs = hz_points[1:-1]
@@ -115,6 +195,24 @@ def create_mel_filterbank(sr, n_fft, n_mels=128, fmin=0, fmax=None):
     return mel_basis, mel_freqs
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_mel_filterbank(sr, n_fft, n_mels, fmin, fmax, bin_bytes=None):
+    """create_mel_filterbank() memoized on its arguments.
+
+    bin_bytes is fft_freqs as float64 bytes (ndarrays are not hashable).
+    The basis is stored as float32 so the product with the float32 STFT
+    stays float32. The returned arrays are shared between callers and
+    marked read-only.
+    """
+    fft_freqs = None if bin_bytes is None else np.frombuffer(bin_bytes)
+    mel_basis, mel_freqs = create_mel_filterbank(
+        sr, n_fft, n_mels, fmin, fmax, fft_freqs=fft_freqs)
+    mel_basis = mel_basis.astype(np.float32)
+    mel_basis.setflags(write=False)
+    mel_freqs.setflags(write=False)
+    return mel_basis, mel_freqs
+
+
 def apply_mel_scale(S, mel_basis):
     """Apply a mel filterbank matrix to a linear magnitude spectrogram.
 
@@ -128,37 +226,213 @@ def apply_mel_scale(S, mel_basis):
     return np.dot(mel_basis, S)
 
 
+##    <(''<)  <( ' ' )>  (>'')>
+# CPU STFT
+##    <(''<)  <( ' ' )>  (>'')>
+
+if _NUMBA_AVAILABLE:
+    # Serial and nogil: the STFT is called from several threads at once (I/O
+    # pool, grid pool, Tk), which already parallelise across files. Concurrent
+    # parallel=True launches abort the process under numba's workqueue layer.
+    @numba.njit(nogil=True, cache=True, fastmath=True)
+    def _frame_detrend_window(y, nperseg, step, window, out):
+        """Fill out[i] with the mean-detrended, windowed i-th frame of y."""
+        for i in range(out.shape[0]):
+            start = i * step
+            mean  = 0.0
+            for j in range(nperseg):
+                mean += y[start + j]
+            mean /= nperseg
+            for j in range(nperseg):
+                out[i, j] = (y[start + j] - mean) * window[j]
+
+
+@functools.lru_cache(maxsize=16)
+def _stft_window(nperseg):
+    """_STFT_WINDOW of length nperseg as a shared, read-only float32 array."""
+    window = get_window(_STFT_WINDOW, nperseg).astype(np.float32)
+    window.setflags(write=False)
+    return window
+
+
+# Frames per planned rfft block; longer STFTs run the same plan per block
+_RFFT_BLOCK_FRAMES = 512
+
+# Per-thread {(nperseg, dtype_str): plan}
+_fftw_local = threading.local()
+
+
+def _rfft_plan(nperseg, dtype_str):
+    """Return this thread's pyFFTW rfft plan for (_RFFT_BLOCK_FRAMES, nperseg) blocks.
+
+    Plans built on the main thread use every core. Worker threads (I/O and
+    grid pools) run concurrently and already split work across files, so
+    their plans are single-threaded to avoid oversubscribing the CPU.
+    """
+    plans = getattr(_fftw_local, 'plans', None)
+    if plans is None:
+        plans = _fftw_local.plans = {}
+    plan = plans.get((nperseg, dtype_str))
+    if plan is None:
+        on_main = threading.current_thread() is threading.main_thread()
+        arr  = pyfftw.empty_aligned((_RFFT_BLOCK_FRAMES, nperseg), dtype=dtype_str)
+        plan = pyfftw.builders.rfft(arr, axis=1,
+                                    threads=os.cpu_count() if on_main else 1,
+                                    planner_effort='FFTW_MEASURE')
+        plans[(nperseg, dtype_str)] = plan
+    return plan
+
+
+def _rfft_frames(frames):
+    """Real FFT along axis 1 — cached pyFFTW plan if available, else numpy.
+
+    With pyFFTW, whole blocks of _RFFT_BLOCK_FRAMES frames run through the
+    plan; the remainder (all of a short clip) goes to np.fft.rfft rather
+    than being zero-padded to a full block.
+    """
+    n_frames, nperseg = frames.shape
+    if not _PYFFTW_AVAILABLE or n_frames < _RFFT_BLOCK_FRAMES:
+        return np.fft.rfft(frames, axis=1)
+
+    plan   = _rfft_plan(nperseg, frames.dtype.str)
+    out    = np.empty((n_frames, nperseg // 2 + 1), dtype=plan.output_dtype)
+    n_full = n_frames - n_frames % _RFFT_BLOCK_FRAMES
+
+    # Plan output buffer is reused across calls — copy each block out
+    for start in range(0, n_full, _RFFT_BLOCK_FRAMES):
+        out[start:start + _RFFT_BLOCK_FRAMES] = plan(
+            frames[start:start + _RFFT_BLOCK_FRAMES])
+    if n_full < n_frames:
+        out[n_full:] = np.fft.rfft(frames[n_full:], axis=1)
+    return out
+
+
+def export_fftw_wisdom():
+    """Return accumulated FFTW wisdom, or None if pyFFTW is unavailable."""
+    if not _PYFFTW_AVAILABLE:
+        return None
+    return pyfftw.export_wisdom()
+
+
+def import_fftw_wisdom(wisdom):
+    """Load FFTW wisdom previously returned by export_fftw_wisdom()."""
+    if _PYFFTW_AVAILABLE and wisdom:
+        pyfftw.import_wisdom(wisdom)
+
+
+def _cpu_stft_magnitude(y, sr, nperseg, noverlap):
+    """Magnitude STFT via one framed buffer and one batched rfft.
+
+    With numba, frames are written into a preallocated (n_frames, nperseg)
+    buffer by a compiled kernel. Without it, frames are a zero-copy
+    sliding_window_view and detrend + window run as one broadcast pass.
+    Output matches scipy.signal.spectrogram with scaling='density',
+    mode='magnitude'.
+
+    Args:
+        y:        np.ndarray — mono audio signal
+        sr:       int        — sample rate in Hz
+        nperseg:  int        — frame length in samples
+        noverlap: int        — overlap between frames in samples
+
+    Returns:
+        freqs: np.ndarray — frequency bins in Hz
+        times: np.ndarray — frame center times in seconds
+        S:     np.ndarray shape (nperseg//2+1, n_frames) — magnitude spectrogram
+    """
+    step     = nperseg - noverlap
+    y32      = np.ascontiguousarray(y, dtype=np.float32)
+    window   = _stft_window(nperseg)
+    scale    = np.sqrt(1.0 / (sr * (window * window).sum()))
+    n_frames = (len(y32) - nperseg) // step + 1
+
+    if _NUMBA_AVAILABLE:
+        frames = np.empty((n_frames, nperseg), dtype=np.float32)
+        _frame_detrend_window(y32, nperseg, step, window, frames)
+    else:
+        view    = np.lib.stride_tricks.sliding_window_view(y32, nperseg)[::step]
+        frames  = view - view.mean(axis=1, keepdims=True)
+        frames *= window
+
+    S = np.abs(_rfft_frames(frames)).T
+    S *= scale
+
+    freqs = np.fft.rfftfreq(nperseg, 1.0 / sr)
+    times = (np.arange(n_frames) * step + nperseg / 2.0) / sr
+
+    return freqs, times, S
+
+
+##    <(''<)  <( ' ' )>  (>'')>
+# GPU STFT
+##    <(''<)  <( ' ' )>  (>'')>
+
+def gpu_stft_available():
+    """Return True if torch is importable and a CUDA device is present."""
+    return _TORCH_AVAILABLE and torch.cuda.is_available()
+
+
+def _gpu_stft_magnitude(y, sr, nperseg, noverlap):
+    """Magnitude STFT on the GPU, matching scipy.signal.spectrogram output.
+
+    Frames are staged as one strided view on device, mean-detrended and
+    windowed, then transformed with a single batched rfft. Scaling matches
+    scipy's scaling='density', mode='magnitude'.
+
+    Args:
+        y:        np.ndarray — mono audio signal
+        sr:       int        — sample rate in Hz
+        nperseg:  int        — frame length in samples
+        noverlap: int        — overlap between frames in samples
+
+    Returns:
+        freqs: np.ndarray — frequency bins in Hz
+        times: np.ndarray — frame center times in seconds
+        S:     np.ndarray shape (nperseg//2+1, n_frames) — magnitude spectrogram
+    """
+    step   = nperseg - noverlap
+    window = _stft_window(nperseg)
+    scale  = np.sqrt(1.0 / (sr * (window * window).sum()))
+
+    with torch.no_grad():
+        y_t    = torch.from_numpy(np.ascontiguousarray(y, dtype=np.float32)).cuda()
+        win_t  = torch.tensor(window).cuda()  # copies — cached window is read-only
+        frames = y_t.unfold(0, nperseg, step)
+        frames = frames - frames.mean(dim=1, keepdim=True)
+        spec   = torch.fft.rfft(frames * win_t, dim=1).abs().mul_(scale)
+        S      = spec.T.contiguous().cpu().numpy()
+
+    freqs = np.fft.rfftfreq(nperseg, 1.0 / sr)
+    times = (np.arange(S.shape[1]) * step + nperseg / 2.0) / sr
+
+    return freqs, times, S
+
+
 ##    <(''<)  <( ' ' )>  (>'')>
 # UNIFIED SPECTROGRAM COMPUTATION
 ##    <(''<)  <( ' ' )>  (>'')>
 
-def compute_spectrogram_unified(y, sr, nfft, hop, fmin=0, fmax=None,
-                                scale='linear', n_mels=256,
-                                orientation='horizontal'):
-    """Compute a spectrogram with optional mel scaling and orientation.
+def compute_stft_magnitude(y, sr, nfft, hop, use_gpu=False):
+    """Compute the linear magnitude STFT used by every spectrogram scale.
 
     Adapts nperseg and noverlap to signal length to handle short clips
-    without raising scipy errors.
+    without raising scipy errors. The result is scale-independent and can be
+    cached by callers so a linear/mel toggle only reruns scale_spectrogram().
 
     Args:
-        y:           np.ndarray — mono audio signal (float32)
-        sr:          int        — sample rate in Hz
-        nfft:        int        — FFT size
-        hop:         int        — hop length in samples
-        fmin:        float      — minimum frequency for output in Hz
-        fmax:        float/None — maximum frequency for output in Hz; defaults to sr/2
-        scale:       str        — 'linear' or 'mel'
-        n_mels:      int        — number of mel bands (used only when scale='mel')
-        orientation: str        — 'horizontal' (time on x) or 'vertical' (freq on x)
+        y:       np.ndarray — mono audio signal (float32)
+        sr:      int        — sample rate in Hz
+        nfft:    int        — FFT size
+        hop:     int        — hop length in samples
+        use_gpu: bool       — use the torch/CUDA STFT for signals longer than
+                              CONFIG['gpu_stft_min_duration_s']; ignored
+                              when no CUDA device is available
 
     Returns:
-        S_db:   np.ndarray — spectrogram in dB
-        freqs:  np.ndarray — frequency axis array in Hz (or mel if scale='mel')
-        times:  np.ndarray — time axis array in seconds
+        freqs: np.ndarray — linear frequency bins in Hz
+        times: np.ndarray — frame center times in seconds
+        S:     np.ndarray shape (n_bins, n_frames) — magnitude spectrogram
     """
-    if fmax is None:
-        fmax = sr / 2.0
-
     # (つ -' _ '- )つ    (つ -' _ '- )つ
     # Adapt window and overlap to signal length to handle short clips
     # (つ -' _ '- )つ    (つ -' _ '- )つ
@@ -166,54 +440,115 @@ def compute_spectrogram_unified(y, sr, nfft, hop, fmin=0, fmax=None,
     nperseg  = min(nfft, max(16, L))
     noverlap = max(0, min(nperseg - hop, nperseg - 1))
 
-    freqs, times, S = spectrogram(
-        y, fs=sr,
+    if (use_gpu and L >= nperseg and gpu_stft_available()
+            and L > sr * CONFIG["gpu_stft_min_duration_s"]):
+        return _gpu_stft_magnitude(y, sr, nperseg, noverlap)
+    if L >= nperseg:
+        return _cpu_stft_magnitude(y, sr, nperseg, noverlap)
+    return spectrogram(
+        np.asarray(y, dtype=np.float32), fs=sr,
         nperseg=nperseg,
         noverlap=noverlap,
         scaling='density',
         mode='magnitude'
     )
 
+
+def scale_spectrogram(S, freqs, sr, nfft, fmin=0, fmax=None,
+                      scale='linear', n_mels=256, orientation='horizontal'):
+    """Project a linear magnitude STFT to the requested scale and convert to dB.
+
+    Args:
+        S:           np.ndarray — magnitude spectrogram from compute_stft_magnitude()
+        freqs:       np.ndarray — linear frequency bins in Hz
+        sr:          int        — sample rate in Hz
+        nfft:        int        — FFT size
+        fmin:        float      — minimum frequency for output in Hz
+        fmax:        float/None — maximum frequency for output in Hz; defaults to sr/2
+        scale:       str        — 'linear' or 'mel'
+        n_mels:      int        — number of mel bands (used only when scale='mel')
+        orientation: str        — 'horizontal' (time on x) or 'vertical' (freq on x)
+
+    Returns:
+        S_db:  np.ndarray — float32 spectrogram in dB
+        freqs: np.ndarray — frequency axis array in Hz (or mel band centers if scale='mel')
+    """
+    if fmax is None:
+        fmax = sr / 2.0
+
     if scale == 'mel':
         # (つ -' _ '- )つ    (つ -' _ '- )つ
-        # Mel path: apply filterbank over full frequency range
-        # then return mel-scaled output without masking
+        # Mel path: every triangle is zero outside [fmin, fmax], so only
+        # the STFT rows in that range enter the product. The filterbank
+        # is built directly over those bins (which may differ from
+        # nfft//2+1 for short clips) and cached.
         # (つ -' _ '- )つ    (つ -' _ '- )つ
-        mel_basis, mel_freqs = create_mel_filterbank(sr, nfft, n_mels, fmin, fmax)
-
-        # Expand mel_basis to match actual freq bins from scipy (may differ from nfft//2+1)
-        n_fft_bins = len(freqs)
-        mel_basis_adapted = np.zeros((n_mels, n_fft_bins))
+        lo = np.searchsorted(freqs, fmin, side='left')
+        hi = np.searchsorted(freqs, fmax, side='right')
+        band_freqs = np.ascontiguousarray(freqs[lo:hi], dtype=np.float64)
 
-        # Map filterbank columns onto actual scipy frequency bins
-        for i in range(n_mels):
-            # Recompute filter over actual freqs array
-            left   = mel_to_hz(hz_to_mel(fmin) + i       * (hz_to_mel(fmax) - hz_to_mel(fmin)) / (n_mels + 1))
-            center = mel_to_hz(hz_to_mel(fmin) + (i + 1) * (hz_to_mel(fmax) - hz_to_mel(fmin)) / (n_mels + 1))
-            right  = mel_to_hz(hz_to_mel(fmin) + (i + 2) * (hz_to_mel(fmax) - hz_to_mel(fmin)) / (n_mels + 1))
+        mel_basis, mel_freqs = _cached_mel_filterbank(
+            sr, nfft, n_mels, fmin, fmax, band_freqs.tobytes())
 
-            rising  = np.clip((freqs - left)   / (center - left  + 1e-10), 0.0, 1.0)
-            falling = np.clip((right - freqs)  / (right  - center + 1e-10), 0.0, 1.0)
-            mel_basis_adapted[i] = rising * falling
-
-        S_final      = np.dot(mel_basis_adapted, S)
+        S_final      = mel_basis @ S[lo:hi]
         freqs_final  = mel_freqs
 
     else:
         # (つ -' _ '- )つ    (つ -' _ '- )つ
-        # Linear path: mask to fmin/fmax range
+        # Linear path: keep bins in [fmin, fmax]. freqs is ascending, so
+        # the range is one contiguous row slice — a view of S, with no
+        # boolean mask or copy. The full-range default slices every row.
         # (つ -' _ '- )つ    (つ -' _ '- )つ
-        freq_mask   = (freqs >= fmin) & (freqs <= fmax)
-        S_final     = S[freq_mask, :]
-        freqs_final = freqs[freq_mask]
+        lo = np.searchsorted(freqs, fmin, side='left')
+        hi = np.searchsorted(freqs, fmax, side='right')
+        S_final     = S[lo:hi]
+        freqs_final = freqs[lo:hi]
+
+    # Convert magnitude to dB with floor to suppress -inf. float32 halves
+    # the bytes every ridge/peak pass streams; dB needs far fewer digits.
+    # One float32 output buffer: the floor add casts into it, log10 and the
+    # scale run in place. S_final may alias the caller's cached STFT, so it
+    # is never written.
+    S_db = np.add(S_final, np.float32(1e-12), dtype=np.float32)
+    np.log10(S_db, out=S_db)
+    S_db *= 20
+
+    # Vertical orientation (freq on x-axis, time on y-axis) — a plain
+    # transpose view; equal to fliplr(rot90(S_db, k=-1))
+    if orientation == 'vertical':
+        S_db = S_db.T
 
-    # Convert magnitude to dB with floor to suppress -inf
-    S_db = 20 * np.log10(S_final + 1e-12)
+    return S_db, freqs_final
 
-    # Rotate for vertical orientation (freq on x-axis, time on y-axis)
-    if orientation == 'vertical':
-        S_db = np.fliplr(np.rot90(S_db, k=-1))
 
+def compute_spectrogram_unified(y, sr, nfft, hop, fmin=0, fmax=None,
+                                scale='linear', n_mels=256,
+                                orientation='horizontal', use_gpu=False):
+    """Compute a spectrogram with optional mel scaling and orientation.
+
+    Thin composition of compute_stft_magnitude() and scale_spectrogram().
+
+    Args:
+        y:           np.ndarray — mono audio signal (float32)
+        sr:          int        — sample rate in Hz
+        nfft:        int        — FFT size
+        hop:         int        — hop length in samples
+        fmin:        float      — minimum frequency for output in Hz
+        fmax:        float/None — maximum frequency for output in Hz; defaults to sr/2
+        scale:       str        — 'linear' or 'mel'
+        n_mels:      int        — number of mel bands (used only when scale='mel')
+        orientation: str        — 'horizontal' (time on x) or 'vertical' (freq on x)
+        use_gpu:     bool       — see compute_stft_magnitude()
+
+    Returns:
+        S_db:   np.ndarray — spectrogram in dB
+        freqs:  np.ndarray — frequency axis array in Hz (or mel if scale='mel')
+        times:  np.ndarray — time axis array in seconds
+    """
+    freqs, times, S = compute_stft_magnitude(y, sr, nfft, hop, use_gpu=use_gpu)
+    S_db, freqs_final = scale_spectrogram(
+        S, freqs, sr, nfft, fmin=fmin, fmax=fmax,
+        scale=scale, n_mels=n_mels, orientation=orientation)
     return S_db, freqs_final, times
 
 
@@ -226,6 +561,7 @@ def compute_psd(y, sr, nfft_psd=None, noverlap_psd=None, hop_psd=None):
 
     Adapts nperseg to signal length to handle short clips safely.
     hop_psd takes precedence over noverlap_psd if both are provided.
+    welch() returns a fresh array, so it is normalized in place.
 
     Args:
         y:            np.ndarray — mono audio signal
@@ -260,9 +596,9 @@ def compute_psd(y, sr, nfft_psd=None, noverlap_psd=None, hop_psd=None):
     )
 
     # Normalize to [0, 1]
-    psd_norm = psd / (psd.max() + 1e-12)
+    psd /= psd.max() + 1e-12
 
-    return freqs, psd_norm
+    return freqs, psd
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
@@ -283,13 +619,6 @@ def frames_to_time(frames, sr, hop_length):
     return frames * hop_length / sr
 
 
-# (つ -' _ '- )つ    (つ -' _ '- )つ
-# TODO: Refactor mel filterbank to use a single consistent implementation
-# across create_mel_filterbank() and the inline adaptation in
-# compute_spectrogram_unified() mel path. Currently duplicated.
-# (つ -' _ '- )つ    (つ -' _ '- )つ
-
-
 # U S A G I
 # from yaaat.core.audio_utils import compute_spectrogram_unified, compute_psd, hz_to_mel
 # S_db, freqs, times = compute_spectrogram_unified(y, sr, nfft=256, hop=64)
@@ -19,6 +19,7 @@ Subclass hooks (override in tab subclasses):
 import json
 import logging
 import traceback
+from collections import deque
 
 import numpy as np
 import matplotlib
@@ -49,6 +50,55 @@ from yaaat.config import CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Maximum zoom-undo depth held in layer.zoom_stack
+ZOOM_STACK_MAX = 64
+
+
+##    <(''<)  <( ' ' )>  (>'')>
+# MOUSEWHEEL ROUTING
+# One application-wide wheel binding, installed once on first registration.
+# Events are routed to the nearest registered scroll canvas above the widget
+# under the pointer — no per-hover bind_all/unbind_all on <Enter>/<Leave>.
+# <Button-4>/<Button-5> cover X11, where wheel events are not <MouseWheel>.
+##    <(''<)  <( ' ' )>  (>'')>
+
+_SCROLL_CANVASES = set()
+_wheel_bound     = False
+
+
+def register_scroll_canvas(canvas):
+    """Make a tk.Canvas scroll vertically when the wheel moves over it or its children.
+
+    Args:
+        canvas: tk.Canvas — scroll container with a yscrollcommand
+    """
+    global _wheel_bound
+    _SCROLL_CANVASES.add(canvas)
+    if not _wheel_bound:
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind_all(sequence, _on_mousewheel, add='+')
+        _wheel_bound = True
+
+
+def _on_mousewheel(event):
+    """Scroll the registered canvas containing the pointer, if any."""
+    try:
+        widget = event.widget.winfo_containing(event.x_root, event.y_root)
+    except (AttributeError, KeyError, tk.TclError):
+        return
+
+    while widget is not None:
+        if widget in _SCROLL_CANVASES:
+            if event.num == 4:
+                units = -1
+            elif event.num == 5:
+                units = 1
+            else:
+                units = int(-1 * (event.delta / 120))
+            widget.yview_scroll(units, "units")
+            return
+        widget = widget.master
+
 
 # (つ -' _ '- )つ    (つ -' _ '- )つ
 
@@ -65,10 +115,20 @@ class BaseLayer:
     # Persisted to disk via annotation_io.save_global_point_annotations()
     global_point_annotations = {}
 
+    # Set on any mutation of global_point_annotations; save is skipped while False
+    global_annotations_dirty = False
+
+    # Bumped on every mutation or reload of global_point_annotations — unlike
+    # the dirty flag it is never reset, so cached point artists can key on it
+    global_annotations_version = 0
+
     def __init__(self, root):
         """Initialize BaseLayer state and build the UI."""
         self.root = root
 
+        # Bucket key for class-scoped point annotations — resolved once per instance
+        self._class_name = type(self).__name__
+
         # Set window title only if root is a top-level Tk window
         if isinstance(root, tk.Tk):
             self.root.title("Base Annotator - YAAAT")
@@ -79,6 +139,8 @@ class BaseLayer:
 
         # Ordered file list populated by file_nav.load_directory()
         self.audio_files = []
+        # Parallel str(path) list — set together with audio_files by file_nav
+        self._audio_paths_str = []
         self.current_file_idx = 0
 
         # Raw audio signal (mono float32) and sample rate
@@ -90,6 +152,16 @@ class BaseLayer:
         self.freqs = None
         self.times = None
 
+        # (y, n_fft, hop, freqs, times, S_mag) — linear magnitude STFT reused by toggle_scale()
+        self._stft_cache = None
+
+        # Bumped per full load; background results from older loads are discarded
+        self._load_generation = 0
+        # Future for the in-flight background load, None once applied
+        self._pending_load = None
+        # Replay loop once the pending background load has been applied
+        self._resume_playback = False
+
         # Root directory of the loaded audio dataset
         self.base_audio_dir = None
 
@@ -107,10 +179,23 @@ class BaseLayer:
         # 'linear' or 'mel' — controls compute_spectrogram_unified() scale param
         self.y_scale    = tk.StringVar(value=CONFIG["y_scale"])
 
+        # Optional torch/CUDA STFT backend for long files — inert without a GPU
+        self.use_gpu    = tk.BooleanVar(value=False)
+
         # Display frequency limits (may differ from computation limits)
         self.fmin_display = tk.IntVar(value=CONFIG["fmin_display"])
         self.fmax_display = tk.IntVar(value=CONFIG["fmax_display"])
 
+        # (つ -' _ '- )つ    (つ -' _ '- )つ
+        # SHADOW ATTRS
+        # Plain python mirrors of the tk vars read on every redraw.
+        # Kept in sync by trace_add('write') — hot paths read self._n_fft etc.
+        # instead of round-tripping through the Tcl interpreter per .get().
+        # (つ -' _ '- )つ    (つ -' _ '- )つ
+        for var_name in ('n_fft', 'hop_length', 'fmin_calc', 'fmax_calc',
+                         'y_scale', 'fmin_display', 'fmax_display'):
+            self._shadow_tk_var(var_name)
+
 
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # PLAYBACK STATE
@@ -125,7 +210,8 @@ class BaseLayer:
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
         # Stack of (xlim, ylim) tuples for zoom undo; right-click undo only unwinds scroll-zooms, not drag-zooms, after bbox update
-        self.zoom_stack = []
+        # Bounded — the oldest views drop off once ZOOM_STACK_MAX entries are held
+        self.zoom_stack = deque(maxlen=ZOOM_STACK_MAX)
 
         # Drag origin for bounding box
         self.drag_start = None
@@ -133,6 +219,22 @@ class BaseLayer:
         # Active matplotlib Rectangle patch for bounding box preview
         self.drag_rect = None
 
+        # Axes background captured at drag start — blit target for drag_rect
+        self._drag_bg = None
+
+        # Pending zoom_info_label text and its after() id — coalesces
+        # per-motion label updates into one Tk reflow per ~33 ms
+        self._zoom_info_text = ""
+        self._zoom_info_id   = None
+
+        # after() id for the debounced scroll-zoom redraw
+        self._scroll_draw_id = None
+
+        # Ctrl/Shift held state from canvas key events; event.key is used
+        # for scroll modifiers until the first key event is seen
+        self._mod_state       = {'ctrl': False, 'shift': False}
+        self._mod_events_seen = False
+
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # ANNOTATION AND PERSISTENCE STATE
         # (つ -' _ '- )つ    (つ -' _ '- )つ
@@ -157,6 +259,29 @@ class BaseLayer:
         # Twin y-axis for waveform overlay — None when not active
         self.waveform_ax = None
 
+        # Animated overlay artists redrawn by update_overlays() via blitting,
+        # and the clean axes background they are blitted over. The background
+        # is captured on every canvas draw together with the axis limits it
+        # was rendered at; a limit mismatch forces a full draw instead.
+        self._overlay_artists = []
+        self._spec_bg = None
+        self._spec_bg_lims = None
+
+        # Shared point scatter/label artists with the (version, file, class)
+        # key they were built for — see draw_shared_point_annotations()
+        self._shared_point_key = None
+        self._shared_point_artists = []
+
+        # Title Text artist last written by _update_title() and its string —
+        # the title is only re-set when either changes
+        self._title_artist = None
+        self._last_title   = ""
+
+        # update_display() calls made while the canvas was unmapped (hidden
+        # tab); _display_dirty_full records whether any asked for a full redraw
+        self._display_dirty      = False
+        self._display_dirty_full = False
+
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # NAVIGATION REPEAT TIMER
         # (つ -' _ '- )つ    (つ -' _ '- )つ
@@ -164,6 +289,10 @@ class BaseLayer:
         # after() id for continuous prev/next navigation while button held
         self.repeat_id = None
 
+        # Latest queued hold-to-repeat target; loaded by file_nav._pump_nav()
+        self._nav_target_idx = None
+        self._nav_in_progress = False
+
         # Tab-sync flag — suppresses auto-save during programmatic file switches
         self._syncing_tabs = False
 
@@ -175,6 +304,28 @@ class BaseLayer:
         # Delay auto-load slightly to allow UI to fully render before disk access
         self.root.after(222, self._auto_load_on_startup)
 
+    def _shadow_tk_var(self, var_name):
+        """Mirror tk var self.<var_name> into plain attr self._<var_name>.
+
+        The shadow is updated by a write trace, so reads in redraw paths
+        cost an attribute lookup instead of a Tcl eval. Invalid intermediate
+        values (e.g. an empty Entry bound to an IntVar) keep the last good value.
+
+        Args:
+            var_name: str — name of the tk.Variable attribute on self
+        """
+        var = getattr(self, var_name)
+        shadow = '_' + var_name
+        setattr(self, shadow, var.get())
+
+        def _sync(*_):
+            try:
+                setattr(self, shadow, var.get())
+            except (tk.TclError, ValueError):
+                pass
+
+        var.trace_add('write', _sync)
+
     ##    <(''<)  <( ' ' )>  (>'')>
     # UI COMPOSITION
     ##    <(''<)  <( ' ' )>  (>'')>
@@ -205,10 +356,8 @@ class BaseLayer:
             lambda e: ctrl_canvas.configure(scrollregion=ctrl_canvas.bbox("all"))
         )
 
-        # Bind mousewheel only while cursor is inside the control panel
-        ctrl_canvas.bind("<Enter>", lambda e: ctrl_canvas.bind_all(
-            "<MouseWheel>", lambda ev: ctrl_canvas.yview_scroll(int(-1 * (ev.delta / 120)), "units")))
-        ctrl_canvas.bind("<Leave>", lambda e: ctrl_canvas.unbind_all("<MouseWheel>"))
+        # Mousewheel scrolls the control panel while the pointer is over it
+        register_scroll_canvas(ctrl_canvas)
 
         # Expose scrollable frame for subclass control injection via setup_custom_controls()
         self.control_panel = scrollable_frame
@@ -326,6 +475,10 @@ class BaseLayer:
         self.scale_button = tk.Button(scale_frame, text="Linear", width=8,
                                       command=self.toggle_scale, bg='lightgreen')
         self.scale_button.pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(scale_frame, text="GPU STFT", variable=self.use_gpu,
+                        command=self.recompute_spectrogram,
+                        state=(tk.NORMAL if audio_utils.gpu_stft_available()
+                               else tk.DISABLED)).pack(side=tk.LEFT, padx=6)
 
         # Waveform overlay controls
         waveform_frame = ttk.LabelFrame(scrollable_frame, text="Waveform", padding=3)
@@ -401,12 +554,21 @@ class BaseLayer:
                   text="[Click+Drag: select bbox | Ctrl+Wheel: zoom horizontal | Right-click: undo zoom]",
                   font=('', 8, 'italic')).pack(side=tk.RIGHT, padx=10)
 
-        # Matplotlib figure and canvas
-        self.fig = Figure(figsize=(10, 6))
-        self.fig.subplots_adjust(left=0.08, right=0.98, top=0.95, bottom=0.08)
-        self.ax = self.fig.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # (つ -' _ '- )つ    (つ -' _ '- )つ
+        # Plot area — the matplotlib figure is built lazily by _setup_plot()
+        # on the first file load. Until then a plain Tk label holds the space,
+        # keeping Figure/FigureCanvasTkAgg construction off the startup path.
+        # (つ -' _ '- )つ    (つ -' _ '- )つ
+        self.fig    = None
+        self.ax     = None
+        self.canvas = None
+
+        self.plot_area = ttk.Frame(self.plot_frame)
+        self.plot_area.pack(fill=tk.BOTH, expand=True)
+        self.plot_placeholder = ttk.Label(
+            self.plot_area, text="Load audio files to begin",
+            font=('', 10, 'italic'), anchor=tk.CENTER)
+        self.plot_placeholder.pack(fill=tk.BOTH, expand=True)
 
         # Bottom navigation bar with hold-to-repeat buttons
         nav_bottom_frame = ttk.Frame(self.plot_frame)
@@ -429,20 +591,48 @@ class BaseLayer:
         self.zoom_info_label = ttk.Label(self.plot_frame, text="", font=('', 8), foreground='blue')
         self.zoom_info_label.pack(pady=(2, 0))
 
+        self.update_button_highlights()
+
+    def _setup_plot(self):
+        """Build the matplotlib figure and canvas in place of the placeholder label.
+
+        Called once from _ensure_plot() on the first file load.
+        """
+        self.plot_placeholder.destroy()
+
+        # Matplotlib figure and canvas
+        self.fig = Figure(figsize=(10, 6))
+        self.fig.subplots_adjust(left=0.08, right=0.98, top=0.95, bottom=0.08)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_area)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Replay any redraw skipped while this tab was hidden
+        self.canvas.get_tk_widget().bind(
+            '<Map>', lambda e: self.root.after_idle(self._flush_deferred_display), add='+')
+
         # Canvas event bindings — delegate to interaction module
         self.canvas.mpl_connect('button_press_event',   self.on_press)
         self.canvas.mpl_connect('button_release_event', self.on_release)
         self.canvas.mpl_connect('motion_notify_event',  self.on_motion)
         self.canvas.mpl_connect('scroll_event',         self.on_scroll)
 
-        # Initial empty plot state
+        # Modifier tracking for scroll zoom/pan
+        self.canvas.mpl_connect('key_press_event',    self.on_key_press)
+        self.canvas.mpl_connect('key_release_event',  self.on_key_release)
+        self.canvas.mpl_connect('figure_leave_event', self.on_figure_leave)
+
+        # Blit background capture for update_overlays()
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+
         self.ax.set_xlabel('Time (s)', fontsize=8)
         self.ax.set_ylabel('Frequency (Hz)', fontsize=8)
-        self.ax.set_title('Load audio files to begin')
         self.ax.grid(True, alpha=0.3)
-        self.canvas.draw_idle()
 
-        self.update_button_highlights()
+    def _ensure_plot(self):
+        """Build the figure on first use. No-op once the canvas exists."""
+        if self.canvas is None:
+            self._setup_plot()
 
     ##    <(''<)  <( ' ' )>  (>'')>
     # SUBCLASS HOOKS
@@ -495,19 +685,48 @@ class BaseLayer:
     ##    <(''<)  <( ' ' )>  (>'')>
 
     def compute_spectrogram(self):
-        """Compute spectrogram from current audio using current parameter tk vars."""
-        self.S_db, self.freqs, self.times = audio_utils.compute_spectrogram_unified(
+        """Compute spectrogram from current audio using current parameter tk vars.
+
+        The linear magnitude STFT is cached in self._stft_cache so a scale
+        toggle can re-project it without recomputing the FFT. A cache that
+        already matches (e.g. filled by the background loader) is reused.
+        """
+        if self._stft_cache_valid():
+            self.times = self._stft_cache[4]
+            self._apply_scale()
+            return
+
+        freqs_lin, self.times, S_mag = audio_utils.compute_stft_magnitude(
             self.y,
             self.sr,
-            nfft=self.n_fft.get(),
-            hop=self.hop_length.get(),
-            fmin=self.fmin_calc.get(),
-            fmax=self.fmax_calc.get(),
-            scale=self.y_scale.get(),
+            nfft=self._n_fft,
+            hop=self._hop_length,
+            use_gpu=self.use_gpu.get()
+        )
+        # Keyed by the signal object and STFT params — any mismatch forces a recompute
+        self._stft_cache = (self.y, self._n_fft, self._hop_length,
+                            freqs_lin, self.times, S_mag)
+        self._apply_scale()
+
+    def _apply_scale(self):
+        """Derive S_db and freqs from the cached linear STFT for the current scale."""
+        _, _, _, freqs_lin, _, S_mag = self._stft_cache
+        self.S_db, self.freqs = audio_utils.scale_spectrogram(
+            S_mag, freqs_lin, self.sr,
+            nfft=self._n_fft,
+            fmin=self._fmin_calc,
+            fmax=self._fmax_calc,
+            scale=self._y_scale,
             n_mels=256,
             orientation='horizontal'
         )
 
+    def _stft_cache_valid(self):
+        """True if the cached linear STFT matches the current signal and params."""
+        cache = self._stft_cache
+        return (cache is not None and cache[0] is self.y
+                and cache[1] == self._n_fft and cache[2] == self._hop_length)
+
     def recompute_spectrogram(self):
         """Recompute spectrogram and redraw, preserving current zoom limits."""
         if self.y is None:
@@ -518,7 +737,6 @@ class BaseLayer:
         ylim = self.ax.get_ylim()
 
         self.compute_spectrogram()
-        self.spec_image = None
         self.process_audio()
         self.update_display(recompute_spec=True)
 
@@ -554,14 +772,19 @@ class BaseLayer:
             self.scale_button.config(text='Linear', bg='lightgreen')
 
         if self.y is not None:
-            self.compute_spectrogram()
-            self.spec_image = None
+            # Linear <-> mel differs only by a filterbank projection of the
+            # same STFT — skip the FFT when the cached magnitude is reusable.
+            # Detection still reruns: it reads S_db/freqs on the new scale.
+            if self._stft_cache_valid():
+                self._apply_scale()
+            else:
+                self.compute_spectrogram()
             self.process_audio()
             self.update_display(recompute_spec=True)
 
     def _convert_ylim_to_scale(self, fmin_hz, fmax_hz):
         """Convert Hz frequency limits to the current display scale (linear or mel)."""
-        if self.y_scale.get() == 'mel':
+        if self._y_scale == 'mel':
             return audio_utils.hz_to_mel(fmin_hz), audio_utils.hz_to_mel(fmax_hz)
         return fmin_hz, fmax_hz
 
@@ -572,8 +795,53 @@ class BaseLayer:
 
     def update_display(self, recompute_spec=False):
         """Redraw the spectrogram panel. Delegates to visualization.update_display()."""
+        if self._defer_if_hidden(recompute_spec):
+            return
         visualization.update_display(self, recompute_spec=recompute_spec)
 
+    def _defer_if_hidden(self, recompute_spec):
+        """Record a pending redraw instead of rasterizing an unmapped canvas.
+
+        Hidden notebook tabs still receive update_display() calls (file loads,
+        parameter changes); Agg would render them regardless of visibility.
+        The pending redraw is replayed by _flush_deferred_display() once the
+        canvas is mapped again.
+
+        Returns:
+            bool — True if the redraw was deferred
+        """
+        if self.canvas is None or self.canvas.get_tk_widget().winfo_ismapped():
+            return False
+        self._display_dirty = True
+        self._display_dirty_full = self._display_dirty_full or recompute_spec
+        return True
+
+    def _flush_deferred_display(self, event=None):
+        """Run the redraw deferred while the canvas was hidden, if any."""
+        if not self._display_dirty:
+            return
+        full = self._display_dirty_full
+        self._display_dirty = False
+        self._display_dirty_full = False
+        self.update_display(recompute_spec=full)
+
+    def register_overlay(self, artist):
+        """Mark artist as animated and redraw it through update_overlays().
+
+        Use from draw_custom_overlays() for overlays that move frequently
+        (cursors, dragged lines) so they can be updated without a full draw.
+        Returns the artist for call chaining.
+        """
+        return visualization.register_overlay(self, artist)
+
+    def update_overlays(self):
+        """Blit registered overlay artists over the cached spectrogram background."""
+        visualization.update_overlays(self)
+
+    def _on_canvas_draw(self, event):
+        """Capture the clean background after each full draw. Delegates to visualization."""
+        visualization.capture_overlay_background(self)
+
     def update_display_range(self):
         """Apply current fmin/fmax display limits to the y-axis without recomputing."""
         visualization.update_display_range(self)
@@ -594,13 +862,13 @@ class BaseLayer:
     def update_button_highlights(self):
         """Highlight the currently active n_fft and hop_length buttons."""
         for btn, val in self.nfft_buttons:
-            if val == self.n_fft.get():
+            if val == self._n_fft:
                 btn.config(bg='lightgreen', relief=tk.SUNKEN)
             else:
                 btn.config(bg='SystemButtonFace', relief=tk.RAISED)
 
         for btn, val in self.hop_buttons:
-            if val == self.hop_length.get():
+            if val == self._hop_length:
                 btn.config(bg='lightblue', relief=tk.SUNKEN)
             else:
                 btn.config(bg='SystemButtonFace', relief=tk.RAISED)
@@ -626,6 +894,18 @@ class BaseLayer:
         """Route scroll event to interaction module for zoom/pan handling."""
         interaction.on_scroll(self, event)
 
+    def on_key_press(self, event):
+        """Route key press to interaction module for modifier tracking."""
+        interaction.on_key_press(self, event)
+
+    def on_key_release(self, event):
+        """Route key release to interaction module for modifier tracking."""
+        interaction.on_key_release(self, event)
+
+    def on_figure_leave(self, event):
+        """Reset modifier state when the pointer leaves the canvas."""
+        interaction.on_figure_leave(self, event)
+
     ##    <(''<)  <( ' ' )>  (>'')>
     # PLAYBACK
     ##    <(''<)  <( ' ' )>  (>'')>
@@ -722,34 +1002,44 @@ class BaseLayer:
     ##    <(''<)  <( ' ' )>  (>'')>
 
     def save_global_point_annotations(self):
-        """Persist the class-level global_point_annotations dict to disk."""
-        annotation_io.save_global_point_annotations(
-            BaseLayer.global_point_annotations, self.annotation_dir)
+        """Persist the class-level global_point_annotations dict to disk.
+
+        Skipped entirely when nothing has been added since the last save.
+        """
+        if not BaseLayer.global_annotations_dirty:
+            return
+        if annotation_io.save_global_point_annotations(
+                BaseLayer.global_point_annotations, self.annotation_dir):
+            BaseLayer.global_annotations_dirty = False
 
     def load_global_point_annotations(self):
         """Load global_point_annotations from disk into the class-level dict."""
         BaseLayer.global_point_annotations = annotation_io.load_global_point_annotations(
             self.annotation_dir)
+        BaseLayer.global_annotations_dirty = False
+        BaseLayer.global_annotations_version += 1
 
     def _get_point_bucket(self, scope="class"):
         """Return the annotation list for the current file and scope."""
         return annotation_io.get_point_bucket(
             BaseLayer.global_point_annotations,
-            self.audio_files,
+            self._audio_paths_str,
             self.current_file_idx,
             scope,
-            self.__class__.__name__
+            self._class_name
         )
 
     def add_annotation_point(self, time_s, freq_hz, label=None, scope="class"):
         """Append a point annotation to the appropriate bucket and trigger redraw."""
         annotation_io.add_annotation_point(
             BaseLayer.global_point_annotations,
-            self.audio_files,
+            self._audio_paths_str,
             self.current_file_idx,
             time_s, freq_hz, label, scope,
-            self.__class__.__name__
+            self._class_name
         )
+        BaseLayer.global_annotations_dirty = True
+        BaseLayer.global_annotations_version += 1
         self.changes_made = True
         self.update_display()
 
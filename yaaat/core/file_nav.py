@@ -6,18 +6,22 @@ All functions receive the layer instance explicitly — no inheritance required.
 
 Functions operate on:
     layer.audio_files          : natsorted list of Path objects
+    layer._audio_paths_str     : str(path) for each entry of audio_files
     layer.current_file_idx     : int index into audio_files
     layer.annotation_dir       : Path to annotation output directory
     layer.base_audio_dir       : Path to root of loaded audio dataset
     layer.changes_made         : dirty flag
     layer.repeat_id            : after() timer id for continuous nav
     layer._syncing_tabs        : suppresses auto-save during tab sync
+    layer._load_generation     : stale background loads are discarded
 """
 
+import concurrent.futures
 import logging
 import traceback
+from collections import OrderedDict
 from pathlib import Path
-import json
+import pickle
 
 import numpy as np
 import pysoniq
@@ -50,6 +54,16 @@ _TEST_AUDIO_SUBPATH = ('test_files', 'test_audio', 'syllables', 'kiwi')
 # DIRECTORY LOADING
 ##    <(''<)  <( ' ' )>  (>'')>
 
+def _set_audio_files(layer, files):
+    """Assign layer.audio_files and its parallel list of path strings.
+
+    layer._audio_paths_str[i] == str(layer.audio_files[i]) — the key used by
+    annotation stores — so per-draw lookups skip the Path-to-str conversion.
+    """
+    layer.audio_files      = files
+    layer._audio_paths_str = [str(p) for p in files]
+
+
 def load_directory(layer):
     """Open a directory dialog, load .wav files, and prompt for annotation save location.
 
@@ -61,7 +75,7 @@ def load_directory(layer):
     if not directory:
         return
 
-    layer.audio_files = natsorted(Path(directory).rglob('*.wav'))
+    _set_audio_files(layer, natsorted(Path(directory).rglob('*.wav')))
     layer.base_audio_dir = Path(directory)
 
     if not layer.audio_files:
@@ -129,7 +143,7 @@ def load_test_audio(layer):
         logger.warning("Test audio directory not found: %s", test_audio_dir)
         return
 
-    layer.audio_files = natsorted(test_audio_dir.rglob('*.wav'))
+    _set_audio_files(layer, natsorted(test_audio_dir.rglob('*.wav')))
     layer.base_audio_dir = test_audio_dir
 
     if not layer.audio_files:
@@ -165,7 +179,7 @@ def auto_load_directory(layer):
     if last_dir and last_dir.exists():
         logger.info("Auto-loading: %s", last_dir)
 
-        layer.audio_files = natsorted(last_dir.rglob('*.wav'))
+        _set_audio_files(layer, natsorted(last_dir.rglob('*.wav')))
         layer.base_audio_dir = last_dir
 
         # D E B U G  — wav discovery count under the resolved directory
@@ -218,18 +232,21 @@ def auto_load_directory(layer):
 # FILE LOADING
 ##    <(''<)  <( ' ' )>  (>'')>
 
-# D E B U G  — stage timers; elapsed per stage exposes decode vs STFT cost
-_t_load_start = time.perf_counter() if _VERBOSE_AUTOLOAD else None
-
 def load_current_file(layer):
     """Load audio and annotations for layer.current_file_idx.
 
+    Decode and STFT run on the background I/O pool; _poll_load() applies
+    the result on the Tk thread. The following file is prefetched.
+
     If layer._skip_reload is True, only recomputes the spectrogram without
     resetting annotations or re-running detection — used for tab switching.
     """
     if not layer.audio_files:
         return
 
+    # Figure is built lazily — first file load creates the canvas
+    layer._ensure_plot()
+
     audio_file = layer.audio_files[layer.current_file_idx]
     logger.info("Loading %s", audio_file.name)
 
@@ -252,42 +269,161 @@ def load_current_file(layer):
 
     # (つ -' _ '- )つ    (つ -' _ '- )つ
     # FULL LOAD PATH
+    # Any in-flight load for this layer is superseded by bumping the
+    # generation — its result is dropped when it arrives.
     # (つ -' _ '- )つ    (つ -' _ '- )つ
+    layer._load_generation += 1
+    gen = layer._load_generation
 
-    # Load mono float32 audio via pysoniq
-    # D E B U G  — about to call loader symbol; if execution stops after the
-    #              prior print and before the next, the loader call is the break
-    if _VERBOSE_AUTOLOAD:
-        logger.info("[loadfile] calling pysoniq.load_audio")
+    fut = _submit_load(layer, audio_file)
+    layer._pending_load = fut
 
-    layer.y, layer.sr = pysoniq.load_audio(str(audio_file))
+    # Prefetch the next file while this one is displayed
+    if len(layer.audio_files) > 1:
+        next_idx = (layer.current_file_idx + 1) % len(layer.audio_files)
+        _submit_load(layer, layer.audio_files[next_idx])
 
-    # D E B U G  — loader returned; shape and rate confirm a successful read
-    #            — decode elapsed; marks end of disk-read + decode stage
+    _poll_load(layer, gen, fut)
 
-    if _VERBOSE_AUTOLOAD:
-        _t_decoded = time.perf_counter()
-        logger.info("[loadfile] decode elapsed -> %.4f s",
-                    _t_decoded - _t_load_start)
-        logger.info("[loadfile] loaded y.shape=%s sr=%s",
-                    getattr(layer.y, 'shape', None), layer.sr)
 
-    if layer.y.ndim > 1:
+##    <(''<)  <( ' ' )>  (>'')>
+# BACKGROUND LOADING
+# Decode + STFT run on a small shared thread pool (both release the GIL).
+# Futures are kept in a short LRU so a prefetched file is picked up by the
+# next load instead of being decoded twice. Once a load is applied, finished
+# futures other than the prefetched next file are dropped — each holds a
+# decoded signal and a full STFT, which is hundreds of MB for long files. Results are handed back to the
+# Tk thread by polling with after() — Tk calls never happen off-thread.
+##    <(''<)  <( ' ' )>  (>'')>
+
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="yaaat-io")
+
+# (path, n_fft, hop, with_stft, use_gpu) -> Future; touched on the Tk thread only
+_load_futures = OrderedDict()
+_LOAD_CACHE_SIZE = 4
+
+# Poll interval while waiting on a background load
+_LOAD_POLL_MS = 10
+
+
+def _load_audio_worker(path, n_fft, hop, with_stft, use_gpu):
+    """Decode audio to mono and optionally compute its linear STFT magnitude.
+
+    Runs on the I/O pool — must not touch Tk or layer state.
+
+    Args:
+        path:      str — audio file path
+        n_fft:     int — FFT size
+        hop:       int — hop length in samples
+        with_stft: bool — False for tabs that compute their own spectrogram
+        use_gpu:   bool — forwarded to compute_stft_magnitude()
+
+    Returns:
+        tuple — (y, sr, stft) where stft is (n_fft, hop, freqs, times, S_mag)
+                or None; n_fft/hop are the params the STFT was computed with
+    """
+    t0 = time.perf_counter()
+    y, sr = pysoniq.load_audio(path)
+    if y.ndim > 1:
         # Collapse stereo to mono — all audio must be mono throughout the pipeline
-        layer.y = np.mean(layer.y, axis=1)
+        y = np.mean(y, axis=1)
 
-    # D E B U G  — spectrogram stage start
+    # D E B U G  — decode vs STFT elapsed; ranks the bottleneck per file
     if _VERBOSE_AUTOLOAD:
-        _t_spec_start = time.perf_counter()
+        logger.info("[loadfile] decode elapsed -> %.4f s (y.shape=%s sr=%s)",
+                    time.perf_counter() - t0, getattr(y, 'shape', None), sr)
+
+    stft = None
+    if with_stft:
+        t1 = time.perf_counter()
+        stft = (n_fft, hop) + tuple(audio_utils.compute_stft_magnitude(
+            y, sr, nfft=n_fft, hop=hop, use_gpu=use_gpu))
+        if _VERBOSE_AUTOLOAD:
+            logger.info("[loadfile] spectrogram elapsed -> %.4f s",
+                        time.perf_counter() - t1)
 
-    layer.compute_spectrogram()
+    return y, sr, stft
 
-    # D E B U G  — STFT elapsed; compare against decode to rank the bottleneck
-    if _VERBOSE_AUTOLOAD:
-        logger.info("[loadfile] spectrogram elapsed -> %.4f s",
-                    time.perf_counter() - _t_spec_start)
 
-    layer.spec_image = None
+def _submit_load(layer, audio_file):
+    """Return a Future for audio_file under the layer's current STFT params.
+
+    Reuses a pending or finished Future from the LRU when one matches;
+    failed Futures are resubmitted.
+    """
+    from yaaat.core.base_layer import BaseLayer
+
+    # Tabs that override compute_spectrogram() only need the decoded signal
+    with_stft = type(layer).compute_spectrogram is BaseLayer.compute_spectrogram
+    use_gpu   = with_stft and layer.use_gpu.get()
+    key = (str(audio_file), layer._n_fft, layer._hop_length, with_stft, use_gpu)
+
+    fut = _load_futures.pop(key, None)
+    if fut is None or (fut.done() and fut.exception() is not None):
+        fut = _IO_POOL.submit(_load_audio_worker, *key)
+    _load_futures[key] = fut
+
+    while len(_load_futures) > _LOAD_CACHE_SIZE:
+        _load_futures.popitem(last=False)
+    return fut
+
+
+def _poll_load(layer, gen, fut):
+    """Apply fut on the Tk thread once done; drop it if a newer load started."""
+    if gen != layer._load_generation:
+        return
+    if not fut.done():
+        layer.root.after(_LOAD_POLL_MS, _poll_load, layer, gen, fut)
+        return
+
+    layer._pending_load = None
+    try:
+        result = fut.result()
+    except Exception as e:
+        logger.error("Failed to load %s: %s",
+                     layer.audio_files[layer.current_file_idx].name, e)
+        logger.debug(traceback.format_exc())
+        layer._resume_playback = False
+        _nav_load_done(layer)
+        return
+
+    _apply_loaded(layer, result)
+
+
+def _release_finished_loads(layer):
+    """Drop finished futures except the one for the file after current_file_idx.
+
+    The layer now holds the applied signal and STFT itself; other finished
+    results would only pin memory. In-flight futures are left alone.
+    """
+    keep = None
+    if len(layer.audio_files) > 1:
+        next_idx = (layer.current_file_idx + 1) % len(layer.audio_files)
+        keep     = str(layer.audio_files[next_idx])
+
+    for key in [k for k, f in _load_futures.items() if f.done() and k[0] != keep]:
+        del _load_futures[key]
+
+
+def _apply_loaded(layer, result):
+    """Install a background load result on the layer and redraw.
+
+    Args:
+        layer:  BaseLayer instance
+        result: tuple — (y, sr, stft) from _load_audio_worker()
+    """
+    layer.y, layer.sr, stft = result
+    _release_finished_loads(layer)
+
+    if stft is not None:
+        # Keyed by the params the job was submitted with — if n_fft or hop
+        # changed while it was pending, the cache is stale and recomputed below
+        n_fft, hop, freqs_lin, times, S_mag = stft
+        layer._stft_cache = (layer.y, n_fft, hop, freqs_lin, times, S_mag)
+
+    # Reuses the cache filled above when params still match
+    layer.compute_spectrogram()
 
     # Tab-specific annotation load (override in subclass)
     layer.load_custom_data()
@@ -296,79 +432,108 @@ def load_current_file(layer):
     layer.process_audio()
 
     layer.changes_made = False
-    layer.zoom_stack = []
+    layer.zoom_stack.clear()
     layer.update_display(recompute_spec=True)
     update_progress(layer)
 
-    # D E B U G  — total full-load elapsed; sum of all stages for this file
-    if _VERBOSE_AUTOLOAD:
-        logger.info("[loadfile] total full-load elapsed -> %.4f s",
-                    time.perf_counter() - _t_load_start)
+    if layer._resume_playback:
+        layer._resume_playback = False
+        layer.play_audio()
+
+    _nav_load_done(layer)
+
 
 ##    <(''<)  <( ' ' )>  (>'')>
 # NAVIGATION
 ##    <(''<)  <( ' ' )>  (>'')>
 
-def next_file(layer):
-    """Advance to the next file in the list, wrapping around.
+def _autosave_before_nav(layer):
+    """Save tab data and global points before leaving the current file.
+
+    Skipped while tab sync is active. Custom data is only written when
+    changes_made is set; global points check their own dirty flag.
+    """
+    if getattr(layer, '_syncing_tabs', False):
+        return
+    if layer.changes_made:
+        layer.save_custom_data()
+    layer.save_global_point_annotations()
+
+
+def _step_file(layer, step):
+    """Move current_file_idx by step (wrapping) and load the new file.
 
     Auto-saves if changes exist and tab sync is not active.
     Resumes playback if loop was active before navigation.
+    No-op when the step lands back on the current file (e.g. a single-file list).
+    While a background load is pending the step is queued for _pump_nav()
+    instead — see _queue_nav_target().
     """
-    if not layer.audio_files:
+    if not layer.audio_files or step % len(layer.audio_files) == 0:
         return
 
-    was_playing = pysoniq.is_looping()
+    if layer._pending_load is not None:
+        base = layer._nav_target_idx
+        if base is None:
+            base = layer.current_file_idx
+        _queue_nav_target(layer, base + step)
+        return
 
-    if layer.changes_made and not getattr(layer, '_syncing_tabs', False):
-        layer.save_custom_data()
-        annotation_io.save_global_point_annotations(
-            type(layer).global_point_annotations, layer.annotation_dir)
+    _autosave_before_nav(layer)
 
+    # Replayed by _apply_loaded() once the new file is in place
+    layer._resume_playback = pysoniq.is_looping()
     pysoniq.stop()
 
-    layer.current_file_idx = (layer.current_file_idx + 1) % len(layer.audio_files)
+    layer.current_file_idx = (layer.current_file_idx + step) % len(layer.audio_files)
     layer.load_current_file()
 
-    if was_playing:
+    # Synchronous loaders (e.g. grid tabs) have already finished here
+    if layer._resume_playback and layer._pending_load is None:
+        layer._resume_playback = False
         layer.play_audio()
 
 
-def previous_file(layer):
-    """Go back to the previous file in the list, wrapping around.
+def _queue_nav_target(layer, idx):
+    """Defer navigation to idx until the pending background load is applied.
 
-    Auto-saves if changes exist and tab sync is not active.
-    Resumes playback if loop was active before navigation.
+    Between _step_file() and _apply_loaded(), current_file_idx already names
+    the new file while y, S_db and the annotations still belong to the old
+    one. Saving in that window would write the old annotations into the new
+    file's JSON, so the step is only recorded here; _nav_load_done() runs
+    _pump_nav() once the load lands. Repeated steps coalesce into one target.
     """
-    if not layer.audio_files:
-        return
+    layer._nav_target_idx = idx % len(layer.audio_files)
 
-    was_playing = pysoniq.is_looping()
 
-    if layer.changes_made and not getattr(layer, '_syncing_tabs', False):
-        layer.save_custom_data()
-        annotation_io.save_global_point_annotations(
-            type(layer).global_point_annotations, layer.annotation_dir)
-
-    pysoniq.stop()
+def next_file(layer):
+    """Advance to the next file in the list, wrapping around."""
+    _step_file(layer, 1)
 
-    layer.current_file_idx = (layer.current_file_idx - 1) % len(layer.audio_files)
-    layer.load_current_file()
 
-    if was_playing:
-        layer.play_audio()
+def previous_file(layer):
+    """Go back to the previous file in the list, wrapping around."""
+    _step_file(layer, -1)
 
 
 def jump_to_file(layer):
     """Jump to the file number currently entered in layer.file_number_entry.
 
     Shows a warning dialog for invalid input. Auto-saves if changes exist.
+    Entering the file already shown only re-normalizes the entry text.
+    While a background load is pending the jump is queued like a step.
     """
     from tkinter import messagebox
     try:
         file_num = int(layer.file_number_entry.get())
 
-        if 1 <= file_num <= len(layer.audio_files):
+        if layer._pending_load is not None and 1 <= file_num <= len(layer.audio_files):
+            _queue_nav_target(layer, file_num - 1)
+
+        elif file_num - 1 == layer.current_file_idx:
+            update_progress(layer)
+
+        elif 1 <= file_num <= len(layer.audio_files):
             if layer.changes_made and not getattr(layer, '_syncing_tabs', False):
                 layer.save_custom_data()
 
@@ -405,17 +570,66 @@ def start_continuous_nav(layer, direction):
 
 
 def continue_nav(layer, direction):
-    """Continue hold-to-repeat navigation at 150ms intervals."""
-    if direction == 'next':
-        next_file(layer)
-    else:
-        previous_file(layer)
+    """Queue one more hold-to-repeat step and re-arm the 150ms timer.
+
+    The timer only advances layer._nav_target_idx; the actual load is done
+    by _pump_nav() from after_idle, so ticks that arrive while a file is
+    still loading collapse into a single load of the latest target.
+    """
+    if layer.audio_files:
+        step = 1 if direction == 'next' else -1
+        base = layer._nav_target_idx
+        if base is None:
+            base = layer.current_file_idx
+        layer._nav_target_idx = (base + step) % len(layer.audio_files)
+        layer.root.after_idle(_pump_nav, layer)
 
     layer.repeat_id = layer.root.after(150, continue_nav, layer, direction)
 
 
+def _pump_nav(layer):
+    """Load the most recent queued navigation target, if any.
+
+    Calls made while a load is still in flight return immediately;
+    a target queued during the load is picked up once it is applied.
+    """
+    if (layer._nav_in_progress or layer._nav_target_idx is None
+            or layer._pending_load is not None):
+        return
+
+    target = layer._nav_target_idx
+    layer._nav_target_idx = None
+    if target == layer.current_file_idx:
+        return
+
+    layer._nav_in_progress = True
+    try:
+        _step_file(layer, target - layer.current_file_idx)
+    except Exception:
+        layer._nav_in_progress = False
+        raise
+
+    # Background loads clear the flag from _apply_loaded()
+    if layer._pending_load is None:
+        _nav_load_done(layer)
+
+
+def _nav_load_done(layer):
+    """Release the navigation pump and run it again if a target is queued.
+
+    Also called for loads not started by the pump, so steps queued by
+    _step_file() during any pending load are picked up.
+    """
+    layer._nav_in_progress = False
+    if layer._nav_target_idx is not None:
+        layer.root.after_idle(_pump_nav, layer)
+
+
 def stop_continuous_nav(layer):
-    """Cancel the hold-to-repeat navigation timer on button release."""
+    """Cancel the hold-to-repeat navigation timer on button release.
+
+    Any target already queued is still loaded by the pending pump.
+    """
     if layer.repeat_id:
         layer.root.after_cancel(layer.repeat_id)
         layer.repeat_id = None
@@ -463,16 +677,20 @@ def _default_annotation_dir(dataset_name):
 ##    <(''<)  <( ' ' )>  (>'')>
 
 def save_last_directory(directory):
-    """Save last opened directory to ~/.yaaat_config.json."""
+    """Save last opened directory to ~/.yaaat_config.json.
+
+    Skips the write when the stored directory is already the same, which is
+    the common case of reopening the dataset loaded at startup.
+    """
     config_file = Path.home() / '.yaaat_config.json'
     try:
         config = {}
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = annotation_io.read_json(config_file)
+        if config.get('last_directory') == str(directory):
+            return
         config['last_directory'] = str(directory)
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        annotation_io.write_json(config_file, config)
     except Exception as e:
         logger.error("Could not save last directory: %s", e)
 
@@ -486,8 +704,7 @@ def load_last_directory():
     config_file = Path.home() / '.yaaat_config.json'
     try:
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config   = annotation_io.read_json(config_file)
             last_dir = config.get('last_directory', '')
             if last_dir:
                 last_dir = Path(last_dir)
@@ -523,13 +740,11 @@ def save_last_manifest(manifest_path):
     try:
         config = {}
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = annotation_io.read_json(config_file)
 
         config['last_manifest'] = str(manifest_path)
 
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        annotation_io.write_json(config_file, config)
 
     except Exception as e:
         logger.error("Could not save manifest path to config: %s", e)
@@ -548,8 +763,7 @@ def load_last_manifest():
     config_file = Path.home() / '.yaaat_config.json'
     try:
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = annotation_io.read_json(config_file)
 
             last_manifest = config.get('last_manifest', '')
             if last_manifest:
@@ -563,6 +777,38 @@ def load_last_manifest():
     return None
 
 
+##    <(''<)  <( ' ' )>  (>'')>
+# FFTW WISDOM PERSISTENCE
+# pyFFTW plan wisdom is cached across sessions in ~/.yaaat/fftw_wisdom
+# so repeated STFT shapes skip FFTW_MEASURE planning on next startup.
+# No-ops when pyFFTW is not installed.
+##    <(''<)  <( ' ' )>  (>'')>
+
+_FFTW_WISDOM_PATH = Path.home() / '.yaaat' / 'fftw_wisdom'
+
+
+def load_fftw_wisdom():
+    """Import saved FFTW wisdom from ~/.yaaat/fftw_wisdom if present."""
+    try:
+        if _FFTW_WISDOM_PATH.exists():
+            with open(_FFTW_WISDOM_PATH, 'rb') as f:
+                audio_utils.import_fftw_wisdom(pickle.load(f))
+    except Exception as e:
+        logger.error("Could not load FFTW wisdom: %s", e)
+
+
+def save_fftw_wisdom():
+    """Export accumulated FFTW wisdom to ~/.yaaat/fftw_wisdom."""
+    wisdom = audio_utils.export_fftw_wisdom()
+    if wisdom is None:
+        return
+    try:
+        _FFTW_WISDOM_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_FFTW_WISDOM_PATH, 'wb') as f:
+            pickle.dump(wisdom, f)
+    except Exception as e:
+        logger.error("Could not save FFTW wisdom: %s", e)
+
 
 # U S A G I
 
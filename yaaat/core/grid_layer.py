@@ -37,7 +37,7 @@ from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import ttk
 
-from yaaat.core.base_layer import BaseLayer
+from yaaat.core.base_layer import BaseLayer, register_scroll_canvas
 from yaaat.core import audio_utils
 
 logger = logging.getLogger(__name__)
@@ -253,19 +253,16 @@ class GridLayer(BaseLayer):
         Then destroys all children of self.plot_frame and calls setup_grid_view()
         to inject the grid canvas in their place.
 
-        BaseLayer's matplotlib figure (self.fig, self.ax, self.canvas) is still
-        created by super().setup_ui() but is never packed into the display —
-        it is replaced by self.grid_fig and self.grid_canvas from setup_grid_view().
-        self.ax and self.canvas remain available for compatibility with any
-        BaseLayer methods that reference them, but are not visible.
+        BaseLayer builds its matplotlib figure lazily on the first single-file
+        load, which the grid view never performs — self.fig, self.ax and
+        self.canvas stay None. The display is self.grid_fig and
+        self.grid_canvas from setup_grid_view().
         """
         super().setup_ui()
 
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # Remove all widgets BaseLayer packed into self.plot_frame.
-        # This includes the nav bar, matplotlib canvas, bottom nav, and zoom label.
-        # self.fig, self.ax, self.canvas remain as attributes for compatibility
-        # but are detached from the display.
+        # This includes the nav bar, plot placeholder, bottom nav, and zoom label.
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         for widget in self.plot_frame.winfo_children():
             widget.destroy()
@@ -302,12 +299,8 @@ class GridLayer(BaseLayer):
         grid_canvas_tk.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         grid_canvas_tk.configure(yscrollcommand=grid_scrollbar.set)
 
-        # Bind mousewheel to the grid scroll container
-        grid_canvas_tk.bind("<Enter>", lambda e: grid_canvas_tk.bind_all(
-            "<MouseWheel>",
-            lambda ev: grid_canvas_tk.yview_scroll(
-                int(-1 * (ev.delta / 120)), "units")))
-        grid_canvas_tk.bind("<Leave>", lambda e: grid_canvas_tk.unbind_all("<MouseWheel>"))
+        # Mousewheel scrolls the grid container while the pointer is over it
+        register_scroll_canvas(grid_canvas_tk)
 
         # Grid matplotlib figure embedded in the scrollable container
         self.grid_fig = Figure(figsize=(12, 10))
@@ -408,7 +401,7 @@ class GridLayer(BaseLayer):
                 ax = self.grid_fig.add_subplot(rows, cols, cell_pos + 1)
                 self.grid_axes.append(ax)
 
-                filepath_key = str(self.audio_files[file_idx])
+                filepath_key = self._audio_paths_str[file_idx]
                 if filepath_key in self.grid_spectrograms:
                     spec = self.grid_spectrograms[filepath_key]
 
@@ -9,8 +9,8 @@ Responsibilities:
     - Mouse motion: bounding box preview, subclass hook
     - Mouse release: bounding box commit or click passthrough, subclass hook
     - Scroll: horizontal zoom, vertical zoom, horizontal pan, vertical pan
-      Modifier key detection is Windows-native via ctypes; falls back to
-      matplotlib event.key for other platforms.
+      Modifier state is read from the scroll event itself (Tk state bits or
+      event.modifiers), so it does not depend on canvas keyboard focus.
 
 # bounding box drawn as a dashed yellow Rectangle patch during drag.
 # Zoom stack stores (xlim, ylim) tuples for sequential undo via right-click.
@@ -20,7 +20,8 @@ via layer.on_bounding_box_selected(t_min, t_max, f_min, f_max). interaction.py
 performs no file I/O — the tab owns persistence. Zoom is no longer bound to
 drag; it lives exclusively in scroll + modifiers (see on_scroll).
 
-Selection box drawn as a solid cyan Rectangle patch during drag.
+Selection box drawn as a solid cyan animated Rectangle patch during drag,
+blitted over a cached axes background.
 Zoom stack stores (xlim, ylim) tuples for sequential undo via right-click,
 fed by scroll-zoom only.
 
@@ -29,15 +30,16 @@ All functions operate on:
     layer.canvas          : FigureCanvasTkAgg
     layer.drag_start      : (x, y) tuple or None
     layer.drag_rect       : matplotlib Rectangle patch or None
-    layer.zoom_stack      : list of (xlim, ylim) tuples
+    layer._drag_bg        : cached axes background for blitting the drag preview
+    layer.zoom_stack      : bounded deque of (xlim, ylim) tuples
     layer.zoom_info_label : ttk.Label displaying bbox dimensions
+    layer._mod_state      : {'ctrl': bool, 'shift': bool} from key events (fallback)
 """
 
-import sys
 import logging
-import traceback
+import math
+import time
 
-import numpy as np
 import matplotlib.pyplot as plt
 
 logger = logging.getLogger(__name__)
@@ -58,6 +60,57 @@ _ZOOM_OUT_FACTOR = 1.25
 # Pan step as a fraction of the current axis range
 _PAN_STEP = 0.1
 
+# Scroll redraw debounce — one draw per ~60 Hz frame regardless of wheel rate
+_SCROLL_DRAW_DELAY_MS = 16
+
+# Drag readout label refresh — ~30 Hz is enough for a text readout
+_ZOOM_INFO_INTERVAL_MS = 33
+
+# Minimum seconds between repeated error logs from the same event handler
+_HANDLER_ERROR_INTERVAL_S = 1.0
+
+
+##    <(''<)  <( ' ' )>  (>'')>
+# HANDLER ERROR LOGGING
+# Per-event handlers can fail on every event once state goes stale (e.g. axes
+# cleared during a tab sync). Errors are logged at most once per interval per
+# handler, and the traceback rides on exc_info at debug level so it is only
+# formatted when debug logging is enabled.
+##    <(''<)  <( ' ' )>  (>'')>
+
+_last_handler_error = {}
+
+
+def log_handler_error(log, name, exc):
+    """Log an exception raised inside an event handler, rate-limited by name.
+
+    Must be called from inside the except block so exc_info is available.
+
+    Args:
+        log:  logging.Logger of the calling module
+        name: str — handler name, used as the rate-limit key
+        exc:  Exception — the caught exception
+    """
+    now = time.monotonic()
+    if now - _last_handler_error.get(name, float('-inf')) < _HANDLER_ERROR_INTERVAL_S:
+        return
+    _last_handler_error[name] = now
+    log.error("ERROR in %s: %s", name, exc)
+    log.debug("%s traceback", name, exc_info=True)
+
+
+##    <(''<)  <( ' ' )>  (>'')>
+# PENDING LOAD GUARD
+# While a background file load is pending, current_file_idx already names the
+# next file but the canvas still shows the previous one. Edits made then would
+# be attached to the wrong file, so press/motion are dropped and a release
+# only clears the base drag preview.
+##    <(''<)  <( ' ' )>  (>'')>
+
+def _load_pending(layer):
+    """True while file_nav has a background load in flight for layer."""
+    return getattr(layer, '_pending_load', None) is not None
+
 
 ##    <(''<)  <( ' ' )>  (>'')>
 # MOUSE PRESS
@@ -67,7 +120,7 @@ def on_press(layer, event):
     """Handle mouse button press on the spectrogram canvas.
 
     Dispatch order:
-        1. Ignore clicks outside the spectrogram axes.
+        1. Ignore clicks while a file load is pending or outside the spectrogram axes.
         2. Right-click: pop zoom stack and restore previous view.
         3. Subclass hook: layer.on_custom_press(event) — consumed if returns True.
         4. Left-click: record drag_start for bounding box.
@@ -76,6 +129,8 @@ def on_press(layer, event):
         layer: BaseLayer instance
         event: matplotlib MouseEvent
     """
+    if _load_pending(layer):
+        return
     if event.inaxes != layer.ax or event.xdata is None or event.ydata is None:
         return
 
@@ -92,9 +147,12 @@ def on_press(layer, event):
     if layer.on_custom_press(event):
         return
 
-    # Left-click — begin drag for bounding box
+    # Left-click — begin drag for bounding box; cache the clean axes
+    # background now so every motion can blit over it
     if event.button == 1:
         layer.drag_start = (event.xdata, event.ydata)
+        layer._drag_bg   = layer.canvas.copy_from_bbox(layer.ax.bbox)
+        _arm_drag_rect(layer, event.xdata, event.ydata)
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
@@ -105,7 +163,7 @@ def on_motion(layer, event):
     """Handle mouse motion during drag to draw the bounding box preview.
 
     Dispatch order:
-        1. Ignore motion outside axes.
+        1. Ignore motion while a file load is pending or outside axes.
         2. Subclass hook: layer.on_custom_motion(event) — consumed if returns True.
         3. Draw or update the bounding box line.
         4. Update zoom_info_label with current bbox dimensions.
@@ -114,6 +172,8 @@ def on_motion(layer, event):
         layer: BaseLayer instance
         event: matplotlib MouseEvent
     """
+    if _load_pending(layer):
+        return
     if event.inaxes != layer.ax or event.xdata is None or event.ydata is None:
         return
 
@@ -124,36 +184,30 @@ def on_motion(layer, event):
     if layer.drag_start is None:
         return
 
-    # Remove previous rectangle patch before drawing updated one
-    if layer.drag_rect is not None:
-        layer.drag_rect.remove()
-        layer.drag_rect = None
-
     x0, y0 = layer.drag_start
     width  = event.xdata - x0
     height = event.ydata - y0
 
-    # layer.drag_rect = layer.ax.add_patch(
-    #     plt.Rectangle(
-    #         (x0, y0), width, height,
-    #         fill=False, edgecolor='yellow', linewidth=2, linestyle='--'
-    #     )
-    # )
-    # Adding bounding box region support
+    # (つ -' _ '- )つ    (つ -' _ '- )つ
+    # Blitted preview — the rectangle is animated, so it is excluded from
+    # normal draws. The clean axes background is cached on press (or here,
+    # if a tab hook set drag_start); each motion restores it and redraws
+    # only the rectangle.
     # Solid cyan box = region selection (was dashed yellow = zoom)
-    layer.drag_rect = layer.ax.add_patch(
-        plt.Rectangle(
-            (x0, y0), width, height,
-            fill=False, edgecolor='cyan', linewidth=2, linestyle='-'
-        )
-    )
+    # (つ -' _ '- )つ    (つ -' _ '- )つ
+    if layer._drag_bg is None:
+        layer._drag_bg = layer.canvas.copy_from_bbox(layer.ax.bbox)
+        _arm_drag_rect(layer, x0, y0)
 
-    # Update dimension readout below the plot
-    layer.zoom_info_label.config(
-        text=f"Time: {abs(width):.3f}s | Freq: {abs(height):.1f} Hz"
-    )
+    layer.drag_rect.set_bounds(x0, y0, width, height)
 
-    layer.canvas.draw_idle()
+    # Dimension readout below the plot — coalesced to one Tk update per idle
+    _schedule_zoom_info(
+        layer, f"Time: {abs(width):.3f}s | Freq: {abs(height):.1f} Hz")
+
+    layer.canvas.restore_region(layer._drag_bg)
+    layer.ax.draw_artist(layer.drag_rect)
+    layer.canvas.blit(layer.ax.bbox)
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
@@ -164,92 +218,70 @@ def on_release(layer, event):
     """Handle mouse button release — commit bounding box or pass through as click.
 
     Dispatch order:
+        0. While a file load is pending: clear drag state and return.
         1. Subclass hook: layer.on_custom_release(event) — consumed if returns True.
            Cleans up drag state before returning.
         2. Guard: ignore if drag_start is None.
         3. Guard: if release is outside axes, clean up and return.
         4. If drag distance < _CLICK_THRESHOLD: treat as click, clear drag state.
         5. If bbox too small (< _MIN_BBOX thresholds): ignore.
-        # deprecated 6. Otherwise: push current limits onto zoom_stack, apply new limits.
+        6. Otherwise: hand the bbox to layer.on_bounding_box_selected().
+
+    Drag cleanup (_clear_drag) cannot raise — the preview patch is only
+    hidden — so only the two tab hook calls are guarded.
 
     Args:
         layer: BaseLayer instance
         event: matplotlib MouseEvent
     """
-    try:
-        # Subclass hook — consumes event if tab handles it
-        if layer.on_custom_release(event):
-            _clear_drag(layer)
-            return
-
-        if layer.drag_start is None:
-            return
-
-        # Release outside axes — clean up without zooming
-        if event.inaxes != layer.ax or event.xdata is None or event.ydata is None:
-            layer.zoom_info_label.config(text="")
-            _clear_drag(layer)
-            layer.canvas.draw_idle()
-            return
-
-        x0, y0 = layer.drag_start
-        x1, y1 = event.xdata, event.ydata
-
+    if _load_pending(layer):
         _clear_drag(layer)
+        return
 
-        drag_dist = np.sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2)
-
-        # Small drag — treat as click, no zoom
-        if drag_dist < _CLICK_THRESHOLD:
-            layer.zoom_info_label.config(text="")
-            return
-
-        # new_xlim = sorted([x0, x1])
-        # new_ylim = sorted([y0, y1])
-
-        # x_range = new_xlim[1] - new_xlim[0]
-        # y_range = new_ylim[1] - new_ylim[0]
+    # Subclass hook — consumes event if tab handles it
+    try:
+        consumed = layer.on_custom_release(event)
+    except Exception as e:
+        _clear_drag(layer)
+        log_handler_error(logger, "on_release", e)
+        return
+    if consumed:
+        _clear_drag(layer)
+        return
 
-        # # Reject micro-zooms
-        # if x_range < _MIN_BBOX_TIME_S or y_range < _MIN_BBOX_FREQ_HZ:
-        #     layer.zoom_info_label.config(text="")
-        #     return
+    if layer.drag_start is None:
+        return
 
-        # # Push current view onto stack before applying new limits
-        # layer.zoom_stack.append((layer.ax.get_xlim(), layer.ax.get_ylim()))
+    x0, y0 = layer.drag_start
+    _clear_drag(layer)
 
-        # layer.ax.set_xlim(new_xlim)
-        # layer.ax.set_ylim(new_ylim)
-        # layer.canvas.draw_idle()
+    # Release outside axes — clean up without selecting
+    if event.inaxes != layer.ax or event.xdata is None or event.ydata is None:
+        layer.zoom_info_label.config(text="")
+        return
 
-        # layer.zoom_info_label.config(text="")
+    x1, y1 = event.xdata, event.ydata
+    layer.zoom_info_label.config(text="")
 
-        # Modified boundaries for bounding box time-frequency regions
-        t_min, t_max = sorted([x0, x1])
-        f_min, f_max = sorted([y0, y1])
+    # Small drag — treat as click, no selection
+    if math.hypot(x1 - x0, y1 - y0) < _CLICK_THRESHOLD:
+        return
 
-        t_range = t_max - t_min
-        f_range = f_max - f_min
+    # Bounding box time-frequency region, corners ordered
+    t_min, t_max = (x0, x1) if x0 < x1 else (x1, x0)
+    f_min, f_max = (y0, y1) if y0 < y1 else (y1, y0)
 
-        # Reject micro-boxes — same thresholds that guarded micro-zooms
-        if t_range < _MIN_BBOX_TIME_S or f_range < _MIN_BBOX_FREQ_HZ:
-            layer.zoom_info_label.config(text="")
-            return
+    # Reject micro-boxes — same thresholds that guarded micro-zooms
+    if t_max - t_min < _MIN_BBOX_TIME_S or f_max - f_min < _MIN_BBOX_FREQ_HZ:
+        return
 
-        # Commit bbox to the tab via hook.
-        # interaction.py does no file I/O — tab owns persistence.
-        # Coordinates pre-sorted: t_min < t_max, f_min < f_max.
+    # Commit bbox to the tab via hook.
+    # interaction.py does no file I/O — tab owns persistence.
+    # Coordinates pre-sorted: t_min < t_max, f_min < f_max.
+    try:
         layer.on_bounding_box_selected(t_min, t_max, f_min, f_max)
-
-        layer.zoom_info_label.config(text="")
-
-
-
-
     except Exception as e:
-        logger.error("ERROR in on_release: %s", e)
-        logger.debug(traceback.format_exc())
-        _clear_drag(layer)
+        log_handler_error(logger, "on_bounding_box_selected", e)
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
@@ -259,7 +291,7 @@ def on_release(layer, event):
 def on_scroll(layer, event):
     """Handle mouse wheel zoom and pan with modifier key detection.
 
-    Modifier combinations (Windows via ctypes; other platforms via event.key):
+    Modifier combinations (read from the event, see _get_modifier_keys):
         No modifier       : vertical pan
         Ctrl              : horizontal zoom centered on cursor
         Shift             : horizontal pan
@@ -279,7 +311,7 @@ def on_scroll(layer, event):
         if event.inaxes != layer.ax or event.xdata is None or event.ydata is None:
             return
 
-        is_ctrl, is_shift = _get_modifier_keys(event)
+        is_ctrl, is_shift = _get_modifier_keys(layer, event)
         is_ctrlshift = is_ctrl and is_shift
 
         xlim = layer.ax.get_xlim()
@@ -327,58 +359,172 @@ def on_scroll(layer, event):
             else:
                 layer.ax.set_ylim(ylim[0] - pan, ylim[1] - pan)
 
-        layer.canvas.draw_idle()
+        # Debounced redraw — a new wheel tick cancels the pending draw
+        if layer._scroll_draw_id is not None:
+            layer.root.after_cancel(layer._scroll_draw_id)
+        layer._scroll_draw_id = layer.root.after(
+            _SCROLL_DRAW_DELAY_MS, _do_scroll_draw, layer)
 
     except Exception as e:
-        logger.error("ERROR in on_scroll: %s", e)
-        logger.debug(traceback.format_exc())
+        log_handler_error(logger, "on_scroll", e)
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
 # INTERNAL HELPERS
 ##    <(''<)  <( ' ' )>  (>'')>
 
+def _arm_drag_rect(layer, x, y):
+    """Show the drag preview patch collapsed at (x, y), creating it if needed.
+
+    One animated Rectangle is kept on the axes and reused across drags;
+    a new one is only added when ax.clear() has dropped the old patch.
+
+    Args:
+        layer: BaseLayer instance
+        x, y:  float — drag origin in data coordinates
+    """
+    rect = layer.drag_rect
+    if rect is None or rect not in layer.ax.patches:
+        layer.drag_rect = layer.ax.add_patch(
+            plt.Rectangle(
+                (x, y), 0, 0,
+                fill=False, edgecolor='cyan', linewidth=2, linestyle='-',
+                animated=True
+            )
+        )
+    else:
+        rect.set_bounds(x, y, 0, 0)
+        rect.set_visible(True)
+
+
 def _clear_drag(layer):
-    """Remove the bounding box patch and reset drag state.
+    """Hide the bounding box patch and reset drag state.
 
-    Safe to call even if drag_rect is None or already removed.
+    Safe to call even if drag_rect is None or already hidden. The patch
+    stays on the axes for reuse; the blitted preview is erased by
+    restoring the cached background, or by a redraw if none is cached.
 
     Args:
         layer: BaseLayer instance
     """
+    drag_bg = layer._drag_bg
     layer.drag_start = None
+    layer._drag_bg   = None
+    layer._zoom_info_text = ""
+
+    if layer.drag_rect is not None and layer.drag_rect.get_visible():
+        layer.drag_rect.set_visible(False)
+        if drag_bg is not None:
+            layer.canvas.restore_region(drag_bg)
+            layer.canvas.blit(layer.ax.bbox)
+        else:
+            layer.canvas.draw_idle()
+
+
+def _do_scroll_draw(layer):
+    """Run the debounced scroll redraw. Called from root.after."""
+    layer._scroll_draw_id = None
+    layer.canvas.draw_idle()
+
+
+def _schedule_zoom_info(layer, text):
+    """Set zoom_info_label text at most every _ZOOM_INFO_INTERVAL_MS.
+
+    Motion samples that format to the same text are dropped outright;
+    the rest are coalesced into one Tk label update per interval.
+
+    Args:
+        layer: BaseLayer instance
+        text:  str — label text; the latest value wins
+    """
+    if text == layer._zoom_info_text:
+        return
+    layer._zoom_info_text = text
+    if layer._zoom_info_id is None:
+        layer._zoom_info_id = layer.root.after(
+            _ZOOM_INFO_INTERVAL_MS, _flush_zoom_info, layer)
+
+
+def _flush_zoom_info(layer):
+    """Apply the pending zoom_info_label text. Called from after()."""
+    layer._zoom_info_id = None
+    if layer.drag_start is not None:
+        layer.zoom_info_label.config(text=layer._zoom_info_text)
+
+
+##    <(''<)  <( ' ' )>  (>'')>
+# MODIFIER KEYS
+# Ctrl/Shift are read from the wheel event itself: the Tk event state bits
+# when a Tk event is attached, else matplotlib's event.modifiers. Canvas key
+# events only arrive while the canvas has keyboard focus, which TkAgg only
+# takes on a button press — so after clicking a control-panel widget they
+# stop. The state tracked from them is a fallback for synthesized events.
+# It is reset on figure leave so a key released elsewhere cannot stick.
+##    <(''<)  <( ' ' )>  (>'')>
+
+# Shift and Control bits of the Tk event.state modifier mask
+_TK_SHIFT_MASK   = 0x0001
+_TK_CONTROL_MASK = 0x0004
+
+def _key_tokens(key):
+    """Split a matplotlib key string ('ctrl+shift', 'control') into modifier names."""
+    tokens = set()
+    for part in (key or '').split('+'):
+        if part in ('control', 'ctrl'):
+            tokens.add('ctrl')
+        elif part == 'shift':
+            tokens.add('shift')
+    return tokens
+
+
+def on_key_press(layer, event):
+    """Mark every modifier named in event.key as held."""
+    layer._mod_events_seen = True
+    for name in _key_tokens(event.key):
+        layer._mod_state[name] = True
+
 
-    if layer.drag_rect is not None:
-        try:
-            layer.drag_rect.remove()
-        except Exception:
-            pass
-        layer.drag_rect = None
+def on_key_release(layer, event):
+    """Clear the released modifier — the last token of event.key."""
+    layer._mod_events_seen = True
+    last = (event.key or '').rsplit('+', 1)[-1]
+    for name in _key_tokens(last):
+        layer._mod_state[name] = False
 
 
-def _get_modifier_keys(event):
+def on_figure_leave(layer, event):
+    """Drop modifier state when the pointer leaves the canvas."""
+    layer._mod_state['ctrl']  = False
+    layer._mod_state['shift'] = False
+
+
+def _get_modifier_keys(layer, event):
     """Detect Ctrl and Shift modifier key state.
 
-    On Windows: uses ctypes.windll.user32.GetKeyState for reliable
-    modifier detection independent of matplotlib's key tracking.
-    On other platforms: falls back to event.key string matching.
+    Order: Tk event.state bits from event.guiEvent, then event.modifiers
+    (matplotlib >= 3.7), then layer._mod_state once key events have been
+    observed, then event.key.
 
     Args:
+        layer: BaseLayer instance
         event: matplotlib ScrollEvent or MouseEvent
 
     Returns:
         tuple(bool, bool) — (is_ctrl, is_shift)
     """
-    if sys.platform == 'win32':
-        import ctypes
-        is_ctrl  = bool(ctypes.windll.user32.GetKeyState(0x11) & 0x8000)
-        is_shift = bool(ctypes.windll.user32.GetKeyState(0x10) & 0x8000)
-    else:
-        key      = getattr(event, 'key', None)
-        is_ctrl  = key == 'control'
-        is_shift = key == 'shift'
+    state = getattr(getattr(event, 'guiEvent', None), 'state', None)
+    if isinstance(state, int):
+        return bool(state & _TK_CONTROL_MASK), bool(state & _TK_SHIFT_MASK)
+
+    modifiers = getattr(event, 'modifiers', None)
+    if modifiers is not None:
+        return 'ctrl' in modifiers, 'shift' in modifiers
+
+    if layer._mod_events_seen:
+        return layer._mod_state['ctrl'], layer._mod_state['shift']
 
-    return is_ctrl, is_shift
+    tokens = _key_tokens(getattr(event, 'key', None))
+    return 'ctrl' in tokens, 'shift' in tokens
 
 
 # U S A G I
@@ -386,4 +532,6 @@ def _get_modifier_keys(event):
 # canvas.mpl_connect('button_press_event',   lambda e: on_press(layer, e))
 # canvas.mpl_connect('button_release_event', lambda e: on_release(layer, e))
 # canvas.mpl_connect('motion_notify_event',  lambda e: on_motion(layer, e))
-# canvas.mpl_connect('scroll_event',         lambda e: on_scroll(layer, e))
\ No newline at end of file
+# canvas.mpl_connect('scroll_event',         lambda e: on_scroll(layer, e))
+# canvas.mpl_connect('key_press_event',      lambda e: on_key_press(layer, e))
+# canvas.mpl_connect('key_release_event',    lambda e: on_key_release(layer, e))
\ No newline at end of file
@@ -9,6 +9,7 @@ Responsibilities:
     - Overlay-only redraw (removes patches, lines, collections, text)
     - Waveform overlay rendering on twin y-axis
     - Shared point annotation rendering
+    - Blitted overlay registry (animated artists over a cached background)
     - Frequency display range update
     - Zoom reset
 
@@ -23,21 +24,25 @@ All functions operate on:
     layer.sr            : sample rate
     layer.spec_image    : cached AxesImage or None
     layer.waveform_ax   : twin y-axis for waveform or None
-    layer.zoom_stack    : list of (xlim, ylim) tuples
+    layer.zoom_stack    : bounded deque of (xlim, ylim) tuples
+    layer._overlay_artists : animated artists redrawn by update_overlays()
+    layer._spec_bg      : cached axes background for overlay blitting or None
 """
 
 import logging
-import traceback
 
 import numpy as np
 import matplotlib
+import matplotlib.artist
 import matplotlib.collections
 import matplotlib.pyplot as plt
+from matplotlib.font_manager import FontProperties
 
 import tkinter as tk
 
 from yaaat.core import audio_utils
 from yaaat.core import annotation_io
+from yaaat.core.interaction import log_handler_error
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +80,10 @@ def update_display(layer, recompute_spec=False):
         if layer.y is None:
             return
 
+        # Registered overlays are stripped with the other artists below;
+        # draw_custom_overlays() re-registers what it draws this pass
+        layer._overlay_artists = []
+
         if recompute_spec or layer.spec_image is None:
             _full_redraw(layer)
         else:
@@ -95,8 +104,7 @@ def update_display(layer, recompute_spec=False):
         layer.canvas.draw()
 
     except Exception as e:
-        logger.error("ERROR in update_display: %s", e)
-        logger.debug(traceback.format_exc())
+        log_handler_error(logger, "update_display", e)
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
@@ -104,20 +112,23 @@ def update_display(layer, recompute_spec=False):
 ##    <(''<)  <( ' ' )>  (>'')>
 
 def _full_redraw(layer):
-    """Clear the axis and redraw the spectrogram image from scratch.
+    """Redraw the spectrogram image, reusing the cached AxesImage when possible.
+
+    If layer.spec_image is still attached to layer.ax, its data, extent and
+    color limits are swapped in place and every other artist is stripped —
+    no ax.clear(), so tick formatters and axis state are not rebuilt.
+    Otherwise the axis is cleared and a new image is created.
 
-    Removes any existing waveform twin axis before clearing.
-    Resets axis labels and display frequency limits.
+    Removes any existing waveform twin axis first.
+    Resets axis labels, x-limits to the full extent, and display frequency limits.
 
     Args:
         layer: BaseLayer instance
     """
-    # Remove waveform twin axis before clearing — avoids orphaned axes
+    # Remove waveform twin axis before redrawing — avoids orphaned axes
     if layer.waveform_ax is not None:
         _remove_waveform_ax(layer)
 
-    layer.ax.clear()
-
     extent = [
         layer.times[0],
         layer.times[-1],
@@ -125,29 +136,55 @@ def _full_redraw(layer):
         layer.freqs[-1]
     ]
 
-    layer.spec_image = layer.ax.imshow(
-        layer.S_db,
-        aspect='auto',
-        origin='lower',
-        extent=extent,
-        cmap=_SPEC_CMAP,
-        interpolation=_SPEC_INTERPOLATION
-    )
-
-    layer.ax.set_xlabel('Time (s)', fontsize=8)
+    image = layer.spec_image
+    if image is not None and image in layer.ax.images:
+        _remove_non_image_artists(layer)
+        image.set_data(layer.S_db)
+        image.set_extent(extent)
+        image.set_clim(layer.S_db.min(), layer.S_db.max())
+        layer.ax.set_xlim(extent[0], extent[1])
+    else:
+        layer.ax.clear()
+        layer.spec_image = layer.ax.imshow(
+            layer.S_db,
+            aspect='auto',
+            origin='lower',
+            extent=extent,
+            cmap=_SPEC_CMAP,
+            interpolation=_SPEC_INTERPOLATION
+        )
+        layer.ax.set_xlabel('Time (s)', fontsize=8)
 
     # Y-axis label reflects active scale
-    if layer.y_scale.get() == 'mel':
+    if layer._y_scale == 'mel':
         layer.ax.set_ylabel('Frequency (mel)', fontsize=8)
     else:
         layer.ax.set_ylabel('Frequency (Hz)', fontsize=8)
 
     # Apply display frequency limits
     ymin, ymax = layer._convert_ylim_to_scale(
-        layer.fmin_display.get(), layer.fmax_display.get())
+        layer._fmin_display, layer._fmax_display)
     layer.ax.set_ylim(ymin, ymax)
 
 
+def _remove_non_image_artists(layer):
+    """Remove every overlay artist from layer.ax except layer.spec_image.
+
+    Equivalent to ax.clear() for overlays — collections of any type, patches,
+    lines, text, generic artists (batched point labels), and stray images —
+    while keeping the spectrogram image.
+
+    Args:
+        layer: BaseLayer instance
+    """
+    artists = (list(layer.ax.collections) + list(layer.ax.patches) +
+               list(layer.ax.lines) + list(layer.ax.texts) +
+               list(layer.ax.artists) +
+               [im for im in layer.ax.images if im is not layer.spec_image])
+    for artist in artists:
+        artist.remove()
+
+
 ##    <(''<)  <( ' ' )>  (>'')>
 # OVERLAY-ONLY REDRAW
 ##    <(''<)  <( ' ' )>  (>'')>
@@ -155,19 +192,15 @@ def _full_redraw(layer):
 def _overlay_only_redraw(layer):
     """Remove all overlays from the axis without touching the spectrogram image.
 
-    Removes: scatter collections, patches, lines, text artists.
+    Removes: scatter and line collections, patches, lines, text artists.
     Clears waveform twin axis contents if present.
     Preserves layer.spec_image and axis limits.
 
     Args:
         layer: BaseLayer instance
     """
-    # Remove scatter plot collections
-    collections_to_remove = [
-        c for c in layer.ax.collections
-        if isinstance(c, matplotlib.collections.PathCollection)
-    ]
-    for c in collections_to_remove:
+    # Remove scatter plots and line collections (vlines/hlines guides)
+    for c in layer.ax.collections[:]:
         c.remove()
 
     # Remove bounding boxes, rectangles, ellipses, polygons
@@ -182,6 +215,10 @@ def _overlay_only_redraw(layer):
     for text in layer.ax.texts[:]:
         text.remove()
 
+    # Remove batched point label artists
+    for artist in layer.ax.artists[:]:
+        artist.remove()
+
     # Clear waveform contents without removing the twin axis
     if layer.waveform_ax is not None:
         layer.waveform_ax.cla()
@@ -262,6 +299,13 @@ def draw_shared_point_annotations(layer):
     Class-scoped points: cyan hollow circles.
     Labels rendered as small text above each point if non-empty.
 
+    One scatter call per scope — a single PathCollection regardless of point
+    count — and one _PointLabels artist for its non-empty labels. The artists
+    are cached on the layer and rebuilt only when the annotation store
+    (BaseLayer.global_annotations_version), the file index or the class
+    changes; otherwise the cached ones are re-attached after the redraw
+    stripped them from the axis.
+
     Called from tab subclasses via draw_custom_overlays() where needed.
 
     Args:
@@ -272,28 +316,169 @@ def draw_shared_point_annotations(layer):
 
     from yaaat.core.base_layer import BaseLayer
 
+    key = (BaseLayer.global_annotations_version, layer.current_file_idx,
+           layer._class_name)
+    if key != layer._shared_point_key:
+        layer._shared_point_artists = _build_shared_point_artists(layer)
+        layer._shared_point_key     = key
+
+    for artist in layer._shared_point_artists:
+        if artist.axes is not None:
+            continue
+        if isinstance(artist, matplotlib.collections.Collection):
+            layer.ax.add_collection(artist, autolim=False)
+        else:
+            layer.ax.add_artist(artist)
+
+
+def _build_shared_point_artists(layer):
+    """Create the scatter and label artists for the current file's shared points.
+
+    Args:
+        layer: BaseLayer instance
+
+    Returns:
+        list of detached matplotlib artists — attached by the caller
+    """
+    from yaaat.core.base_layer import BaseLayer
+
     global_points, class_points = annotation_io.get_shared_point_annotations_for_file(
         BaseLayer.global_point_annotations,
-        layer.audio_files,
+        layer._audio_paths_str,
         layer.current_file_idx,
-        layer.__class__.__name__
+        layer._class_name
     )
 
-    # Global scope — white hollow markers
-    for ann in global_points:
-        layer.ax.scatter(ann["t"], ann["f"], s=30,
-                         edgecolors="white", facecolors="none")
-        if ann["label"]:
-            layer.ax.text(ann["t"], ann["f"], ann["label"],
-                          fontsize=7, color="white", va="bottom", ha="left")
+    artists = []
+
+    # Global scope — white hollow markers; class scope — cyan hollow markers
+    for points, color in ((global_points, "white"), (class_points, "cyan")):
+        if not points:
+            continue
+
+        n  = len(points)
+        ts = np.fromiter((ann["t"] for ann in points), float, n)
+        fs = np.fromiter((ann["f"] for ann in points), float, n)
+        scatter = layer.ax.scatter(ts, fs, s=30, edgecolors=color, facecolors="none")
+        scatter.remove()
+        artists.append(scatter)
+
+        # All non-empty labels of this scope in one artist
+        labeled = [(ann["t"], ann["f"], ann["label"]) for ann in points if ann["label"]]
+        if labeled:
+            artists.append(_PointLabels(labeled, color))
+
+    return artists
+
+
+class _PointLabels(matplotlib.artist.Artist):
+    """Many short point labels drawn by one artist with a shared font and color.
+
+    Equivalent to ax.text(t, f, label, fontsize=7, va='bottom', ha='left')
+    per point, but the font properties, graphics context and descent metric
+    are set up once per draw instead of once per Text artist. Labels whose
+    anchor lies outside the axes are skipped.
+    """
+
+    def __init__(self, labeled, color, fontsize=7):
+        """
+        Args:
+            labeled:  list of (t, f, label) tuples in data coordinates
+            color:    matplotlib color for every label
+            fontsize: float — point size
+        """
+        super().__init__()
+        self._xy     = np.array([(t, f) for t, f, _ in labeled], dtype=float)
+        self._labels = np.array([label for _, _, label in labeled], dtype=object)
+        self._color  = color
+        self._prop   = FontProperties(size=fontsize)
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+
+        ax   = self.axes
+        pts  = ax.transData.transform(self._xy)
+        bbox = ax.bbox
+        inside = ((pts[:, 0] >= bbox.x0) & (pts[:, 0] <= bbox.x1)
+                  & (pts[:, 1] >= bbox.y0) & (pts[:, 1] <= bbox.y1))
+        if not inside.any():
+            return
+
+        # va='bottom' — baseline sits one line descent above the anchor
+        _, _, descent = renderer.get_text_width_height_descent(
+            "lp", self._prop, ismath=False)
+        canvas_h = renderer.get_canvas_width_height()[1]
+        flip     = renderer.flipy()
+
+        gc = renderer.new_gc()
+        gc.set_foreground(self._color)
+        for (x, y), label in zip(pts[inside], self._labels[inside]):
+            y = y + descent
+            renderer.draw_text(gc, x, canvas_h - y if flip else y,
+                               label, self._prop, 0.0)
+        gc.restore()
+
+
+##    <(''<)  <( ' ' )>  (>'')>
+# BLITTED OVERLAYS
+# Artists registered here are animated — skipped by canvas.draw() and
+# painted by blitting over the background captured after each full draw.
+##    <(''<)  <( ' ' )>  (>'')>
+
+def register_overlay(layer, artist):
+    """Mark artist animated and add it to the layer's blitted overlay set.
+
+    Args:
+        layer:  BaseLayer instance
+        artist: matplotlib Artist already added to layer.ax
+
+    Returns:
+        artist
+    """
+    artist.set_animated(True)
+    layer._overlay_artists.append(artist)
+    return artist
+
+
+def capture_overlay_background(layer):
+    """Cache the clean axes background and paint registered overlays on top.
+
+    Connected to the canvas draw_event, so it runs after every full draw.
+
+    Args:
+        layer: BaseLayer instance
+    """
+    layer._spec_bg      = layer.canvas.copy_from_bbox(layer.ax.bbox)
+    layer._spec_bg_lims = (layer.ax.get_xlim(), layer.ax.get_ylim())
+    if layer._overlay_artists:
+        _blit_overlay_artists(layer)
+
+
+def update_overlays(layer):
+    """Redraw only the registered overlay artists.
+
+    Restores the cached background and blits the overlays at axes-bbox cost.
+    Falls back to draw_idle() when no background is cached or the axis
+    limits changed since it was captured.
+
+    Args:
+        layer: BaseLayer instance
+    """
+    if (layer._spec_bg is None or
+            layer._spec_bg_lims != (layer.ax.get_xlim(), layer.ax.get_ylim())):
+        layer.canvas.draw_idle()
+        return
+
+    layer.canvas.restore_region(layer._spec_bg)
+    _blit_overlay_artists(layer)
 
-    # Class scope — cyan hollow markers
-    for ann in class_points:
-        layer.ax.scatter(ann["t"], ann["f"], s=30,
-                         edgecolors="cyan", facecolors="none")
-        if ann["label"]:
-            layer.ax.text(ann["t"], ann["f"], ann["label"],
-                          fontsize=7, color="cyan", va="bottom", ha="left")
+
+def _blit_overlay_artists(layer):
+    """Draw registered overlay artists and blit the axes region."""
+    for artist in layer._overlay_artists:
+        layer.ax.draw_artist(artist)
+    layer.canvas.blit(layer.ax.bbox)
 
 
 ##    <(''<)  <( ' ' )>  (>'')>
@@ -326,7 +511,7 @@ def reset_zoom(layer):
     if layer.y is None:
         return
 
-    layer.zoom_stack = []
+    layer.zoom_stack.clear()
 
     full_xlim = (0, len(layer.y) / layer.sr)
     ymin, ymax = layer._convert_ylim_to_scale(
@@ -350,6 +535,8 @@ def _update_title(layer):
         '✓ ' — no unsaved changes
         ''   — unsaved changes exist
 
+    Skipped when the title artist and its text are unchanged since the last call.
+
     Args:
         layer: BaseLayer instance
     """
@@ -363,11 +550,19 @@ def _update_title(layer):
 
     save_marker = "" if layer.changes_made else "✓ "
 
-    layer.ax.set_title(
-        f"{save_marker}{grandparent} | {parent_dir} | {filename} | "
-        f"n_fft={layer.n_fft.get()} hop={layer.hop_length.get()}",
-        fontsize=9
-    )
+    title = (f"{save_marker}{grandparent} | {parent_dir} | {filename} | "
+             f"n_fft={layer._n_fft} hop={layer._hop_length}")
+
+    # ax.clear() replaces the title artist — only then is its font re-applied
+    title_artist = layer.ax.title
+    if title_artist is layer._title_artist and title == layer._last_title:
+        return
+    if title_artist is not layer._title_artist:
+        title_artist.set_fontsize(9)
+        layer._title_artist = title_artist
+
+    title_artist.set_text(title)
+    layer._last_title = title
 
 
 # U S A G I
@@ -34,6 +34,8 @@ import logging
 import tkinter as tk
 from tkinter import ttk
 
+from yaaat.core import file_nav
+
 logger = logging.getLogger(__name__)
 
 
@@ -121,6 +123,15 @@ class YAAATApp:
         # Bind tab change event for future cross-tab sync
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
+        # FFTW wisdom — restored at startup, persisted on window close
+        file_nav.load_fftw_wisdom()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Persist FFTW wisdom and destroy the root window."""
+        file_nav.save_fftw_wisdom()
+        self.root.destroy()
+
     def _on_tab_changed(self, event):
         """Handle tab switch event.
 
@@ -37,6 +37,8 @@ Contour overlay:
 Spectrogram computation:
     Uses highpass filter (800 Hz Butterworth 5th order) before spectrogram.
     Mel scale, n_mels=64, per-file standardization and normalization.
+    Uncached files on a page are computed in a thread pool
+    (CONFIG['grid_load_workers']).
     Stored in grid_spectrograms cache keyed by str(filepath).
 
 Annotation file: {prefix}_{stem}_batch.json
@@ -45,9 +47,11 @@ Annotation file: {prefix}_{stem}_batch.json
 """
 
 import logging
+import os
 import time
 import traceback
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -102,6 +106,20 @@ _HIGHPASS_ORDER     = 5
 _GRID_N_MELS          = CONFIG["grid_n_mels"]
 _GRID_STANDARDIZE_STD = 3.0
 
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+# GRID PAGE WORKERS
+# Files on a page are independent, so their spectrograms are computed in a
+# thread pool. Decoding, sosfilt and the STFT spend most of their time in
+# C code that releases the GIL. Threads avoid pickling the audio and keep
+# results in this process; only the Tk thread writes the cache.
+# One pool for the session, so per-thread FFTW plans survive page turns.
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+
+_GRID_LOAD_WORKERS = CONFIG["grid_load_workers"] or os.cpu_count() or 1
+
+_GRID_POOL = ThreadPoolExecutor(
+    max_workers=_GRID_LOAD_WORKERS, thread_name_prefix="yaaat-grid")
+
 
 # === === === === === === === === === === === === === === === === === ===
 # LOAD TIMING GATE
@@ -128,6 +146,81 @@ def _dbg_load(msg):
 
 # ==== ==== ==== ==== ==== ==== ==== ==== ==== ==== ==== ==== ==== ==== ====
 
+
+##    <(''<)  <( ' ' )>  (>'')>
+# GRID SPECTROGRAM WORKER
+##    <(''<)  <( ' ' )>  (>'')>
+
+def _compute_grid_spectrogram(filepath, n_fft, hop):
+    """Load one audio file and compute its normalized grid spectrogram.
+
+    Runs in a worker thread from BatchAnnotator.process_grid_page(), so it
+    touches no Tk state.
+
+    Args:
+        filepath: Path — audio file
+        n_fft:    int — FFT size
+        hop:      int — hop length
+
+    Returns:
+        np.ndarray — mel spectrogram standardized and rescaled to [0, 1]
+    """
+    # VERBOSE_LOAD: split timer at the load/compute boundary to
+    # attribute per-file cost between disk I/O+decode and STFT.
+    _t_file_start = time.perf_counter()
+
+    y, sr = pysoniq.load_audio(str(filepath))
+    if y.ndim > 1:
+        y = np.mean(y, axis=1)
+
+    _t_loaded = time.perf_counter()
+
+    # (つ -' _ '- )つ    (つ -' _ '- )つ
+    # Highpass filter — suppresses low-frequency noise before
+    # mel spectrogram computation. Butterworth 5th order, 800 Hz.
+    # (つ -' _ '- )つ    (つ -' _ '- )つ
+    sos        = signal.butter(
+        _HIGHPASS_ORDER, _HIGHPASS_CUTOFF_HZ,
+        btype='highpass', fs=sr, output='sos')
+    y_filtered = signal.sosfilt(sos, y)
+
+    mel_db, freqs, times = audio_utils.compute_spectrogram_unified(
+        y=y_filtered, sr=sr,
+        nfft=n_fft,
+        hop=hop,
+        scale='mel',
+        n_mels=_GRID_N_MELS
+    )
+
+    # (つ -' _ '- )つ    (つ -' _ '- )つ
+    # Per-file standardization — normalizes each file independently
+    # so grid cells are visually comparable regardless of amplitude.
+    # Clip to ±3 std, rescale to [0, 1].
+    # (つ -' _ '- )つ    (つ -' _ '- )つ
+    mel_std  = (mel_db - mel_db.mean()) / (mel_db.std() + 1e-8)
+    mel_norm = np.clip(
+        (mel_std + _GRID_STANDARDIZE_STD) / (2 * _GRID_STANDARDIZE_STD),
+        0, 1)
+
+    # VERBOSE_LOAD: per-file deltas — load (I/O+decode) vs. compute
+    # (filter+mel spectrogram+normalize). Aggregated across the page
+    # these sum to the load+compute phase timed in update_grid_display.
+    # dur_s added as a safeguard: if compute spikes do not track
+    # duration, signal length is eliminated as the cause and the
+    # spike source is elsewhere (decode path, codec, cold read).
+    # sr guarded against zero to avoid a divide error on a bad load.
+    _t_done = time.perf_counter()
+    _dur_s  = (len(y) / sr) if sr else float('nan')
+    _dbg_load(
+        f"process_grid_page FILE {filepath.name}: "
+        f"load={(_t_loaded - _t_file_start) * 1000:.1f}ms "
+        f"compute={(_t_done - _t_loaded) * 1000:.1f}ms "
+        f"dur_s={_dur_s:.3f}"
+    )
+
+    return mel_norm
+
+
 ##    <(''<)  <( ' ' )>  (>'')>
 
 class BatchAnnotator(GridLayer):
@@ -306,7 +399,9 @@ class BatchAnnotator(GridLayer):
         Applies 800 Hz highpass filter before spectrogram computation.
         Uses mel scale with 64 bands for compact grid display.
         Per-file standardization: clips to ±3 std, rescales to [0, 1].
-        Skips files already in cache.
+        Skips files already in cache. The remaining files are computed in
+        parallel by _compute_grid_spectrogram(); results are cached here on
+        the Tk thread, in page order.
         """
         if not self.audio_files:
             return
@@ -314,75 +409,21 @@ class BatchAnnotator(GridLayer):
         start_idx = self.current_page * self.grid_size
         end_idx   = min(start_idx + self.grid_size, len(self.audio_files))
 
-        
-        for i in range(start_idx, end_idx):
-            # VERBOSE_LOAD: unconditional progress marker — bypasses the
-            # _DEBUG_LOAD gate to confirm loop entry and per-iteration progress
-            # on an uncached page. Prints before the cache check so a cached
-            # page also shows iteration. Remove after the freeze is localized.
-            print(f"[LOAD-PROBE] enter iter i={i} of [{start_idx},{end_idx})")
+        pending = [filepath for filepath in self.audio_files[start_idx:end_idx]
+                   if str(filepath) not in self.grid_spectrograms]
 
-            filepath = self.audio_files[i]
+        if not pending:
+            return
 
-            if str(filepath) in self.grid_spectrograms:
-                continue
+        # Tk vars are read here — workers only see plain ints
+        n_fft = self.n_fft.get()
+        hop   = self.hop_length.get()
 
+        futures = [_GRID_POOL.submit(_compute_grid_spectrogram, filepath, n_fft, hop)
+                   for filepath in pending]
+        for filepath, future in zip(pending, futures):
             try:
-                # VERBOSE_LOAD: split timer at the load/compute boundary to
-                # attribute per-file cost between disk I/O+decode and STFT.
-                _t_file_start = time.perf_counter()
-
-                y, sr = pysoniq.load_audio(str(filepath))
-                if y.ndim > 1:
-                    y = np.mean(y, axis=1)
-
-                _t_loaded = time.perf_counter()
-
-                # (つ -' _ '- )つ    (つ -' _ '- )つ
-                # Highpass filter — suppresses low-frequency noise before
-                # mel spectrogram computation. Butterworth 5th order, 800 Hz.
-                # (つ -' _ '- )つ    (つ -' _ '- )つ
-                sos        = signal.butter(
-                    _HIGHPASS_ORDER, _HIGHPASS_CUTOFF_HZ,
-                    btype='highpass', fs=sr, output='sos')
-                y_filtered = signal.sosfilt(sos, y)
-
-                mel_db, freqs, times = audio_utils.compute_spectrogram_unified(
-                    y=y_filtered, sr=sr,
-                    nfft=self.n_fft.get(),
-                    hop=self.hop_length.get(),
-                    scale='mel',
-                    n_mels=_GRID_N_MELS
-                )
-
-                # (つ -' _ '- )つ    (つ -' _ '- )つ
-                # Per-file standardization — normalizes each file independently
-                # so grid cells are visually comparable regardless of amplitude.
-                # Clip to ±3 std, rescale to [0, 1].
-                # (つ -' _ '- )つ    (つ -' _ '- )つ
-                mel_std  = (mel_db - mel_db.mean()) / (mel_db.std() + 1e-8)
-                mel_norm = np.clip(
-                    (mel_std + _GRID_STANDARDIZE_STD) / (2 * _GRID_STANDARDIZE_STD),
-                    0, 1)
-
-                self.grid_spectrograms[str(filepath)] = mel_norm
-
-                # VERBOSE_LOAD: per-file deltas — load (I/O+decode) vs. compute
-                # (filter+mel spectrogram+normalize). Aggregated across the page
-                # these sum to the load+compute phase timed in update_grid_display.
-                # dur_s added as a safeguard: if compute spikes do not track
-                # duration, signal length is eliminated as the cause and the
-                # spike source is elsewhere (decode path, codec, cold read).
-                # sr guarded against zero to avoid a divide error on a bad load.
-                _t_done = time.perf_counter()
-                _dur_s  = (len(y) / sr) if sr else float('nan')
-                _dbg_load(
-                    f"process_grid_page FILE {filepath.name}: "
-                    f"load={(_t_loaded - _t_file_start) * 1000:.1f}ms "
-                    f"compute={(_t_done - _t_loaded) * 1000:.1f}ms "
-                    f"dur_s={_dur_s:.3f}"
-                )
-
+                self.grid_spectrograms[str(filepath)] = future.result()
             except Exception as e:
                 logger.error("Error processing %s: %s", filepath.name, e)
                 self.grid_spectrograms[str(filepath)] = None
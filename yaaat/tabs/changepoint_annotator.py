@@ -20,7 +20,8 @@ Responsibilities:
 Contour data structure:
     {
         'id':         str  — 'c{idx}' assigned at save time
-        'points':     [{'time': float, 'freq': float}, ...]
+        'points':     POINT_DTYPE array (time, freq, label code) in memory;
+                      [{'time': float, 'freq': float}, ...] on disk
         'onset_idx':  int  — index of onset point in points list
         'offset_idx': int  — index of offset point in points list
     }
@@ -45,13 +46,17 @@ Annotation file: {prefix}_{stem}_changepoints.json
     All other tab files carry a contour_source key pointing to this file.
 """
 
-import json
 import logging
+import math
 import traceback
-import sys
 
 import numpy as np
+import matplotlib.artist
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path as MplPath
 
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -64,6 +69,9 @@ from yaaat.core.annotation_io import (
     resolve_annotation_path,
     merge_and_save,
     load_and_check_params,
+    check_params,
+    save_shadow_arrays,
+    load_shadow_arrays,
     mark_skip,
     is_skipped,
     compute_contour_metrics,
@@ -75,6 +83,17 @@ logger = logging.getLogger(__name__)
 
 from yaaat.config import CONFIG
 
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+# OPTIONAL NUMBA LOOKUP KERNELS
+# When numba is importable, point lookup and lasso containment run as
+# compiled loops over the SoA point index instead of NumPy temporaries.
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 
 # (つ -' _ '- )つ    (つ -' _ '- )つ
 # ANNOTATION LABEL COLORS
@@ -87,6 +106,208 @@ _LABEL_COLORS = {
     'changepoint': 'cyan',
 }
 
+# Control bit of the Tk event.state modifier mask
+_TK_CONTROL_MASK = 0x0004
+
+# Lasso vertices closer than this (display pixels) to the last one are dropped
+_LASSO_MIN_STEP_PX = 3
+
+# Contour table columns: (heading, width in pixels)
+_TABLE_COLUMNS = (
+    ('#',        30),
+    ('t_onset',  60),
+    ('t_offset', 60),
+    ('f_min',    55),
+    ('f_max',    55),
+)
+
+
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+# POINT STORAGE
+# Contour points are structured arrays, one record per point; label is a
+# code into _LABEL_NAMES. JSON stays [{'time', 'freq'}, ...] on disk —
+# converted at the save/load boundary by _points_list / _points_array.
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+
+POINT_DTYPE = np.dtype([('time', '<f8'), ('freq', '<f8'), ('label', 'u1')])
+
+_LABEL_NAMES = ('onset', 'offset', 'changepoint')
+_ONSET, _OFFSET, _CHANGEPOINT = range(len(_LABEL_NAMES))
+
+# RGBA per label code — indexed with an array of codes for scatter colors
+_LABEL_RGBA = to_rgba_array([_LABEL_COLORS[name] for name in _LABEL_NAMES])
+
+
+def _empty_points():
+    """Return an empty POINT_DTYPE array."""
+    return np.empty(0, dtype=POINT_DTYPE)
+
+
+def _points_array(points):
+    """Convert [{'time': float, 'freq': float}, ...] to a POINT_DTYPE array.
+
+    All points are labeled changepoint; _make_contour() stamps endpoints.
+    """
+    arr = np.empty(len(points), dtype=POINT_DTYPE)
+    arr['time']  = [p['time'] for p in points]
+    arr['freq']  = [p['freq'] for p in points]
+    arr['label'] = _CHANGEPOINT
+    return arr
+
+
+def _points_list(points):
+    """Convert a POINT_DTYPE array back to [{'time', 'freq'}, ...] for JSON."""
+    return [{'time': t, 'freq': f}
+            for t, f in zip(points['time'].tolist(), points['freq'].tolist())]
+
+
+def _sort_by_time(points):
+    """Return points stably sorted by time."""
+    return points[np.argsort(points['time'], kind='stable')]
+
+
+def _make_contour(points, onset_idx, offset_idx):
+    """Build a contour dict and stamp onset/offset label codes onto points.
+
+    Args:
+        points:     POINT_DTYPE array — owned by the returned contour
+        onset_idx:  int — index of the onset point
+        offset_idx: int — index of the offset point
+
+    Returns:
+        dict — {'points', 'onset_idx', 'offset_idx'}
+    """
+    points['label'] = _CHANGEPOINT
+    if len(points):
+        points['label'][onset_idx]  = _ONSET
+        points['label'][offset_idx] = _OFFSET
+    return {
+        'points':     points,
+        'onset_idx':  int(onset_idx),
+        'offset_idx': int(offset_idx),
+    }
+
+
+if _NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True)
+    def _nearest_point_kernel(ts, fs, x, y, time_thresh, freq_thresh):
+        """Return the first index within both thresholds of (x, y), or -1."""
+        for i in range(ts.shape[0]):
+            if abs(ts[i] - x) < time_thresh and abs(fs[i] - y) < freq_thresh:
+                return i
+        return -1
+
+    @numba.njit(cache=True, fastmath=True)
+    def _points_in_poly_kernel(ts, fs, poly_ts, poly_fs):
+        """Even-odd ray casting of every (ts[i], fs[i]) against one polygon."""
+        n      = poly_ts.shape[0]
+        inside = np.zeros(ts.shape[0], dtype=np.bool_)
+        for i in range(ts.shape[0]):
+            x, y = ts[i], fs[i]
+            hit  = False
+            j    = n - 1
+            for k in range(n):
+                if ((poly_fs[k] > y) != (poly_fs[j] > y) and
+                        x < (poly_ts[j] - poly_ts[k]) * (y - poly_fs[k]) /
+                            (poly_fs[j] - poly_fs[k]) + poly_ts[k]):
+                    hit = not hit
+                j = k
+            inside[i] = hit
+        return inside
+
+
+def _guide_segments(values):
+    """Build (N, 2, 2) vertical guide segments from 0 to 1 in axes coords.
+
+    Swap the last axis ([:, :, ::-1]) for horizontal guides.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    segs = np.empty((len(values), 2, 2))
+    segs[:, :, 0] = values[:, None]
+    segs[:, 0, 1] = 0.0
+    segs[:, 1, 1] = 1.0
+    return segs
+
+
+class _GuideLabels(matplotlib.artist.Artist):
+    """Value labels for every time or frequency guide, drawn by one artist.
+
+    Replaces one ax.text() per guide. Time labels are rotated 90 degrees,
+    right/top-aligned at 95% of the y-axis top; frequency labels are
+    left/center-aligned just inside the left x-limit. Anchors are resolved
+    against the current limits at draw time, so the artist stays valid
+    across zoom and can be blitted like the guide collections.
+    """
+
+    def __init__(self, axis, color, fontsize=9):
+        """
+        Args:
+            axis:     'x' for time guides, 'y' for frequency guides
+            color:    matplotlib color for every label
+            fontsize: float — point size
+        """
+        super().__init__()
+        self._axis   = axis
+        self._color  = color
+        self._values = np.empty(0)
+        self._prop   = FontProperties(family='monospace', size=fontsize)
+        self.set_alpha(0.9)
+
+    def set_values(self, values):
+        """Set the guide positions (seconds or Hz) to label."""
+        self._values = np.asarray(values, dtype=np.float64)
+        self.stale = True
+
+    def draw(self, renderer):
+        if not self.get_visible() or not len(self._values):
+            return
+
+        ax = self.axes
+        if self._axis == 'x':
+            anchors = np.column_stack((
+                self._values,
+                np.full(len(self._values), ax.get_ylim()[1] * 0.95)))
+            labels = [f"{t:.3f}s" for t in self._values]
+            angle  = 90.0
+        else:
+            anchors = np.column_stack((
+                np.full(len(self._values), ax.get_xlim()[0] + 0.01),
+                self._values))
+            labels = [f"{f:.1f}Hz" for f in self._values]
+            angle  = 0.0
+
+        pts  = ax.transData.transform(anchors)
+        bbox = ax.bbox
+        inside = ((pts[:, 0] >= bbox.x0) & (pts[:, 0] <= bbox.x1)
+                  & (pts[:, 1] >= bbox.y0) & (pts[:, 1] <= bbox.y1))
+        if not inside.any():
+            return
+
+        # Line height and descent never shrink below those of "lp",
+        # matching Text layout
+        _, lp_h, lp_d = renderer.get_text_width_height_descent(
+            "lp", self._prop, ismath=False)
+        canvas_h = renderer.get_canvas_width_height()[1]
+        flip     = renderer.flipy()
+
+        gc = renderer.new_gc()
+        gc.set_foreground(self._color)
+        gc.set_alpha(self.get_alpha())
+        for (x, y), label, keep in zip(pts, labels, inside):
+            if not keep:
+                continue
+            w, h, d = renderer.get_text_width_height_descent(
+                label, self._prop, ismath=False)
+            h, d = max(h, lp_h), max(d, lp_d)
+            if self._axis == 'x':
+                # Rotated: descent lies right of the baseline, text runs up
+                x, y = x - d, y - w
+            else:
+                y = y - h / 2 + d
+            renderer.draw_text(gc, x, canvas_h - y if flip else y,
+                               label, self._prop, angle)
+        gc.restore()
+
 
 ##    <(''<)  <( ' ' )>  (>'')>
 
@@ -100,16 +321,38 @@ class ChangepointAnnotator(BaseLayer):
 
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # CONTOUR STATE
-        # current_contour: points being built, not yet finished
-        # contours: list of finished contour dicts
-        # annotations: flat list rebuilt from contours for display
+        # current_contour: POINT_DTYPE array being built, not yet finished,
+        #                  kept sorted by time (see _insert_current_point)
+        # contours: list of finished contour dicts, points as POINT_DTYPE
+        # annotations: flat POINT_DTYPE array — contours, then current_contour
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
-        self.current_contour = []
+        self.current_contour = _empty_points()
         self.contours        = []
-        self.annotations     = []
+        self.annotations     = _empty_points()
         self.changepoints    = []
 
+        # Start of each contour's slice in annotations; the last entry is
+        # where current_contour starts. (lo, hi) in _annotations_dirty_range
+        # limits the next rebuild_annotations() to contours [lo, hi) of the
+        # previous rebuild — None rebuilds everything. See _mark_dirty().
+        self._contour_offsets         = np.zeros(1, dtype=np.intp)
+        self._annotations_dirty_range = None
+
+        # (time, freq) of each click into current_contour, newest last —
+        # lets clear_last() undo by click order while points stay time-sorted
+        self._click_stack    = []
+
+        # Point lookup index — flat time/freq arrays over current_contour
+        # then contours, with (contour_idx, point_idx) rows back into them;
+        # contour_idx -1 is current_contour. Rebuilt by _index_points().
+        self._all_points_t   = np.empty(0)
+        self._all_points_f   = np.empty(0)
+        self._all_points_ref = np.empty((0, 2), dtype=np.intp)
+
+        # Set while a _do_rebuild() panel refresh is queued on after_idle
+        self._rebuild_pending = False
+
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # ANNOTATION MODE
         # 'contour' — click points, finish contour
@@ -126,12 +369,14 @@ class ChangepointAnnotator(BaseLayer):
         # LASSO STATE
         # lasso_mode: True while drag-lasso is active
         # lasso_points: list of (x, y) vertices
-        # lasso_lines: matplotlib Line2D objects for visual feedback
+        # _lasso_line / _lasso_start: cached Line2D path and start marker,
+        # updated with set_data and blitted — built by _ensure_lasso_artists()
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
         self.lasso_mode   = False
         self.lasso_points = []
-        self.lasso_lines  = []
+        self._lasso_line  = None
+        self._lasso_start = None
 
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # GUIDE AND BOUNDING BOX STATE
@@ -177,6 +422,19 @@ class ChangepointAnnotator(BaseLayer):
 
 
 
+        # (つ -' _ '- )つ    (つ -' _ '- )つ
+        # CACHED OVERLAY ARTISTS
+        # Built on first draw by _ensure_overlay_artists() — the axes do
+        # not exist until the first file loads. Updated in place with
+        # set_offsets / set_segments instead of being recreated per redraw.
+        # (つ -' _ '- )つ    (つ -' _ '- )つ
+
+        self._point_scatter   = None
+        self._time_guide_coll = None
+        self._freq_guide_coll = None
+        self._time_guide_text = None
+        self._freq_guide_text = None
+
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # TRACKING ACROSS FILES
         # (つ -' _ '- )つ    (つ -' _ '- )つ
@@ -447,39 +705,28 @@ class ChangepointAnnotator(BaseLayer):
         ttk.Label(self.control_panel, text="Contours:",
                   font=('', 9, 'bold')).pack(anchor=tk.W, pady=(0, 2))
 
-        header_frame = ttk.Frame(self.control_panel)
-        header_frame.pack(fill=tk.X, pady=2)
-        for label, width in [('#', 3), ('t_onset', 7), ('t_offset', 7),
-                              ('f_min', 7), ('f_max', 7)]:
-            ttk.Label(header_frame, text=label,
-                      font=('', 8, 'bold'), width=width).pack(side=tk.LEFT)
-
-        table_frame = ttk.Frame(self.control_panel, height=150)
+        table_frame = ttk.Frame(self.control_panel)
         table_frame.pack(fill=tk.X, pady=2)
-        table_frame.pack_propagate(False)
-
-        ann_canvas    = tk.Canvas(table_frame, highlightthickness=0)
-        ann_scrollbar = ttk.Scrollbar(table_frame, orient="vertical",
-                                      command=ann_canvas.yview)
-        self.annotations_inner_frame = ttk.Frame(ann_canvas)
 
-        ann_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        ann_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ann_canvas.configure(yscrollcommand=ann_scrollbar.set)
-        ann_canvas.create_window((0, 0), window=self.annotations_inner_frame,
-                                 anchor="nw")
-        self.annotations_inner_frame.bind(
-            "<Configure>",
-            lambda e: ann_canvas.configure(
-                scrollregion=ann_canvas.bbox("all")))
-
-        def on_ann_mousewheel(event):
-            ann_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        ann_canvas.bind("<Enter>",
-                        lambda e: ann_canvas.bind_all(
-                            "<MouseWheel>", on_ann_mousewheel))
-        ann_canvas.bind("<Leave>",
-                        lambda e: ann_canvas.unbind_all("<MouseWheel>"))
+        columns    = [name for name, _ in _TABLE_COLUMNS]
+        self.table = ttk.Treeview(table_frame, columns=columns,
+                                  show='headings', height=7,
+                                  selectmode='none')
+        for name, width in _TABLE_COLUMNS:
+            self.table.heading(name, text=name)
+            self.table.column(name, width=width, anchor=tk.W, stretch=False)
+        self.table.tag_configure('unsaved', foreground='orange',
+                                 font=('', 8, 'italic'))
+
+        table_scrollbar = ttk.Scrollbar(table_frame, orient="vertical",
+                                        command=self.table.yview)
+        self.table.configure(yscrollcommand=table_scrollbar.set)
+        table_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Scroll only the table under the wheel, not the control panel too
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.table.bind(sequence, self._on_table_wheel)
 
     ##    <(''<)  <( ' ' )>  (>'')>
     # ANNOTATION MODE
@@ -513,7 +760,7 @@ class ChangepointAnnotator(BaseLayer):
     def finish_contour(self, silent=False):
         """Mark current contour as complete and start a new one.
 
-        Sorts current_contour points by time, assigns onset_idx=0 and
+        current_contour is already sorted by time; assigns onset_idx=0 and
         offset_idx=len-1, and appends the dict to self.contours.
 
         Args:
@@ -530,15 +777,14 @@ class ChangepointAnnotator(BaseLayer):
                     "Need at least 2 points to finish contour")
             return False
 
-        sorted_points = sorted(self.current_contour, key=lambda x: x['time'])
+        sorted_points = self.current_contour
 
-        self.contours.append({
-            'points':     sorted_points,
-            'onset_idx':  0,
-            'offset_idx': len(sorted_points) - 1,
-        })
+        self._mark_dirty()
+        self.contours.append(
+            _make_contour(sorted_points, 0, len(sorted_points) - 1))
 
-        self.current_contour = []
+        self.current_contour = _empty_points()
+        self._click_stack    = []
         self.changes_made    = True
 
         self.rebuild_annotations()
@@ -562,7 +808,7 @@ class ChangepointAnnotator(BaseLayer):
         """
         box = {
             'id':         f"bb{len(self.bounding_boxes)}",
-            'audio_file': str(self.audio_files[self.current_file_idx])
+            'audio_file': self._audio_paths_str[self.current_file_idx]
                           if self.audio_files else "",
             'type':       self.bb_type.get(),
             't_min':      float(t_min),
@@ -590,64 +836,72 @@ class ChangepointAnnotator(BaseLayer):
     ##    <(''<)  <( ' ' )>  (>'')>
 
     def rebuild_annotations(self):
-        """Rebuild flat annotations list from contours and current_contour.
-
-        Handles both new dict format (with onset_idx/offset_idx) and
-        old list format (converted inline — onset=first, offset=last by time).
-        Updates contour_info label, stats, sequence display, and table.
+        """Rebuild the flat annotations array from contours and current_contour.
+
+        self.annotations holds contours in order, then current_contour.
+        Only the contours marked by _mark_dirty() are copied from their
+        contour dicts — the rest are carried over from the previous array
+        as two slices — and current_contour is always re-copied. Without a
+        mark every contour is rebuilt. Label codes are carried over as
+        stamped by _make_contour(); current (unsaved) points are
+        changepoints.
+
+        The point index and annotations are rebuilt immediately — lookups
+        and the redraw that follows read them. The contour_info label,
+        stats, sequence display, and table are refreshed once per idle
+        cycle by _do_rebuild(), so bursts of edits collapse to one update.
+        """
+        old_off = self._contour_offsets
+        n_old   = len(old_off) - 1
+        lo, hi  = self._annotations_dirty_range or (0, n_old)
+        self._annotations_dirty_range = None
+
+        # Contours [lo, hi) of the last rebuild now sit at [lo, hi_new)
+        hi_new = hi + len(self.contours) - n_old
+        mid    = [c['points'] for c in self.contours[lo:hi_new]]
+        sizes  = np.fromiter((len(points) for points in mid),
+                             dtype=np.intp, count=len(mid))
+
+        self.annotations = np.concatenate(
+            [self.annotations[:old_off[lo]]] + mid +
+            [self.annotations[old_off[hi]:old_off[-1]], self.current_contour])
+        shift = old_off[lo] + sizes.sum() - old_off[hi]
+        self._contour_offsets = np.concatenate((
+            old_off[:lo + 1],
+            old_off[lo] + np.cumsum(sizes),
+            old_off[hi + 1:] + shift,
+        ))
+
+        self._index_points()
+
+        if not self._rebuild_pending:
+            self._rebuild_pending = True
+            self.root.after_idle(self._do_rebuild)
+
+    def _mark_dirty(self, lo=None, hi=None):
+        """Limit the next rebuild_annotations() to contours [lo, hi).
+
+        Indices refer to self.contours as of the last rebuild; hi defaults
+        to its length. With no arguments only current_contour is re-copied.
         """
-        self.annotations = []
+        n_old = len(self._contour_offsets) - 1
+        self._annotations_dirty_range = (n_old if lo is None else lo,
+                                         n_old if hi is None else hi)
 
-        for contour in self.contours:
-            if isinstance(contour, dict):
-                points     = contour['points']
-                onset_idx  = contour.get('onset_idx', 0)
-                offset_idx = contour.get('offset_idx', len(points) - 1)
-
-                for i, point in enumerate(points):
-                    if i == onset_idx:
-                        label = 'onset'
-                    elif i == offset_idx:
-                        label = 'offset'
-                    else:
-                        label = 'changepoint'
-
-                    self.annotations.append({
-                        'time':  point['time'],
-                        'freq':  point['freq'],
-                        'label': label,
-                    })
-            else:
-                # (つ -' _ '- )つ    (つ -' _ '- )つ
-                # FALLBACK: old list format — convert inline
-                # onset = first point by time, offset = last point by time
-                # This handles files saved before the dict format was adopted.
-                # TODO: flag as fallback for tracking legacy file conversion
-                # (つ -' _ '- )つ    (つ -' _ '- )つ
-                sorted_points = sorted(contour, key=lambda x: x['time'])
-                for i, point in enumerate(sorted_points):
-                    label = ('onset' if i == 0
-                             else 'offset' if i == len(sorted_points) - 1
-                             else 'changepoint')
-                    self.annotations.append({
-                        'time':  point['time'],
-                        'freq':  point['freq'],
-                        'label': label,
-                    })
-
-        # Add current (unsaved) contour points as changepoints
-        for point in self.current_contour:
-            self.annotations.append({
-                'time':  point['time'],
-                'freq':  point['freq'],
-                'label': 'changepoint',
-            })
+    def _reset_annotations(self):
+        """Drop annotations and the point index; the next rebuild is full."""
+        self.annotations              = _empty_points()
+        self._contour_offsets         = np.zeros(1, dtype=np.intp)
+        self._annotations_dirty_range = None
+        self._index_points()
+
+    def _do_rebuild(self):
+        """Refresh the info label, stats, table, and sequence display."""
+        self._rebuild_pending = False
 
         # Update info label
         unsaved     = len(self.current_contour)
-        saved_pts   = sum(
-            len(c['points'] if isinstance(c, dict) else c)
-            for c in self.contours)
+        saved_pts   = sum(len(c['points']) for c in self.contours)
         self.contour_info.config(
             text=(f"Unsaved Points: {unsaved} | "
                   f"Saved Points: {saved_pts} | "
@@ -671,9 +925,9 @@ class ChangepointAnnotator(BaseLayer):
         if event.button != 1:
             return False
 
-        is_ctrl = self._get_ctrl_state()
+        is_ctrl = self._get_ctrl_state(event)
 
-        if is_ctrl and (self.current_contour or self.contours):
+        if is_ctrl and (len(self.current_contour) or self.contours):
             near = self._find_nearest_point(
                 event.xdata, event.ydata, 0.02, 100)
 
@@ -687,17 +941,27 @@ class ChangepointAnnotator(BaseLayer):
                 self.lasso_points = [(event.xdata, event.ydata)]
                 self.drag_start   = (event.xdata, event.ydata)
 
+                # Bbox preview patch is reused across drags — hide, don't remove
                 if self.drag_rect is not None:
-                    self.drag_rect.remove()
-                    self.drag_rect = None
+                    self.drag_rect.set_visible(False)
 
                 return True
 
         return False
 
     def on_custom_motion(self, event):
-        """Draw lasso path during Ctrl+drag."""
+        """Draw lasso path during Ctrl+drag.
+
+        Motion events closer than _LASSO_MIN_STEP_PX to the last vertex
+        are dropped, so the path and its redraws track the pointer rather
+        than the event rate.
+        """
         if self.lasso_mode and self.drag_start is not None:
+            if event.xdata is None or event.ydata is None:
+                return True
+            x0, y0 = self.ax.transData.transform(self.lasso_points[-1])
+            if math.hypot(event.x - x0, event.y - y0) < _LASSO_MIN_STEP_PX:
+                return True
             self.lasso_points.append((event.xdata, event.ydata))
             self._draw_lasso_preview()
             return True
@@ -722,9 +986,9 @@ class ChangepointAnnotator(BaseLayer):
                 (event.xdata - x0) ** 2 + (event.ydata - y0) ** 2)
 
         if drag_dist < 0.05:
-            is_ctrl = self._get_ctrl_state()
+            is_ctrl = self._get_ctrl_state(event)
 
-            if is_ctrl and (self.current_contour or self.contours):
+            if is_ctrl and (len(self.current_contour) or self.contours):
                 self._handle_ctrl_click(event.xdata, event.ydata)
                 return True
 
@@ -732,19 +996,47 @@ class ChangepointAnnotator(BaseLayer):
             if self._remove_nearby_annotation(event.xdata, event.ydata):
                 logger.debug("Removed point")
             else:
-                self.current_contour.append({
-                    'time': float(event.xdata),
-                    'freq': float(event.ydata),
-                })
+                title_stale = not self.changes_made
+                self._insert_current_point(
+                    float(event.xdata), float(event.ydata))
                 self.changes_made = True
+                self._mark_dirty()
                 self.rebuild_annotations()
-                self.update_display(recompute_spec=False)
+                self._redraw_points(title_stale)
                 logger.debug("Added point: t=%.3f f=%.0f",
                              event.xdata, event.ydata)
             return True
 
         return False
 
+    def _insert_current_point(self, t, f):
+        """Insert a clicked point into current_contour, keeping time order.
+
+        Binary search for the slot instead of re-sorting on finish; ties
+        go after existing points at the same time, as a stable sort would.
+        """
+        idx = np.searchsorted(self.current_contour['time'], t, side='right')
+        self.current_contour = np.insert(
+            self.current_contour, idx,
+            np.array((t, f, _CHANGEPOINT), dtype=POINT_DTYPE))
+        self._click_stack.append((t, f))
+
+    def _last_clicked_index(self):
+        """Return the current_contour index of the newest click still present.
+
+        Clicks since removed (by click-remove or extraction) are skipped.
+        Falls back to the last point by time once the history runs out.
+        """
+        times = self.current_contour['time']
+        while self._click_stack:
+            t, f = self._click_stack.pop()
+            lo   = np.searchsorted(times, t, side='left')
+            hi   = np.searchsorted(times, t, side='right')
+            hits = np.flatnonzero(self.current_contour['freq'][lo:hi] == f)
+            if len(hits):
+                return lo + hits[-1]
+        return len(times) - 1
+
     ##    <(''<)  <( ' ' )>  (>'')>
     # CTRL+CLICK ENDPOINT MARKING
     # First Ctrl+Click marks a point. Second Ctrl+Click extracts all points
@@ -784,97 +1076,100 @@ class ChangepointAnnotator(BaseLayer):
         Removes extracted points from their source contours or current_contour.
         Creates a new dict-format contour and appends to self.contours.
         """
-        extracted  = []
-        source_map = []
-
-        for i, point in enumerate(self.current_contour):
-            if onset_time <= point['time'] <= offset_time:
-                extracted.append(point)
-                source_map.append(('current', i))
-
-        for ci, contour in enumerate(self.contours):
-            points = contour['points'] if isinstance(contour, dict) else contour
-            for pi, point in enumerate(points):
-                if onset_time <= point['time'] <= offset_time:
-                    extracted.append(point)
-                    source_map.append(('contour', ci, pi))
-
-        if len(extracted) < 2:
+        in_range = ((self._all_points_t >= onset_time) &
+                    (self._all_points_t <= offset_time))
+
+        if not self._extract_contour(in_range):
             logger.debug("Not enough points in time range for extraction")
             return
 
-        # Sort extracted by time
-        sorted_pairs  = sorted(zip(extracted, source_map),
-                                key=lambda x: x[0]['time'])
-        extracted     = [p for p, _ in sorted_pairs]
-        source_map    = [s for _, s in sorted_pairs]
+        self.changes_made = True
+        self.rebuild_annotations()
+        self.update_display(recompute_spec=False)
 
-        # Remove extracted points from sources
-        current_remove = {s[1] for s in source_map if s[0] == 'current'}
-        self.current_contour = [
-            p for i, p in enumerate(self.current_contour)
-            if i not in current_remove]
+    def _extract_contour(self, mask):
+        """Move every point selected by mask into a new contour.
 
-        contour_remove = {}
-        for s in source_map:
-            if s[0] == 'contour':
-                contour_remove.setdefault(s[1], set()).add(s[2])
+        Source contours left with fewer than 2 points are dropped; the rest
+        get onset/offset re-derived from their earliest/latest point.
 
-        for ci in sorted(contour_remove.keys(), reverse=True):
-            contour = self.contours[ci]
-            points  = contour['points'] if isinstance(contour, dict) else contour
-            remaining = [p for pi, p in enumerate(points)
-                         if pi not in contour_remove[ci]]
-            if len(remaining) < 2:
-                self.contours.pop(ci)
-            else:
-                sorted_rem = sorted(range(len(remaining)),
-                                    key=lambda i: remaining[i]['time'])
-                self.contours[ci] = {
-                    'points':     remaining,
-                    'onset_idx':  sorted_rem[0],
-                    'offset_idx': sorted_rem[-1],
-                }
-
-        # Append new contour
-        self.contours.append({
-            'points':     extracted,
-            'onset_idx':  0,
-            'offset_idx': len(extracted) - 1,
-        })
+        Args:
+            mask: bool ndarray aligned with the point index
+                  (_all_points_t / _all_points_ref order)
 
-        self.changes_made = True
-        self.rebuild_annotations()
-        self.update_display(recompute_spec=False)
+        Returns:
+            bool — True if a contour was extracted, False if fewer than
+            2 points matched (nothing is modified)
+        """
+        if np.count_nonzero(mask) < 2:
+            return False
+
+        # Split the flat mask back into current_contour + per-contour masks
+        sizes = [len(self.current_contour)] + [len(c['points']) for c in self.contours]
+        current_mask, *contour_masks = np.split(mask, np.cumsum(sizes)[:-1])
+
+        extracted = np.concatenate(
+            [self.current_contour[current_mask]] +
+            [c['points'][m] for c, m in zip(self.contours, contour_masks)])
+
+        # Contours from the first one touched onward are rewritten
+        touched = [ci for ci, m in enumerate(contour_masks) if m.any()]
+        self._mark_dirty(touched[0] if touched else len(contour_masks))
+
+        self.current_contour = self.current_contour[~current_mask]
+
+        kept = []
+        for contour, mask in zip(self.contours, contour_masks):
+            if not mask.any():
+                kept.append(contour)
+                continue
+            remaining = contour['points'][~mask]
+            if len(remaining) >= 2:
+                kept.append(_make_contour(
+                    remaining,
+                    np.argmin(remaining['time']),
+                    np.argmax(remaining['time'])))
+        self.contours = kept
+
+        extracted = _sort_by_time(extracted)
+        self.contours.append(_make_contour(extracted, 0, len(extracted) - 1))
+        return True
 
     ##    <(''<)  <( ' ' )>  (>'')>
     # LASSO SELECTION
     ##    <(''<)  <( ' ' )>  (>'')>
 
+    def _ensure_lasso_artists(self):
+        """Create the cached lasso artists, re-attaching them after a redraw.
+
+        Both are registered as blitted overlays so the drag preview only
+        restores the background and redraws the lasso.
+        """
+        if self._lasso_line is None:
+            self._lasso_line, = self.ax.plot(
+                [], [], 'y-', linewidth=2, alpha=0.7, visible=False)
+            self._lasso_start, = self.ax.plot(
+                [], [], 'yo', markersize=10,
+                markeredgecolor='black', markeredgewidth=2, visible=False)
+
+        for artist in (self._lasso_line, self._lasso_start):
+            if artist not in self.ax.lines:
+                self.ax.add_line(artist)
+            if artist not in self._overlay_artists:
+                self.register_overlay(artist)
+
     def _draw_lasso_preview(self):
         """Draw lasso path as a yellow line during drag."""
-        for line in self.lasso_lines:
-            try:
-                line.remove()
-            except Exception:
-                pass
-        self.lasso_lines = []
-
         if len(self.lasso_points) < 2:
             return
 
-        xs   = [p[0] for p in self.lasso_points]
-        ys   = [p[1] for p in self.lasso_points]
-        line = self.ax.plot(xs, ys, 'y-', linewidth=2, alpha=0.7)[0]
-        self.lasso_lines.append(line)
-
-        circle = self.ax.plot(
-            self.lasso_points[0][0], self.lasso_points[0][1],
-            'yo', markersize=10,
-            markeredgecolor='black', markeredgewidth=2)[0]
-        self.lasso_lines.append(circle)
-
-        self.canvas.draw_idle()
+        self._ensure_lasso_artists()
+        xs, ys = zip(*self.lasso_points)
+        self._lasso_line.set_data(xs, ys)
+        self._lasso_start.set_data([xs[0]], [ys[0]])
+        self._lasso_line.set_visible(True)
+        self._lasso_start.set_visible(True)
+        self.update_overlays()
 
     def _finish_lasso_selection(self):
         """Extract all points inside the lasso polygon into a new contour."""
@@ -883,66 +1178,20 @@ class ChangepointAnnotator(BaseLayer):
                 self._cancel_lasso()
                 return
 
-            extracted  = []
-            source_map = []
-
-            for i, point in enumerate(self.current_contour):
-                if self._point_in_polygon(
-                        point['time'], point['freq'], self.lasso_points):
-                    extracted.append(point)
-                    source_map.append(('current', i))
-
-            for ci, contour in enumerate(self.contours):
-                points = (contour['points']
-                          if isinstance(contour, dict) else contour)
-                for pi, point in enumerate(points):
-                    if self._point_in_polygon(
-                            point['time'], point['freq'], self.lasso_points):
-                        extracted.append(point)
-                        source_map.append(('contour', ci, pi))
-
-            if len(extracted) < 2:
+            vertices = np.asarray(self.lasso_points, dtype=np.float64)
+            if _NUMBA_AVAILABLE:
+                in_lasso = _points_in_poly_kernel(
+                    self._all_points_t, self._all_points_f,
+                    np.ascontiguousarray(vertices[:, 0]),
+                    np.ascontiguousarray(vertices[:, 1]))
+            else:
+                in_lasso = MplPath(vertices).contains_points(
+                    np.column_stack((self._all_points_t, self._all_points_f)))
+
+            if not self._extract_contour(in_lasso):
                 self._cancel_lasso()
                 return
 
-            sorted_pairs = sorted(zip(extracted, source_map),
-                                   key=lambda x: x[0]['time'])
-            extracted    = [p for p, _ in sorted_pairs]
-            source_map   = [s for _, s in sorted_pairs]
-
-            current_remove = {s[1] for s in source_map if s[0] == 'current'}
-            self.current_contour = [
-                p for i, p in enumerate(self.current_contour)
-                if i not in current_remove]
-
-            contour_remove = {}
-            for s in source_map:
-                if s[0] == 'contour':
-                    contour_remove.setdefault(s[1], set()).add(s[2])
-
-            for ci in sorted(contour_remove.keys(), reverse=True):
-                contour   = self.contours[ci]
-                points    = (contour['points']
-                             if isinstance(contour, dict) else contour)
-                remaining = [p for pi, p in enumerate(points)
-                             if pi not in contour_remove[ci]]
-                if len(remaining) < 2:
-                    self.contours.pop(ci)
-                else:
-                    sorted_rem = sorted(range(len(remaining)),
-                                        key=lambda i: remaining[i]['time'])
-                    self.contours[ci] = {
-                        'points':     remaining,
-                        'onset_idx':  sorted_rem[0],
-                        'offset_idx': sorted_rem[-1],
-                    }
-
-            self.contours.append({
-                'points':     extracted,
-                'onset_idx':  0,
-                'offset_idx': len(extracted) - 1,
-            })
-
             self.changes_made = True
             self._cancel_lasso()
             self.rebuild_annotations()
@@ -957,122 +1206,114 @@ class ChangepointAnnotator(BaseLayer):
         """Cancel lasso and clean up visual feedback."""
         self.lasso_mode   = False
         self.lasso_points = []
-        for line in self.lasso_lines:
-            try:
-                line.remove()
-            except Exception:
-                pass
-        self.lasso_lines = []
-        self.canvas.draw_idle()
-
-    def _point_in_polygon(self, x, y, polygon):
-        """Ray casting algorithm for point-in-polygon test."""
-        n      = len(polygon)
-        inside = False
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = ((y - p1y) * (p2x - p1x)
-                                       / (p2y - p1y) + p1x)
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        return inside
+        if self._lasso_line is not None and self._lasso_line.get_visible():
+            self._lasso_line.set_visible(False)
+            self._lasso_start.set_visible(False)
+            self.update_overlays()
 
     ##    <(''<)  <( ' ' )>  (>'')>
     # POINT LOOKUP HELPERS
     ##    <(''<)  <( ' ' )>  (>'')>
 
+    def _index_points(self):
+        """Rebuild the flat point lookup arrays from annotations.
+
+        Order matches the old nested search — current_contour first, then
+        each contour in turn — so first-match lookups return the same point.
+        """
+        cur_start = self._contour_offsets[-1]
+        sizes     = np.diff(self._contour_offsets)
+        n_current = len(self.annotations) - cur_start
+
+        points = np.concatenate((self.annotations[cur_start:],
+                                 self.annotations[:cur_start]))
+        self._all_points_t   = np.ascontiguousarray(points['time'])
+        self._all_points_f   = np.ascontiguousarray(points['freq'])
+        self._all_points_ref = np.column_stack((
+            np.concatenate((np.full(n_current, -1, dtype=np.intp),
+                            np.repeat(np.arange(len(sizes)), sizes))),
+            np.concatenate((np.arange(n_current),
+                            np.arange(cur_start) -
+                            np.repeat(self._contour_offsets[:-1], sizes))),
+        ))
+
+    def _point_at(self, ref):
+        """Return the point record for a (contour_idx, point_idx) ref."""
+        ci, pi = ref
+        if ci < 0:
+            return self.current_contour[pi]
+        return self.contours[ci]['points'][pi]
+
+    def _first_point_within(self, x, y, time_thresh, freq_thresh):
+        """Return the index of the first indexed point within thresholds, or None."""
+        if _NUMBA_AVAILABLE:
+            k = _nearest_point_kernel(self._all_points_t, self._all_points_f,
+                                      float(x), float(y),
+                                      float(time_thresh), float(freq_thresh))
+            return None if k < 0 else int(k)
+
+        mask = ((np.abs(self._all_points_t - x) < time_thresh) &
+                (np.abs(self._all_points_f - y) < freq_thresh))
+        if not mask.any():
+            return None
+        return int(np.argmax(mask))
+
     def _find_nearest_point(self, x, y, time_thresh, freq_thresh):
         """Return first point within thresholds, or None."""
-        for point in self.current_contour:
-            if (abs(point['time'] - x) < time_thresh and
-                    abs(point['freq'] - y) < freq_thresh):
-                return point
-        for contour in self.contours:
-            points = contour['points'] if isinstance(contour, dict) else contour
-            for point in points:
-                if (abs(point['time'] - x) < time_thresh and
-                        abs(point['freq'] - y) < freq_thresh):
-                    return point
-        return None
+        k = self._first_point_within(x, y, time_thresh, freq_thresh)
+        if k is None:
+            return None
+        return self._point_at(self._all_points_ref[k])
 
     def _find_point_info(self, x, y, time_thresh, freq_thresh):
         """Return dict with point and source info for Ctrl+Click matching."""
-        for i, point in enumerate(self.current_contour):
-            if (abs(point['time'] - x) < time_thresh and
-                    abs(point['freq'] - y) < freq_thresh):
-                return {'point': point, 'contour_idx': -1, 'point_idx': i}
-        for ci, contour in enumerate(self.contours):
-            points = contour['points'] if isinstance(contour, dict) else contour
-            for pi, point in enumerate(points):
-                if (abs(point['time'] - x) < time_thresh and
-                        abs(point['freq'] - y) < freq_thresh):
-                    return {'point': point, 'contour_idx': ci, 'point_idx': pi}
-        return None
+        k = self._first_point_within(x, y, time_thresh, freq_thresh)
+        if k is None:
+            return None
+        ci, pi = self._all_points_ref[k].tolist()
+        return {'point': self._point_at((ci, pi)),
+                'contour_idx': ci, 'point_idx': pi}
 
     def _remove_nearby_annotation(self, x, y):
         """Remove the closest point within 50ms / 100Hz threshold.
 
         Returns True if a point was removed.
         """
+        if not len(self._all_points_ref):
+            return False
+
         time_thresh = CONFIG["changepoint_time_thresh_s"]
         freq_thresh = CONFIG["changepoint_freq_thresh_hz"]
-        min_dist    = float('inf')
-        closest     = None
-        source      = None
-
-        for i, point in enumerate(self.current_contour):
-            dist = np.sqrt(
-                ((point['time'] - x) / time_thresh) ** 2 +
-                ((point['freq'] - y) / freq_thresh) ** 2)
-            if dist < 1.0 and dist < min_dist:
-                min_dist = dist
-                closest  = i
-                source   = 'current'
-
-        for ci, contour in enumerate(self.contours):
-            points = contour['points'] if isinstance(contour, dict) else contour
-            for pi, point in enumerate(points):
-                dist = np.sqrt(
-                    ((point['time'] - x) / time_thresh) ** 2 +
-                    ((point['freq'] - y) / freq_thresh) ** 2)
-                if dist < 1.0 and dist < min_dist:
-                    min_dist = dist
-                    closest  = (ci, pi)
-                    source   = 'contour'
-
-        if source == 'current':
-            self.current_contour.pop(closest)
-            self.changes_made = True
-            self.rebuild_annotations()
-            self.update_display(recompute_spec=False)
-            return True
+        dist = np.hypot((self._all_points_t - x) / time_thresh,
+                        (self._all_points_f - y) / freq_thresh)
+        k = int(np.argmin(dist))
+        if dist[k] >= 1.0:
+            return False
+
+        ci, pi      = self._all_points_ref[k].tolist()
+        title_stale = not self.changes_made
 
-        if source == 'contour':
-            ci, pi   = closest
-            contour  = self.contours[ci]
-            points   = (contour['points']
-                        if isinstance(contour, dict) else contour)
-            points.pop(pi)
+        if ci < 0:
+            self._mark_dirty()
+            self.current_contour = np.delete(self.current_contour, pi)
+        else:
+            self._mark_dirty(ci, ci + 1)
+            contour = self.contours[ci]
+            points  = np.delete(contour['points'], pi)
             if len(points) < 2:
                 self.contours.pop(ci)
             else:
-                if isinstance(contour, dict):
-                    onset_idx  = contour.get('onset_idx', 0)
-                    offset_idx = contour.get('offset_idx', len(points))
-                    contour['onset_idx']  = max(0, onset_idx  - (1 if pi <= onset_idx  else 0))
-                    contour['offset_idx'] = max(0, offset_idx - (1 if pi <= offset_idx else 0))
-            self.changes_made = True
-            self.rebuild_annotations()
-            self.update_display(recompute_spec=False)
-            return True
+                onset_idx  = contour.get('onset_idx', 0)
+                offset_idx = contour.get('offset_idx', len(points))
+                contour.update(_make_contour(
+                    points,
+                    max(0, onset_idx  - (1 if pi <= onset_idx  else 0)),
+                    max(0, offset_idx - (1 if pi <= offset_idx else 0))))
 
-        return False
+        self.changes_made = True
+        self.rebuild_annotations()
+        self._redraw_points(title_stale)
+        return True
 
     ##    <(''<)  <( ' ' )>  (>'')>
     # CLEAR ACTIONS
@@ -1080,27 +1321,33 @@ class ChangepointAnnotator(BaseLayer):
 
     def clear_last(self):
         """Remove last point from current_contour, or restore last finished contour."""
-        if self.current_contour:
-            self.current_contour.pop()
+        if len(self.current_contour):
+            self._mark_dirty()
+            self.current_contour = np.delete(
+                self.current_contour, self._last_clicked_index())
             self.changes_made = True
             self.rebuild_annotations()
             self.update_display(recompute_spec=False)
         elif self.contours:
+            self._mark_dirty(len(self.contours) - 1)
             last = self.contours.pop()
-            self.current_contour = (last['points'] if isinstance(last, dict)
-                                    else last)
+            self.current_contour = _sort_by_time(last['points'])
+            self.current_contour['label'] = _CHANGEPOINT
+            self._click_stack    = []
             self.changes_made = True
             self.rebuild_annotations()
             self.update_display(recompute_spec=False)
 
     def clear_all(self):
         """Clear all annotations after confirmation."""
-        if (self.annotations or self.current_contour):
+        if len(self.annotations):
             if messagebox.askyesno("Clear", "Remove all annotations?"):
-                self.annotations     = []
-                self.current_contour = []
+                self.current_contour = _empty_points()
+                self._click_stack    = []
                 self.contours        = []
+                self._reset_annotations()
                 self.changes_made    = True
+                self.rebuild_annotations()
                 self.update_display(recompute_spec=False)
 
     ##    <(''<)  <( ' ' )>  (>'')>
@@ -1164,10 +1411,16 @@ class ChangepointAnnotator(BaseLayer):
     ##    <(''<)  <( ' ' )>  (>'')>
 
     def find_next_skipped(self):
-        """Jump to the next file that is skipped or has no annotations."""
+        """Jump to the next file that is skipped or has no annotations.
+
+        Ignored while a background load is pending — the shown annotations
+        do not yet match current_file_idx, so they must not be saved.
+        """
         if not self.audio_files:
             messagebox.showinfo("No Audio", "Load audio files first")
             return
+        if self._pending_load is not None:
+            return
 
         start_idx = (self.current_file_idx + 1) % len(self.audio_files)
 
@@ -1208,48 +1461,12 @@ class ChangepointAnnotator(BaseLayer):
     def draw_custom_overlays(self):
         """Draw annotation points, guide lines, and bounding boxes."""
 
-        # Annotation points colored by label
-        for ann in self.annotations:
-            self.ax.scatter(
-                ann['time'], ann['freq'],
-                c=_LABEL_COLORS[ann['label']],
-                marker='.', s=100, linewidths=1, zorder=10
-            )
-
-        # Guide lines and text
-        if self.annotations and (self.show_time_guides.get() or
-                                  self.show_freq_guides.get()):
-            times = [a['time'] for a in self.annotations]
-            freqs = [a['freq'] for a in self.annotations]
-
-            if self.show_time_guides.get():
-                for t in times:
-                    self.ax.axvline(x=t, color='lime', linestyle='--',
-                                    linewidth=1.5, alpha=0.5)
-                    if not self.hide_text.get():
-                        self.ax.text(
-                            t, self.ax.get_ylim()[1] * 0.95,
-                            f"{t:.3f}s", color='lime', fontsize=9,
-                            rotation=90, va='top', ha='right',
-                            family='monospace', alpha=0.9)
-
-            if self.show_freq_guides.get():
-                for f in freqs:
-                    self.ax.axhline(y=f, color='yellow', linestyle='--',
-                                    linewidth=1.5, alpha=0.5)
-                    if not self.hide_text.get():
-                        self.ax.text(
-                            self.ax.get_xlim()[0] + 0.01, f,
-                            f"{f:.1f}Hz", color='yellow', fontsize=9,
-                            va='center', ha='left',
-                            family='monospace', alpha=0.9)
+        xy = self._update_point_artists()
 
         # Bounding box and harmonic overlays
-        if self.show_bounding_box.get() and self.annotations:
-            times  = [a['time'] for a in self.annotations]
-            freqs  = [a['freq'] for a in self.annotations]
-            t_min, t_max = min(times), max(times)
-            f_min, f_max = min(freqs), max(freqs)
+        if self.show_bounding_box.get() and len(self.annotations):
+            t_min, f_min = xy.min(axis=0)
+            t_max, f_max = xy.max(axis=0)
 
             self._draw_shape(t_min, t_max, f_min, f_max,
                              color='white', linewidth=2.5, alpha=0.8)
@@ -1273,6 +1490,100 @@ class ChangepointAnnotator(BaseLayer):
 
 
 
+    def _update_point_artists(self):
+        """Push the annotation points into the cached scatter and guide artists.
+
+        The artists are registered as blitted overlays, so they can be
+        refreshed by _redraw_points() without a full canvas draw.
+
+        Returns:
+            np.ndarray — (N, 2) array of (time, freq) for every annotation
+        """
+        self._ensure_overlay_artists()
+
+        # Kept in sync by rebuild_annotations() — contours, then current_contour
+        points = self.annotations
+        xy = np.column_stack((points['time'], points['freq']))
+
+        # One scatter; per-point RGBA gathered from the label-code LUT
+        self._point_scatter.set_offsets(xy)
+        self._point_scatter.set_facecolor(_LABEL_RGBA[points['label']])
+
+        # Guide lines span the full axis height/width in axes coordinates,
+        # so they stay valid across zoom without being rebuilt
+        show_time = len(points) > 0 and self.show_time_guides.get()
+        show_freq = len(points) > 0 and self.show_freq_guides.get()
+        self._time_guide_coll.set_segments(
+            _guide_segments(xy[:, 0]) if show_time else [])
+        self._freq_guide_coll.set_segments(
+            _guide_segments(xy[:, 1])[:, :, ::-1] if show_freq else [])
+        self._time_guide_coll.set_visible(show_time)
+        self._freq_guide_coll.set_visible(show_freq)
+
+        show_text = not self.hide_text.get()
+        self._time_guide_text.set_values(xy[:, 0] if show_time else ())
+        self._freq_guide_text.set_values(xy[:, 1] if show_freq else ())
+        self._time_guide_text.set_visible(show_time and show_text)
+        self._freq_guide_text.set_visible(show_freq and show_text)
+
+        # Re-register each pass — update_display() resets the overlay list
+        for artist in self._overlay_point_artists():
+            if artist not in self._overlay_artists:
+                self.register_overlay(artist)
+
+        return xy
+
+    def _redraw_points(self, title_stale=False):
+        """Refresh point overlays after a click edit by blitting only them.
+
+        Falls back to a full update_display() when the edit also changes
+        something drawn outside the blitted overlays: the bounding shapes,
+        or the title's save marker (title_stale).
+        """
+        if (title_stale or self.show_bounding_box.get() or
+                self._point_scatter is None or
+                self._point_scatter not in self.ax.collections):
+            self.update_display(recompute_spec=False)
+            return
+
+        self._update_point_artists()
+        self.update_overlays()
+
+    def _ensure_overlay_artists(self):
+        """Create the cached point and guide artists on first use.
+
+        Each guide axis is a single LineCollection plus a single
+        _GuideLabels, whatever the number of annotations. Redraws strip
+        every collection and artist from the axes (and ax.clear() detaches
+        them), so any cached artist no longer on self.ax is re-attached here
+        rather than rebuilt.
+        """
+        if self._point_scatter is None:
+            self._point_scatter = self.ax.scatter(
+                [], [], marker='.', s=100, linewidths=1, zorder=10)
+            self._time_guide_coll = LineCollection(
+                [], transform=self.ax.get_xaxis_transform(),
+                colors='lime', linestyles='--', linewidths=1.5, alpha=0.5)
+            self._freq_guide_coll = LineCollection(
+                [], transform=self.ax.get_yaxis_transform(),
+                colors='yellow', linestyles='--', linewidths=1.5, alpha=0.5)
+            self._time_guide_text = _GuideLabels('x', 'lime')
+            self._freq_guide_text = _GuideLabels('y', 'yellow')
+
+        for artist in (self._point_scatter,
+                       self._time_guide_coll, self._freq_guide_coll):
+            if artist not in self.ax.collections:
+                self.ax.add_collection(artist, autolim=False)
+        for artist in (self._time_guide_text, self._freq_guide_text):
+            if artist not in self.ax.artists:
+                self.ax.add_artist(artist)
+
+    def _overlay_point_artists(self):
+        """Cached artists refreshed by _update_point_artists()."""
+        return (self._point_scatter,
+                self._time_guide_coll, self._freq_guide_coll,
+                self._time_guide_text, self._freq_guide_text)
+
     def _draw_shape(self, t_min, t_max, f_min, f_max,
                     color, linewidth, alpha):
         """Draw rectangle, ellipse, or polygon bounding shape."""
@@ -1294,7 +1605,8 @@ class ChangepointAnnotator(BaseLayer):
 
         elif shape_type == 'polygon':
             from matplotlib.patches import Polygon
-            pts = [(a['time'], a['freq']) for a in self.annotations]
+            pts = np.column_stack((self.annotations['time'],
+                                   self.annotations['freq']))
             self.ax.add_patch(Polygon(
                 pts, closed=True,
                 fill=False, edgecolor=color,
@@ -1311,7 +1623,7 @@ class ChangepointAnnotator(BaseLayer):
         """
         if not self.bounding_boxes or not self.audio_files:
             return
-        current = str(self.audio_files[self.current_file_idx])
+        current = self._audio_paths_str[self.current_file_idx]
         _bb_colors = {'noise': 'red', 'signal': 'lime', 'artifact': 'orange'}
         for box in self.bounding_boxes:
             if box['audio_file'] != current:
@@ -1381,18 +1693,21 @@ class ChangepointAnnotator(BaseLayer):
     ##    <(''<)  <( ' ' )>  (>'')>
 
     def _update_stats(self):
-        """Update statistics label with onset/offset timing and frequency range."""
-        if not self.annotations:
+        """Update statistics label with onset/offset timing and frequency range.
+
+        Duration is taken from the first contour's onset_idx/offset_idx
+        points; the frequency range spans every point via the lookup index.
+        """
+        if not len(self.annotations):
             self.stats_label.config(text="No annotations")
             return
 
-        onset  = next((a for a in self.annotations if a['label'] == 'onset'),  None)
-        offset = next((a for a in self.annotations if a['label'] == 'offset'), None)
-
-        if onset and offset:
-            duration    = offset['time'] - onset['time']
-            freqs       = [a['freq'] for a in self.annotations]
-            delta_freq  = max(freqs) - min(freqs)
+        if self.contours:
+            first       = self.contours[0]
+            times       = first['points']['time']
+            duration    = (times[first.get('offset_idx', len(times) - 1)] -
+                           times[first.get('onset_idx', 0)])
+            delta_freq  = np.ptp(self._all_points_f)
             self.stats_label.config(
                 text=(f"Duration: {duration:.3f}s | "
                       f"ΔFreq: {delta_freq:.1f} Hz"))
@@ -1400,42 +1715,35 @@ class ChangepointAnnotator(BaseLayer):
             self.stats_label.config(text="Incomplete annotation")
 
     def _update_annotations_table(self):
-        """Refresh the scrollable contour summary table."""
-        for widget in self.annotations_inner_frame.winfo_children():
-            widget.destroy()
+        """Refresh the contour summary table."""
+        self.table.delete(*self.table.get_children())
 
         for idx, contour in enumerate(self.contours):
-            points = contour['points'] if isinstance(contour, dict) else contour
+            points = contour['points']
             if len(points) < 1:
                 continue
-
-            sorted_pts = sorted(points, key=lambda x: x['time'])
-            t_onset    = sorted_pts[0]['time']
-            t_offset   = sorted_pts[-1]['time']
-            all_freqs  = [p['freq'] for p in points]
-            f_min      = min(all_freqs)
-            f_max      = max(all_freqs)
-
-            row = ttk.Frame(self.annotations_inner_frame)
-            row.pack(fill=tk.X, pady=1)
-            for text, width in [
-                (f"{idx+1}",         3),
-                (f"{t_onset:.4f}",   7),
-                (f"{t_offset:.4f}",  7),
-                (f"{f_min:.0f}",     7),
-                (f"{f_max:.0f}",     7),
-            ]:
-                ttk.Label(row, text=text,
-                          font=('', 8), width=width).pack(side=tk.LEFT)
-
-        if self.current_contour:
-            unsaved_frame = ttk.Frame(self.annotations_inner_frame)
-            unsaved_frame.pack(fill=tk.X, pady=3)
-            ttk.Label(
-                unsaved_frame,
-                text=f"→ Current: {len(self.current_contour)} pts (unsaved)",
-                font=('', 8, 'italic'), foreground='orange'
-            ).pack(padx=5)
+            self.table.insert('', tk.END, values=(
+                f"{idx+1}",
+                f"{points['time'].min():.4f}",
+                f"{points['time'].max():.4f}",
+                f"{points['freq'].min():.0f}",
+                f"{points['freq'].max():.0f}",
+            ))
+
+        if len(self.current_contour):
+            self.table.insert('', tk.END, tags=('unsaved',), values=(
+                "→", f"{len(self.current_contour)} pts", "(unsaved)", "", ""))
+
+    def _on_table_wheel(self, event):
+        """Scroll the contour table by wheel units and stop propagation."""
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            units = int(-1 * (event.delta / 120))
+        self.table.yview_scroll(units, "units")
+        return "break"
 
     def _update_sequence_display(self):
         """Update sequence mode contour list."""
@@ -1446,16 +1754,13 @@ class ChangepointAnnotator(BaseLayer):
             return
 
         for i, contour in enumerate(self.contours):
-            points = contour['points'] if isinstance(contour, dict) else contour
+            points = contour['points']
             if len(points) < 2:
                 continue
 
-            onset_idx  = contour.get('onset_idx', 0) if isinstance(contour, dict) else 0
-            offset_idx = contour.get('offset_idx', len(points) - 1) if isinstance(contour, dict) else len(points) - 1
-
-            onset  = points[onset_idx]
-            offset = points[offset_idx]
-            freqs  = [p['freq'] for p in points]
+            onset  = points[contour.get('onset_idx', 0)]
+            offset = points[contour.get('offset_idx', len(points) - 1)]
+            freqs  = points['freq']
 
             row = ttk.Frame(self.sequence_inner_frame)
             row.pack(fill=tk.X, pady=1)
@@ -1463,8 +1768,8 @@ class ChangepointAnnotator(BaseLayer):
                 (f"{i+1}",                     3),
                 (f"{onset['time']:.3f}",        7),
                 (f"{offset['time']:.3f}",       7),
-                (f"{min(freqs):.0f}",           7),
-                (f"{max(freqs):.0f}",           7),
+                (f"{freqs.min():.0f}",          7),
+                (f"{freqs.max():.0f}",          7),
                 (f"{offset['time']-onset['time']:.3f}", 6),
                 (f"{len(points)}",              4),
             ]:
@@ -1507,12 +1812,17 @@ class ChangepointAnnotator(BaseLayer):
     # KEY STATE HELPER
     ##    <(''<)  <( ' ' )>  (>'')>
 
-    def _get_ctrl_state(self):
-        """Detect Ctrl key state. Windows-native via ctypes; fallback for others."""
-        if sys.platform == 'win32':
-            import ctypes
-            return bool(ctypes.windll.user32.GetKeyState(0x11) & 0x8000)
-        return False
+    def _get_ctrl_state(self, event):
+        """Detect Ctrl key state for a mouse event.
+
+        Reads the Control bit of the Tk event state, which Tk fills in on
+        every platform. Falls back to the modifier state tracked from key
+        events when there is no Tk event (e.g. synthesized events).
+        """
+        state = getattr(getattr(event, 'guiEvent', None), 'state', None)
+        if isinstance(state, int):
+            return bool(state & _TK_CONTROL_MASK)
+        return self._mod_state['ctrl']
 
     ##    <(''<)  <( ' ' )>  (>'')>
     # SAVE / LOAD
@@ -1536,25 +1846,18 @@ class ChangepointAnnotator(BaseLayer):
             SUFFIX_CHANGEPOINTS
         )
 
-        # Assign contour IDs at save time
-        contours_with_ids = []
-        for idx, contour in enumerate(self.contours):
-            c = dict(contour) if isinstance(contour, dict) else {
-                'points':     contour,
-                'onset_idx':  0,
-                'offset_idx': len(contour) - 1,
-            }
-            c['id'] = f"c{idx}"
-            contours_with_ids.append(c)
-
-        # Compute metrics at save time from current geometry
-        metrics = compute_contour_metrics(contours_with_ids)
+        # Compute metrics at save time from current geometry. Metrics read
+        # the POINT_DTYPE arrays directly — only the 'id' is refreshed, the
+        # per-point dict conversion is left to the streamed write below.
+        metrics = compute_contour_metrics(
+            {**contour, 'id': f"c{idx}"}
+            for idx, contour in enumerate(self.contours))
 
         # PSD params — changepoint annotator does not have its own PSD vars;
         # uses BaseLayer defaults via build_psd_params()
         tab_data = {
-            "audio_file":      str(self.audio_files[self.current_file_idx]),
-            "contours":        contours_with_ids,
+            "audio_file":      self._audio_paths_str[self.current_file_idx],
+            "contours":        self._iter_contours_for_save(),
             "contour_metrics": metrics,
             "spec_params":     build_spec_params(self, orientation="horizontal"),
             "psd_params":      build_psd_params(self),
@@ -1562,7 +1865,9 @@ class ChangepointAnnotator(BaseLayer):
             "skip_reason":     "",
         }
 
-        merge_and_save(path, tab_data)
+        # Contours are generated lazily and written in batches
+        if merge_and_save(path, tab_data, stream_key="contours"):
+            self._save_points_shadow(path, tab_data)
         self.changes_made        = False
         self.file_was_annotated  = True
         self._count_total_contours()
@@ -1571,11 +1876,72 @@ class ChangepointAnnotator(BaseLayer):
         logger.info("Saved %d contours to %s",
                     len(self.contours), path.name)
 
+    def _iter_contours_for_save(self):
+        """Yield contours in JSON save format, one at a time.
+
+        Contour IDs are assigned here as 'c{idx}'; points are converted
+        from POINT_DTYPE to [{'time', 'freq'}, ...].
+        """
+        for idx, contour in enumerate(self.contours):
+            c = dict(contour)
+            c['points'] = _points_list(contour['points'])
+            c['id'] = f"c{idx}"
+            yield c
+
+    def _save_points_shadow(self, path, tab_data):
+        """Write the contours as flat arrays to the .npz shadow of path.
+
+        Points of every contour are concatenated into times / freqs /
+        labels; contour_starts holds the first point index of each contour.
+        The remaining contour keys and the params go into the shadow meta.
+        """
+        sizes  = [len(c['points']) for c in self.contours]
+        points = np.concatenate(
+            [c['points'] for c in self.contours] + [_empty_points()])
+        arrays = {
+            'times':          points['time'],
+            'freqs':          points['freq'],
+            'labels':         points['label'],
+            'contour_starts': np.cumsum([0] + sizes, dtype=np.int64)[:-1],
+        }
+        meta = {
+            'spec_params': tab_data['spec_params'],
+            'psd_params':  tab_data['psd_params'],
+            'contours': [
+                {**{k: v for k, v in c.items() if k != 'points'},
+                 'id': f"c{idx}"}
+                for idx, c in enumerate(self.contours)
+            ],
+        }
+        save_shadow_arrays(path, arrays, meta)
+
+    def _rebuild_from_soa(self, times, freqs, labels, contour_starts,
+                          contour_meta):
+        """Rebuild self.contours from shadow arrays.
+
+        Contours are views into one POINT_DTYPE array; edits replace them
+        with fresh arrays (np.insert / np.delete), so no copy is needed.
+        """
+        points = np.empty(len(times), dtype=POINT_DTYPE)
+        points['time']  = times
+        points['freq']  = freqs
+        points['label'] = labels
+
+        for raw, chunk in zip(contour_meta,
+                              np.split(points, contour_starts[1:])):
+            contour = dict(raw)
+            contour.update(_make_contour(
+                chunk, raw.get('onset_idx', 0),
+                raw.get('offset_idx', len(chunk) - 1)))
+            self.contours.append(contour)
+
     def load_custom_data(self):
         """Load changepoint annotations from _changepoints.json.
 
-        Handles both new dict format (onset_idx/offset_idx) and old list
-        format (converted inline — no separate conversion function needed).
+        Prefers the .npz shadow written at save time when it is not older
+        than the JSON. Handles both new dict format (onset_idx/offset_idx)
+        and old list format (converted inline — no separate conversion
+        function needed).
         """
         if not self.audio_files or self.annotation_dir is None:
             return
@@ -1587,35 +1953,49 @@ class ChangepointAnnotator(BaseLayer):
             SUFFIX_CHANGEPOINTS
         )
 
-        self.annotations     = []
-        self.current_contour = []
+        self.current_contour = _empty_points()
+        self._click_stack    = []
         self.contours        = []
+        self._reset_annotations()
+
+        # Fresh binary shadow first — skips parsing the JSON entirely
+        shadow = load_shadow_arrays(path)
+        if shadow is not None:
+            arrays, meta = shadow
+            check_params(meta, path, self, SUFFIX_CHANGEPOINTS,
+                         self.annotation_dir)
+            self._rebuild_from_soa(
+                arrays['times'], arrays['freqs'], arrays['labels'],
+                arrays['contour_starts'], meta.get('contours', []))
+        else:
+            data = load_and_check_params(
+                path, self, SUFFIX_CHANGEPOINTS, self.annotation_dir)
 
-        data = load_and_check_params(
-            path, self, SUFFIX_CHANGEPOINTS, self.annotation_dir)
-
-        if not data:
-            self.file_was_annotated = False
-            return
+            if not data:
+                self.file_was_annotated = False
+                return
 
-        raw_contours = data.get('contours', [])
-
-        for raw in raw_contours:
-            if isinstance(raw, dict) and 'points' in raw:
-                # New dict format — use directly
-                self.contours.append(raw)
-            elif isinstance(raw, list) and len(raw) > 0:
-                # (つ -' _ '- )つ    (つ -' _ '- )つ
-                # FALLBACK: old list format — convert inline to dict format
-                # onset_idx=0 (first by time), offset_idx=len-1 (last by time)
-                # TODO: flag as fallback for tracking legacy file conversion
-                # (つ -' _ '- )つ    (つ -' _ '- )つ
-                sorted_pts = sorted(raw, key=lambda x: x['time'])
-                self.contours.append({
-                    'points':     sorted_pts,
-                    'onset_idx':  0,
-                    'offset_idx': len(sorted_pts) - 1,
-                })
+            raw_contours = data.get('contours', [])
+
+            for raw in raw_contours:
+                if isinstance(raw, dict) and 'points' in raw:
+                    # New dict format — keep extra keys, points to POINT_DTYPE
+                    points  = _points_array(raw['points'])
+                    contour = dict(raw)
+                    contour.update(_make_contour(
+                        points,
+                        raw.get('onset_idx', 0),
+                        raw.get('offset_idx', len(points) - 1)))
+                    self.contours.append(contour)
+                elif isinstance(raw, list) and len(raw) > 0:
+                    # (つ -' _ '- )つ    (つ -' _ '- )つ
+                    # FALLBACK: old list format — convert inline to dict format
+                    # onset_idx=0 (first by time), offset_idx=len-1 (last by time)
+                    # TODO: flag as fallback for tracking legacy file conversion
+                    # (つ -' _ '- )つ    (つ -' _ '- )つ
+                    sorted_pts = _sort_by_time(_points_array(raw))
+                    self.contours.append(
+                        _make_contour(sorted_pts, 0, len(sorted_pts) - 1))
 
         self.file_was_annotated = bool(self.contours)
 
@@ -1679,8 +2059,11 @@ class ChangepointAnnotator(BaseLayer):
         out_dir.mkdir(parents=True, exist_ok=True)       # BBUPDATE — create target if missing
 
         out_path = out_dir / "bounding_box.json"
-        with open(out_path, 'w') as f:
-            json.dump({'boxes': self.bounding_boxes}, f, indent=2)
+        if not annotation_io.save_annotation_file(
+                out_path, {'boxes': self.bounding_boxes}):
+            messagebox.showerror("Save Failed",
+                                 f"Could not write {out_path.name}")
+            return
 
         self.changes_made = False
         logger.info("Saved %d bounding boxes to %s",
@@ -34,6 +34,11 @@ Valley boundary schema (parallel arrays, self-contained per boundary):
 Ridge schema (parallel arrays, matching valley boundary format):
     {"times": [...], "freqs": [...]}
 
+    In memory, ridges, contours, and valley boundaries hold np.ndarray
+    values under the same keys. The arrays go to annotation_io as-is
+    (orjson serializes them natively) and come back as lists
+    (_series_to_json / _series_from_json).
+
 Annotation file: {prefix}_{stem}_harmonics.json
     Written via annotation_io.merge_and_save() — preserves other tab data.
 """
@@ -43,8 +48,10 @@ import logging
 import traceback
 
 import numpy as np
+from numpy.polynomial import polynomial as P
+from scipy.ndimage import uniform_filter1d
 from scipy.signal import find_peaks, savgol_filter
-from scipy.interpolate import UnivariateSpline
+from scipy.interpolate import splev, splrep
 
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -67,6 +74,18 @@ try:
 except ImportError:
     _PEAK_RATIO_AVAILABLE = False
 
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+# OPTIONAL NUMBA RIDGE KERNELS
+# When numba is importable, the max / peaks / centroid / parabolic ridge
+# methods run for every harmonic and frame in one compiled parallel sweep
+# (_ridge_all_harmonics) instead of per-harmonic NumPy or find_peaks() calls.
+# (つ -' _ '- )つ    (つ -' _ '- )つ
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 from yaaat.config import CONFIG
@@ -88,6 +107,164 @@ _BAND_FILL_ALPHA   = 0.15
 _RIDGE_LINE_ALPHA  = 0.7
 _VALLEY_LINE_ALPHA = 0.4
 
+# Quiet period after the last slider tick before ridges/contours recompute
+_SLIDER_RECOMPUTE_DELAY_MS = 60
+
+# dB -> linear amplitude as a power of two: 10 ** (x / 20) == 2 ** (x * this)
+_LOG2_10_OVER_20 = np.float32(np.log2(10) / 20)
+
+
+# Method ids understood by _ridge_all_harmonics
+_RIDGE_METHOD_IDS = {'max': 0, 'peaks': 1, 'centroid': 2, 'parabolic': 3}
+
+
+if _NUMBA_AVAILABLE:
+    @numba.njit(nogil=True, cache=True)
+    def _frame_argmax(S_db, lo, hi, t):
+        """First index of the maximum of S_db[lo:hi, t]."""
+        best = lo
+        for i in range(lo + 1, hi):
+            if S_db[i, t] > S_db[best, t]:
+                best = i
+        return best
+
+    @numba.njit(nogil=True, cache=True)
+    def _frame_peak(S_db, freqs, lo, hi, t, expected_freq, prominence):
+        """Prominent peak in S_db[lo:hi, t] nearest expected_freq, or -1.
+
+        Mirrors find_peaks(band, prominence=prominence): local maxima with
+        plateaus resolved to their middle sample, prominence measured
+        against the lowest sample on each side before a higher one.
+        """
+        found     = -1
+        best_dist = np.inf
+        i = lo + 1
+        while i < hi - 1:
+            if S_db[i - 1, t] < S_db[i, t]:
+                ahead = i + 1
+                while ahead < hi - 1 and S_db[ahead, t] == S_db[i, t]:
+                    ahead += 1
+                if S_db[ahead, t] < S_db[i, t]:
+                    peak = (i + ahead - 1) // 2
+                    v    = S_db[peak, t]
+
+                    left_min = v
+                    j = peak
+                    while j >= lo and S_db[j, t] <= v:
+                        left_min = min(left_min, S_db[j, t])
+                        j -= 1
+                    right_min = v
+                    j = peak
+                    while j < hi and S_db[j, t] <= v:
+                        right_min = min(right_min, S_db[j, t])
+                        j += 1
+
+                    if v - max(left_min, right_min) >= prominence:
+                        dist = abs(freqs[peak] - expected_freq)
+                        if dist < best_dist:
+                            best_dist = dist
+                            found     = peak
+                    i = ahead
+            i += 1
+        return found
+
+    @numba.njit(parallel=True, nogil=True, cache=True)
+    def _ridge_all_harmonics(S_db, freqs, los, his, expected_freqs,
+                             method_id, prominence):
+        """Ridge frequency of every harmonic at every frame.
+
+        One prange over all (harmonic, frame) pairs — harmonics alone
+        (usually <= 5) are too few to keep every core busy. method_id
+        follows _RIDGE_METHOD_IDS; each harmonic searches S_db[los[h]:his[h]].
+
+        Returns:
+            np.ndarray — (H, T) float64, NaN where a frame has no ridge point
+        """
+        n_harm   = expected_freqs.shape[0]
+        n_frames = S_db.shape[1]
+        out      = np.full((n_harm, n_frames), np.nan)
+        step     = freqs[1] - freqs[0]
+        for k in numba.prange(n_harm * n_frames):
+            h  = k // n_frames
+            t  = k - h * n_frames
+            lo = los[h]
+            hi = his[h]
+            if hi <= lo:
+                continue
+
+            if method_id == 0:
+                out[h, t] = freqs[_frame_argmax(S_db, lo, hi, t)]
+
+            elif method_id == 1:
+                peak = _frame_peak(S_db, freqs, lo, hi, t,
+                                   expected_freqs[h], prominence)
+                if peak >= 0:
+                    out[h, t] = freqs[peak]
+
+            elif method_id == 2:
+                num = 0.0
+                den = 0.0
+                for i in range(lo, hi):
+                    linear = 10.0 ** (S_db[i, t] / 20.0)
+                    num += freqs[i] * linear
+                    den += linear
+                if den > 0:
+                    out[h, t] = num / den
+
+            else:
+                peak = _frame_argmax(S_db, lo, hi, t)
+                if lo < peak < hi - 1:
+                    y1 = S_db[peak - 1, t]
+                    y2 = S_db[peak, t]
+                    y3 = S_db[peak + 1, t]
+                    denom = 2 * (2 * y2 - y1 - y3)
+                    p = (y3 - y1) / denom if abs(denom) > 1e-12 else 0.0
+                    out[h, t] = freqs[peak] + p * step
+        return out
+
+
+# Set once the ridge kernels have been compiled or loaded from numba's cache
+_RIDGE_KERNELS_WARM = False
+
+
+def _warm_ridge_kernels():
+    """Materialize the compiled ridge kernels before they are first needed.
+
+    Runs _ridge_all_harmonics once on a tiny input with the argument types
+    detect_harmonic_ridges() passes (Fortran-ordered float32 S_db, float64
+    freqs, contiguous int64 bounds), so the JIT compile — or the load from numba's on-disk cache —
+    happens at startup rather than on the first Detect F0. Numba types
+    read-only arrays separately, so it also runs with the read-only freqs
+    the cached mel filterbank returns. One-shot; a no-op without numba.
+    """
+    global _RIDGE_KERNELS_WARM
+    if _RIDGE_KERNELS_WARM or not _NUMBA_AVAILABLE:
+        return
+    _RIDGE_KERNELS_WARM = True
+    try:
+        freqs_ro = np.arange(4, dtype=np.float64)
+        freqs_ro.setflags(write=False)
+        for freqs in (np.arange(4, dtype=np.float64), freqs_ro):
+            _ridge_all_harmonics(
+                np.zeros((4, 4), dtype=np.float32, order='F'),
+                freqs,
+                np.array([0], dtype=np.int64), np.array([4], dtype=np.int64),
+                np.array([1.0]), 0, 1.0)
+    except Exception as e:
+        logger.warning("Ridge kernel warmup failed: %s", e)
+
+
+def _series_to_json(series):
+    """{'times', 'freqs'} -> contiguous arrays annotation_io serializes directly."""
+    return {'times': np.ascontiguousarray(series['times']),
+            'freqs': np.ascontiguousarray(series['freqs'])}
+
+
+def _series_from_json(series):
+    """Parallel lists from JSON -> {'times': ndarray, 'freqs': ndarray}."""
+    return {'times': np.asarray(series.get('times', []), dtype=float),
+            'freqs': np.asarray(series.get('freqs', []), dtype=float)}
+
 
 ##    <(''<)  <( ' ' )>  (>'')>
 
@@ -107,12 +284,12 @@ class HarmonicAnnotator(BaseLayer):
         # harmonic_lines: list of dicts — one per active harmonic
         #   {'freq': float, 'num': int, 'line': matplotlib Line2D or None}
         # harmonic_ridges: dict keyed by harmonic number (int)
-        #   {1: {'times': [...], 'freqs': [...]}, ...}
+        #   {1: {'times': ndarray, 'freqs': ndarray}, ...}
         # valley_boundaries: dict keyed by boundary name string
-        #   {'dynamic_lower': {'times': [...], 'freqs': [...]},
+        #   {'dynamic_lower': {'times': ndarray, 'freqs': ndarray},
         #    'h1_h2': {...}, 'dynamic_upper': {...}}
         # harmonic_contours: dict keyed by harmonic number
-        #   {1: {'times': [...], 'freqs': [...]}, ...}
+        #   {1: {'times': ndarray, 'freqs': ndarray}, ...}
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
         self.harmonic_lines     = []
@@ -121,10 +298,52 @@ class HarmonicAnnotator(BaseLayer):
         self.harmonic_contours  = {}
         self.detected_f0        = None
         self.mean_spectrum      = None
+        self._mean_spec_src     = None   # S_db that mean_spectrum was taken from
+
+        # Fortran-ordered float32 copy of S_db for per-frame column access,
+        # and the S_db array it was made from
+        self._S_db_FT           = None
+        self._S_db_FT_src       = None
 
         # Peak ratio analysis result — stored for saving when method is active
         self.peak_ratio_result  = None
 
+        # Ridge search bands: {(expected_freq, tol_fraction): (lo, hi)} bin
+        # bounds into self.freqs, and the frequency bin width. Both belong to
+        # the freqs array in _band_cache_freqs and reset when it changes.
+        self._band_cache        = {}
+        self._band_cache_freqs  = None
+        self._freq_step         = None
+
+        # Contour fits: spline {(harm_num, n_points, s): tck} and polynomial
+        # {(harm_num, n_points, order): coeffs}. Ridges are replaced
+        # wholesale on detection/load, which clears both.
+        self._spline_cache      = {}
+        self._polyfit_cache     = {}
+
+        # Finished contours: {(harm_num, method, smoothness):
+        # (ridge times, ridge freqs, contour)}. A hit requires the ridge
+        # arrays to be the very same objects; cleared with the fit caches.
+        self._contour_cache     = {}
+
+        # Debounced slider recompute: pending root.after id, and whether the
+        # pending job must re-detect ridges (tolerance) or only contours.
+        self._pending_recompute = None
+        self._pending_redetect  = False
+
+        # Artists reused across draw_custom_overlays() passes:
+        #   _line_cache 'h' / 'ridge' / 'contour': Line2D by harmonic number
+        #   _line_cache 'valley': Line2D by valley boundary name
+        #   _label_cache: Hz label Text by harmonic number
+        # Each pass re-attaches the artists it draws and drops the rest. The
+        # h/ridge/contour lines and the labels are blitted overlays, so
+        # drags and contour-only slider changes update them in place.
+        self._line_cache        = {'h': {}, 'ridge': {}, 'contour': {}, 'valley': {}}
+        self._label_cache       = {}
+
+        # Row strings currently shown in harmonics_listbox
+        self._harmonics_list_rows = []
+
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # DRAG STATE
         # selected_line: reference to the harmonic_lines entry being dragged
@@ -134,6 +353,10 @@ class HarmonicAnnotator(BaseLayer):
         self.selected_line  = None
         self.drag_start_y   = None
 
+        # Harmonic line whose drag redraw is queued with after_idle, or None.
+        # Motion events between idle cycles only update its frequency.
+        self._pending_drag_line = None
+
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # DETECTION PARAMETERS — tk vars bound to UI controls
         # (つ -' _ '- )つ    (つ -' _ '- )つ
@@ -172,11 +395,20 @@ class HarmonicAnnotator(BaseLayer):
         self.show_valleys       = tk.BooleanVar(value=False)
         self.show_bands         = tk.BooleanVar(value=True)
 
+        # Plain mirrors (self._show_ridges etc.) read by the redraw and ridge
+        # detection paths instead of a Tcl round-trip per .get()
+        for var_name in ('show_ridges', 'show_valleys', 'show_bands',
+                         'show_contour', 'ridge_method'):
+            self._shadow_tk_var(var_name)
+
         super().__init__(root)
 
         if isinstance(root, tk.Tk):
             self.root.title("Harmonic Annotator - YAAAT")
 
+        # Compile ridge kernels once the window is up, not on first detection
+        self.root.after_idle(_warm_ridge_kernels)
+
     ##    <(''<)  <( ' ' )>  (>'')>
     # CUSTOM CONTROLS
     ##    <(''<)  <( ' ' )>  (>'')>
@@ -386,6 +618,9 @@ class HarmonicAnnotator(BaseLayer):
 
     def process_audio(self):
         """Auto-detect F0 when a new file is loaded."""
+        self._mean_spec_src = None
+        self._S_db_FT       = None
+        self._S_db_FT_src   = None
         if self.y is not None:
             self.detect_f0()
 
@@ -404,20 +639,24 @@ class HarmonicAnnotator(BaseLayer):
         if self.S_db is None:
             return
 
-        self.mean_spectrum = np.mean(self.S_db, axis=1)
+        self._sync_band_cache()
+        # Prominence / range tweaks re-run detection on the same spectrogram
+        if self._mean_spec_src is not self.S_db:
+            self.mean_spectrum  = np.mean(self.S_db, axis=1, dtype=np.float32)
+            self._mean_spec_src = self.S_db
 
-        # Mask to detection frequency range
-        freq_mask = (
-            (self.freqs >= self.freq_min.get()) &
-            (self.freqs <= self.freq_max.get())
-        )
-        masked_spectrum = self.mean_spectrum.copy()
-        masked_spectrum[~freq_mask] = -np.inf
+        # Detection frequency range is one contiguous run of bins. Search only
+        # that run, bracketed by a single -inf bin each side so band-edge bins
+        # can still be peaks and prominence bases stop at the band edge.
+        lo = int(np.searchsorted(self.freqs, self.freq_min.get(), side='left'))
+        hi = int(np.searchsorted(self.freqs, self.freq_max.get(), side='right'))
+        band_spectrum = np.concatenate(
+            ([-np.inf], self.mean_spectrum[lo:hi], [-np.inf]))
 
         peaks, properties = find_peaks(
-            masked_spectrum,
+            band_spectrum,
             prominence=self.prominence.get(),
-            distance=max(5, int(50 / (self.freqs[1] - self.freqs[0])))
+            distance=max(5, int(50 / self._freq_step))
         )
 
         if len(peaks) == 0:
@@ -425,24 +664,25 @@ class HarmonicAnnotator(BaseLayer):
             self.info_label.config(text="No peaks found")
             return
 
-        # Use strongest peak as F0
-        strongest_idx = peaks[np.argmax(masked_spectrum[peaks])]
+        # Use strongest peak as F0 — band index 1 is freqs index lo
+        strongest_idx = lo - 1 + peaks[np.argmax(band_spectrum[peaks])]
         self.detected_f0 = float(self.freqs[strongest_idx])
 
-        # Reset harmonic lines to H1 only
+        # Reset harmonic lines to H1 only — earlier bands no longer apply
+        self._band_cache.clear()
         self.harmonic_lines = [{
             'freq': self.detected_f0,
             'num':  1,
             'line': None
         }]
 
-        if self.show_ridges.get():
+        if self._show_ridges:
             self.detect_harmonic_ridges()
 
         # Valley boundaries require ridges to be computed first
         self._compute_valley_boundaries()
 
-        if self.show_contour.get():
+        if self._show_contour:
             self.compute_contours()
 
         self.update_display()
@@ -464,7 +704,7 @@ class HarmonicAnnotator(BaseLayer):
         if self.detected_f0 is None or self.S_db is None:
             return
 
-        method = self.ridge_method.get()
+        method = self._ridge_method
 
         dispatch = {
             'max':        self._detect_ridges_max,
@@ -479,145 +719,219 @@ class HarmonicAnnotator(BaseLayer):
             logger.warning("Unknown ridge method: %s", method)
             return
 
-        raw_ridges = fn()
+        if _NUMBA_AVAILABLE and method in _RIDGE_METHOD_IDS:
+            raw_ridges = self._detect_ridges_compiled(method)
+        else:
+            raw_ridges = fn()
 
-        # Convert list-of-tuples to parallel array dicts for consistent storage
-        # [(time, freq), ...] -> {'times': [...], 'freqs': [...]}
-        self.harmonic_ridges = {}
-        for harm_num, ridge in raw_ridges.items():
-            if ridge:
-                times, freqs = zip(*ridge)
-                self.harmonic_ridges[harm_num] = {
-                    'times': list(times),
-                    'freqs': list(freqs),
-                }
+        # (times, freqs) arrays -> parallel array dicts, no per-point copies
+        self._spline_cache.clear()
+        self._polyfit_cache.clear()
+        self._contour_cache.clear()
+        self.harmonic_ridges = {
+            harm_num: {'times': times, 'freqs': freqs}
+            for harm_num, (times, freqs) in raw_ridges.items()
+            if len(times)
+        }
 
-        if self.show_contour.get():
+        if self._show_contour:
             self.compute_contours()
 
+    def _band_bounds(self, expected_freq, tol_fraction):
+        """Return (lo, hi) so that freqs[lo:hi] lies within expected_freq ± tolerance.
+
+        tolerance = expected_freq * tol_fraction. Same bins as the
+        (freqs >= f - tol) & (freqs <= f + tol) mask, found by binary search
+        on the ascending frequency axis and cached per (freq, fraction).
+        """
+        self._sync_band_cache()
+        key    = (expected_freq, tol_fraction)
+        bounds = self._band_cache.get(key)
+        if bounds is None:
+            tolerance = expected_freq * tol_fraction
+            bounds = (
+                int(np.searchsorted(self.freqs, expected_freq - tolerance, side='left')),
+                int(np.searchsorted(self.freqs, expected_freq + tolerance, side='right')),
+            )
+            self._band_cache[key] = bounds
+        return bounds
+
+    def _sync_band_cache(self):
+        """Drop cached band bounds and bin width if self.freqs was replaced."""
+        if self._band_cache_freqs is not self.freqs:
+            self._band_cache       = {}
+            self._band_cache_freqs = self.freqs
+            self._freq_step        = float(self.freqs[1] - self.freqs[0])
+
+    def _frame_major_S_db(self):
+        """Fortran-ordered S_db, rebuilt only when S_db is replaced.
+
+        Each frame S_db[:, t] is a contiguous column in it, which the
+        per-frame peak search and the compiled kernels walk bin by bin.
+        """
+        if self._S_db_FT_src is not self.S_db:
+            self._S_db_FT     = np.asfortranarray(
+                self.S_db.astype(np.float32, copy=False))
+            self._S_db_FT_src = self.S_db
+        return self._S_db_FT
+
+    def _detect_ridges_compiled(self, method):
+        """Run one ridge method for all harmonics via _ridge_all_harmonics.
+
+        Band bounds use the same tolerance per method as the NumPy paths.
+
+        Returns:
+            dict — {harm_num: (times, freqs)} arrays for frames with a ridge
+        """
+        tol_fraction = {
+            'max':       0.1,
+            'peaks':     self.peak_tolerance.get(),
+            'centroid':  0.15,
+            'parabolic': 0.1,
+        }[method]
+        bounds = np.array([self._band_bounds(h['freq'], tol_fraction)
+                           for h in self.harmonic_lines],
+                          dtype=np.int64).reshape(-1, 2)
+        # Contiguous copies — the column views are 'A'-layout and would
+        # compile a second specialization beside the warmed one
+        los = np.ascontiguousarray(bounds[:, 0])
+        his = np.ascontiguousarray(bounds[:, 1])
+
+        ridge_freqs = _ridge_all_harmonics(
+            self._frame_major_S_db(), self.freqs, los, his,
+            self._harmonic_freqs(),
+            _RIDGE_METHOD_IDS[method], float(self.prominence.get()))
+
+        ridges = {}
+        for h, freqs in zip(self.harmonic_lines, ridge_freqs):
+            found = ~np.isnan(freqs)
+            if found.any():
+                ridges[h['num']] = (self.times[found], freqs[found])
+        return ridges
+
     def _detect_ridges_max(self):
-        """Ridge detection via maximum search within a 10% tolerance window."""
+        """Ridge detection via maximum search within a 10% tolerance window.
+
+        One argmax over the band for all frames at once.
+
+        Returns:
+            dict — {harm_num: (times, freqs)} arrays, one entry per frame
+        """
         ridges = {}
         for h in self.harmonic_lines:
-            harm_num      = h['num']
             expected_freq = h['freq']
-            tolerance     = expected_freq * 0.1
-            ridge         = []
+            lo, hi        = self._band_bounds(expected_freq, 0.1)
+            if hi <= lo:
+                continue
 
-            for t_idx in range(self.S_db.shape[1]):
-                spectrum  = self.S_db[:, t_idx]
-                freq_mask = (
-                    (self.freqs >= expected_freq - tolerance) &
-                    (self.freqs <= expected_freq + tolerance)
-                )
-                if np.any(freq_mask):
-                    search_idx   = np.where(freq_mask)[0]
-                    local_max    = np.argmax(spectrum[freq_mask])
-                    freq_idx     = search_idx[local_max]
-                    ridge.append((self.times[t_idx], self.freqs[freq_idx]))
-
-            if ridge:
-                ridges[harm_num] = ridge
+            freq_idx = lo + np.argmax(self.S_db[lo:hi, :], axis=0)
+            ridges[h['num']] = (self.times, self.freqs[freq_idx])
 
         return ridges
 
     def _detect_ridges_peaks(self):
-        """Ridge detection via prominence-based peak search within tolerance window."""
-        ridges = {}
+        """Ridge detection via prominence-based peak search within tolerance window.
+
+        find_peaks() on each frame's band slice.
+
+        Returns:
+            dict — {harm_num: (times, freqs)} arrays for frames with a peak
+        """
+        ridges     = {}
+        prominence = self.prominence.get()
+        S_ft       = self._frame_major_S_db()
         for h in self.harmonic_lines:
-            harm_num      = h['num']
             expected_freq = h['freq']
-            tolerance     = expected_freq * self.peak_tolerance.get()
-            ridge         = []
+            lo, hi        = self._band_bounds(
+                expected_freq, self.peak_tolerance.get())
+            if hi <= lo:
+                continue
 
+            freq_idx   = np.full(self.S_db.shape[1], -1, dtype=np.int64)
+            band_freqs = self.freqs[lo:hi]
             for t_idx in range(self.S_db.shape[1]):
-                spectrum  = self.S_db[:, t_idx]
-                freq_mask = (
-                    (self.freqs >= expected_freq - tolerance) &
-                    (self.freqs <= expected_freq + tolerance)
-                )
-                if np.any(freq_mask):
-                    search_idx     = np.where(freq_mask)[0]
-                    local_spectrum = spectrum[freq_mask]
-                    peaks, _       = find_peaks(local_spectrum,
-                                               prominence=self.prominence.get())
-                    if len(peaks) > 0:
-                        peak_freqs  = self.freqs[search_idx[peaks]]
-                        closest     = np.argmin(np.abs(peak_freqs - expected_freq))
-                        freq_idx    = search_idx[peaks[closest]]
-                        ridge.append((self.times[t_idx], self.freqs[freq_idx]))
-
-            if ridge:
-                ridges[harm_num] = ridge
+                peaks, _ = find_peaks(S_ft[lo:hi, t_idx],
+                                      prominence=prominence)
+                if len(peaks) > 0:
+                    closest = np.argmin(np.abs(band_freqs[peaks] - expected_freq))
+                    freq_idx[t_idx] = lo + peaks[closest]
+
+            found = freq_idx >= 0
+            if found.any():
+                ridges[h['num']] = (self.times[found], self.freqs[freq_idx[found]])
 
         return ridges
 
     def _detect_ridges_centroid(self):
-        """Ridge detection via spectral centroid within a 15% tolerance window."""
+        """Ridge detection via spectral centroid within a 15% tolerance window.
+
+        dB -> linear for the whole band in one exp2 call, then one
+        frequency-weighted sum (GEMV) over all frames, in float32. Each
+        frame is shifted to a 0 dB peak first; the centroid is scale
+        invariant and the weights then stay in (0, 1].
+
+        Returns:
+            dict — {harm_num: (times, freqs)} arrays for frames with energy
+        """
         ridges = {}
         for h in self.harmonic_lines:
-            harm_num      = h['num']
             expected_freq = h['freq']
-            tolerance     = expected_freq * 0.15
-            ridge         = []
-
-            for t_idx in range(self.S_db.shape[1]):
-                spectrum  = self.S_db[:, t_idx]
-                freq_mask = (
-                    (self.freqs >= expected_freq - tolerance) &
-                    (self.freqs <= expected_freq + tolerance)
-                )
-                if np.any(freq_mask):
-                    search_idx     = np.where(freq_mask)[0]
-                    local_spectrum = spectrum[freq_mask]
-                    freq_values    = self.freqs[search_idx]
-
-                    # Convert dB to linear for centroid computation
-                    linear         = 10 ** (local_spectrum / 20)
-                    total_energy   = np.sum(linear)
-                    if total_energy > 0:
-                        centroid = np.sum(freq_values * linear) / total_energy
-                        ridge.append((self.times[t_idx], centroid))
-
-            if ridge:
-                ridges[harm_num] = ridge
+            lo, hi        = self._band_bounds(expected_freq, 0.15)
+            if hi <= lo:
+                continue
+
+            # 10 ** (dB / 20) == 2 ** (dB * log2(10) / 20), in place on
+            # the one band-sized temporary
+            band   = self.S_db[lo:hi, :]
+            linear = np.subtract(band, band.max(axis=0), dtype=np.float32)
+            np.multiply(linear, _LOG2_10_OVER_20, out=linear)
+            np.exp2(linear, out=linear)
+            total_energy = linear.sum(axis=0)
+            weighted     = self.freqs[lo:hi].astype(np.float32) @ linear
+
+            valid = total_energy > 0
+            if valid.any():
+                ridges[h['num']] = (self.times[valid],
+                                    weighted[valid] / total_energy[valid])
 
         return ridges
 
     def _detect_ridges_parabolic(self):
-        """Ridge detection via parabolic interpolation around spectral peak."""
+        """Ridge detection via parabolic interpolation around spectral peak.
+
+        Three-tap interpolation for all frames at once: argmax over the band,
+        then the neighbours on either side gathered per frame. Frames whose
+        peak sits on the band edge have no neighbour pair and are dropped.
+
+        Returns:
+            dict — {harm_num: (times, freqs)} arrays for interior-peak frames
+        """
         ridges = {}
         for h in self.harmonic_lines:
-            harm_num      = h['num']
             expected_freq = h['freq']
-            tolerance     = expected_freq * 0.1
-            ridge         = []
-
-            for t_idx in range(self.S_db.shape[1]):
-                spectrum  = self.S_db[:, t_idx]
-                freq_mask = (
-                    (self.freqs >= expected_freq - tolerance) &
-                    (self.freqs <= expected_freq + tolerance)
-                )
-                if np.any(freq_mask):
-                    search_idx     = np.where(freq_mask)[0]
-                    local_spectrum = spectrum[freq_mask]
-                    peak_idx       = np.argmax(local_spectrum)
-
-                    if 0 < peak_idx < len(local_spectrum) - 1:
-                        y1 = local_spectrum[peak_idx - 1]
-                        y2 = local_spectrum[peak_idx]
-                        y3 = local_spectrum[peak_idx + 1]
-
-                        # Parabolic peak offset formula
-                        p        = (y3 - y1) / (2 * (2 * y2 - y1 - y3))
-                        freq_idx = search_idx[peak_idx]
-                        freq_step = self.freqs[1] - self.freqs[0]
-                        interp_freq = self.freqs[freq_idx] + p * freq_step
-                        ridge.append((self.times[t_idx], interp_freq))
-
-            if ridge:
-                ridges[harm_num] = ridge
+            lo, hi        = self._band_bounds(expected_freq, 0.1)
+            if hi <= lo:
+                continue
+
+            band     = self.S_db[lo:hi, :]
+            peak_idx = np.argmax(band, axis=0)
+            interior = (peak_idx > 0) & (peak_idx < band.shape[0] - 1)
+            if not interior.any():
+                continue
+
+            frames   = np.flatnonzero(interior)
+            peak_idx = peak_idx[interior]
+            y1 = band[peak_idx - 1, frames]
+            y2 = band[peak_idx,     frames]
+            y3 = band[peak_idx + 1, frames]
+
+            # Parabolic peak offset formula — flat tops get no offset
+            denom = 2 * (2 * y2 - y1 - y3)
+            safe  = np.abs(denom) > 1e-12
+            p     = np.where(safe, (y3 - y1) / np.where(safe, denom, 1.0), 0.0)
+
+            interp_freq = self.freqs[lo + peak_idx] + p * self._freq_step
+            ridges[h['num']] = (self.times[frames], interp_freq)
 
         return ridges
 
@@ -653,8 +967,8 @@ class HarmonicAnnotator(BaseLayer):
 
                 if np.abs(matched - expected_freq) / expected_freq < 0.1:
                     # Peak ratio gives a static frequency — horizontal ridge
-                    ridge = [(t, matched) for t in self.times]
-                    ridges[harm_num] = ridge
+                    ridges[harm_num] = (self.times,
+                                        np.full(len(self.times), matched))
 
         return ridges
 
@@ -721,11 +1035,10 @@ class HarmonicAnnotator(BaseLayer):
 
         h1_num    = sorted_harm_nums[0]
         h1_ridge  = self.harmonic_ridges[h1_num]
-        h1_times  = np.array(h1_ridge['times'])
-        h1_freqs  = np.array(h1_ridge['freqs'])
+        h1_times  = h1_ridge['times']
+        h1_freqs  = h1_ridge['freqs']
 
-        lower_times  = []
-        lower_freqs  = []
+        lower_freqs  = np.empty(self.S_db.shape[1])
         fmin_display = self.fmin_display.get()
 
         for t_idx in range(self.S_db.shape[1]):
@@ -741,11 +1054,10 @@ class HarmonicAnnotator(BaseLayer):
             else:
                 valley_freq = fmin_display
 
-            lower_times.append(t)
-            lower_freqs.append(float(valley_freq))
+            lower_freqs[t_idx] = valley_freq
 
         self.valley_boundaries['dynamic_lower'] = {
-            'times': lower_times,
+            'times': self.times,
             'freqs': lower_freqs,
         }
 
@@ -764,13 +1076,12 @@ class HarmonicAnnotator(BaseLayer):
             ridge_n  = self.harmonic_ridges[n]
             ridge_n1 = self.harmonic_ridges[n1]
 
-            times_n  = np.array(ridge_n['times'])
-            freqs_n  = np.array(ridge_n['freqs'])
-            times_n1 = np.array(ridge_n1['times'])
-            freqs_n1 = np.array(ridge_n1['freqs'])
+            times_n  = ridge_n['times']
+            freqs_n  = ridge_n['freqs']
+            times_n1 = ridge_n1['times']
+            freqs_n1 = ridge_n1['freqs']
 
-            valley_times = []
-            valley_freqs = []
+            valley_freqs = np.empty(self.S_db.shape[1])
 
             for t_idx in range(self.S_db.shape[1]):
                 t           = self.times[t_idx]
@@ -789,11 +1100,10 @@ class HarmonicAnnotator(BaseLayer):
                     # No bins between ridges — ridges overlap, use midpoint
                     valley_freq = (freq_lo + freq_hi) / 2.0
 
-                valley_times.append(t)
-                valley_freqs.append(float(valley_freq))
+                valley_freqs[t_idx] = valley_freq
 
             self.valley_boundaries[key] = {
-                'times': valley_times,
+                'times': self.times,
                 'freqs': valley_freqs,
             }
 
@@ -805,11 +1115,10 @@ class HarmonicAnnotator(BaseLayer):
 
         h_max_num   = sorted_harm_nums[-1]
         h_max_ridge = self.harmonic_ridges[h_max_num]
-        h_max_times = np.array(h_max_ridge['times'])
-        h_max_freqs = np.array(h_max_ridge['freqs'])
+        h_max_times = h_max_ridge['times']
+        h_max_freqs = h_max_ridge['freqs']
 
-        upper_times  = []
-        upper_freqs  = []
+        upper_freqs  = np.empty(self.S_db.shape[1])
         fmax_display = self.fmax_display.get()
 
         for t_idx in range(self.S_db.shape[1]):
@@ -824,11 +1133,10 @@ class HarmonicAnnotator(BaseLayer):
             else:
                 valley_freq = fmax_display
 
-            upper_times.append(t)
-            upper_freqs.append(float(valley_freq))
+            upper_freqs[t_idx] = valley_freq
 
         self.valley_boundaries['dynamic_upper'] = {
-            'times': upper_times,
+            'times': self.times,
             'freqs': upper_freqs,
         }
 
@@ -845,62 +1153,92 @@ class HarmonicAnnotator(BaseLayer):
         if not self.harmonic_ridges:
             return
 
-        method = self.contour_method.get()
+        method      = self.contour_method.get()
+        smooth_hint = int(self.contour_smoothness.get())
 
         for harm_num, ridge in self.harmonic_ridges.items():
-            times = np.array(ridge['times'])
-            freqs = np.array(ridge['freqs'])
+            times = ridge['times']
+            freqs = ridge['freqs']
+
+            key    = (harm_num, method, smooth_hint)
+            cached = self._contour_cache.get(key)
+            if cached is not None and cached[0] is times and cached[1] is freqs:
+                self.harmonic_contours[harm_num] = cached[2]
+                continue
 
             if method == 'raw':
                 contour_freqs = freqs
             elif method == 'smooth':
-                contour_freqs = self._smooth_contour(
-                    freqs, int(self.contour_smoothness.get()))
+                contour_freqs = self._smooth_contour(freqs, smooth_hint)
             elif method == 'poly':
                 contour_freqs = self._polyfit_contour(
-                    times, freqs, int(self.contour_smoothness.get()))
+                    times, freqs, smooth_hint, harm_num)
             elif method == 'spline':
                 contour_freqs = self._spline_contour(
-                    times, freqs, int(self.contour_smoothness.get()))
+                    times, freqs, smooth_hint, harm_num)
             else:
                 contour_freqs = freqs
 
-            self.harmonic_contours[harm_num] = {
-                'times': times.tolist(),
-                'freqs': contour_freqs.tolist(),
+            contour = {
+                'times': times,
+                'freqs': contour_freqs,
             }
+            self.harmonic_contours[harm_num] = contour
+            self._contour_cache[key] = (times, freqs, contour)
 
     def _smooth_contour(self, freqs, window):
-        """Moving-average smoothing over frequency contour."""
+        """Moving-average smoothing over frequency contour.
+
+        Running-sum filter with edge-replicated ends — same window placement
+        as padding by (window // 2, window - 1 - window // 2) and convolving.
+        """
         window = max(1, int(window))
         if window == 1 or len(freqs) < 3:
             return freqs
-        kernel = np.ones(window) / window
-        padded = np.pad(freqs, (window // 2, window - 1 - window // 2), mode='edge')
-        return np.convolve(padded, kernel, mode='valid')
+        return uniform_filter1d(freqs, size=window, mode='nearest')
+
+    def _polyfit_contour(self, times, freqs, order_hint, harm_num=None):
+        """Polynomial fit of frequency vs time. order_hint maps to degree 1-3.
 
-    def _polyfit_contour(self, times, freqs, order_hint):
-        """Polynomial fit of frequency vs time. order_hint maps to degree 1-3."""
+        When harm_num is given the coefficients are cached per
+        (harm_num, length, order) until the ridges are replaced.
+        """
         if len(times) < 3:
             return freqs
         order = 1 if order_hint < 5 else (2 if order_hint < 10 else 3)
         t0 = times.mean()
         ts = times - t0
+        key = (harm_num, len(ts), order)
         try:
-            coeffs = np.polyfit(ts, freqs, order)
-            return np.poly1d(coeffs)(ts)
+            coeffs = self._polyfit_cache.get(key) if harm_num is not None else None
+            if coeffs is None:
+                coeffs = P.polyfit(ts, freqs, order)
+                if harm_num is not None:
+                    self._polyfit_cache[key] = coeffs
+            return P.polyval(ts, coeffs)
         except np.linalg.LinAlgError:
             return freqs
 
-    def _spline_contour(self, times, freqs, smooth_hint):
-        """Spline smoothing of frequency vs time."""
+    def _spline_contour(self, times, freqs, smooth_hint, harm_num=None):
+        """Spline smoothing of frequency vs time.
+
+        Fits a cubic smoothing spline with FITPACK splrep/splev. When harm_num
+        is given the knots and coefficients are cached per (harm_num, length,
+        s), so redraws at an unchanged slider setting skip the re-fit.
+        """
         if len(times) < 3:
             return freqs
         t0 = times.mean()
         ts = times - t0
         s  = max(1, int(smooth_hint)) * np.var(freqs) * 0.1
+        key = (harm_num, len(ts), s)
         try:
-            return UnivariateSpline(ts, freqs, s=s)(ts)
+            tck = self._spline_cache.get(key) if harm_num is not None else None
+            if tck is None:
+                tck = splrep(ts, freqs, s=s, k=3)
+                if harm_num is not None:
+                    self._spline_cache[key] = tck
+            return splev(ts, tck)
         except Exception:
             return freqs
 
@@ -936,7 +1274,7 @@ class HarmonicAnnotator(BaseLayer):
         # Alpha is kept low to preserve spectrogram legibility.
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
-        if self.show_bands.get() and self.valley_boundaries:
+        if self._show_bands and self.valley_boundaries:
             for i, harm_num in enumerate(sorted_harm_nums):
                 color = _HARMONIC_COLORS[(harm_num - 1) % len(_HARMONIC_COLORS)]
 
@@ -958,15 +1296,12 @@ class HarmonicAnnotator(BaseLayer):
                 upper_data = self.valley_boundaries.get(upper_key)
 
                 if lower_data and upper_data:
-                    lower_times = np.array(lower_data['times'])
-                    lower_freqs = np.array(lower_data['freqs'])
-                    upper_times = np.array(upper_data['times'])
-                    upper_freqs = np.array(upper_data['freqs'])
-
                     # Interpolate both to a common time grid for fill_between
                     common_times = self.times
-                    lower_interp = np.interp(common_times, lower_times, lower_freqs)
-                    upper_interp = np.interp(common_times, upper_times, upper_freqs)
+                    lower_interp = np.interp(common_times, lower_data['times'],
+                                             lower_data['freqs'])
+                    upper_interp = np.interp(common_times, upper_data['times'],
+                                             upper_data['freqs'])
 
                     self.ax.fill_between(
                         common_times,
@@ -983,14 +1318,18 @@ class HarmonicAnnotator(BaseLayer):
         # Drawn as dashed lines to distinguish from the static harmonic line.
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
-        if self.show_ridges.get() and self.harmonic_ridges:
+        drawn = set()
+        if self._show_ridges and self.harmonic_ridges:
             for harm_num, ridge in self.harmonic_ridges.items():
                 color = _HARMONIC_COLORS[(harm_num - 1) % len(_HARMONIC_COLORS)]
-                self.ax.plot(
-                    ridge['times'], ridge['freqs'],
-                    color=color, linewidth=1,
+                line  = self._cached_line('ridge', harm_num, lambda: self.ax.plot(
+                    [], [], color=color, linewidth=1,
                     alpha=_RIDGE_LINE_ALPHA, linestyle='--'
-                )
+                )[0])
+                line.set_data(ridge['times'], ridge['freqs'])
+                self.register_overlay(line)
+                drawn.add(harm_num)
+        self._prune_artist_cache(self._line_cache['ridge'], drawn)
 
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # 3. VALLEY BOUNDARY LINES
@@ -998,54 +1337,104 @@ class HarmonicAnnotator(BaseLayer):
         # is enabled, as they can clutter the display.
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
-        if self.show_valleys.get() and self.valley_boundaries:
+        drawn = set()
+        if self._show_valleys and self.valley_boundaries:
             valley_line_colors = ['cyan', 'magenta', 'lime', 'white', 'gold']
             for idx, (key, data) in enumerate(self.valley_boundaries.items()):
-                color = valley_line_colors[idx % len(valley_line_colors)]
-                self.ax.plot(
-                    data['times'], data['freqs'],
-                    color=color, linewidth=1,
+                line = self._cached_line('valley', key, lambda: self.ax.plot(
+                    [], [], linewidth=1,
                     alpha=_VALLEY_LINE_ALPHA, linestyle=':'
-                )
+                )[0])
+                # Colour follows position in the dict, which shifts as
+                # harmonics are added or removed
+                line.set_color(valley_line_colors[idx % len(valley_line_colors)])
+                line.set_data(data['times'], data['freqs'])
+                drawn.add(key)
+        self._prune_artist_cache(self._line_cache['valley'], drawn)
 
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # 4. STATIC HARMONIC LINES
         # Horizontal lines at each harmonic's current frequency.
         # These are the draggable handles for manual correction.
         # Frequency label shown at right edge of plot.
+        # Line and label are blitted overlays so a drag only moves them.
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
+        drawn   = set()
+        x_right = self.ax.get_xlim()[1]
         for h in self.harmonic_lines:
             color  = _HARMONIC_COLORS[(h['num'] - 1) % len(_HARMONIC_COLORS)]
-            h['line'] = self.ax.axhline(
-                h['freq'], color=color, linewidth=1,
+            h['line'] = self._cached_line('h', h['num'], lambda: self.ax.axhline(
+                0, color=color, linewidth=1,
                 alpha=0.5, label=f"H{h['num']}"
-            )
-            self.ax.text(
-                self.ax.get_xlim()[1],
-                h['freq'],
-                f"{h['freq']:.1f} Hz",
-                color=color, fontsize=7,
-                va='bottom', ha='right', alpha=0.8
-            )
+            ))
+            h['line'].set_ydata([h['freq'], h['freq']])
+            self.register_overlay(h['line'])
+            drawn.add(h['num'])
+
+            label = self._label_cache.get(h['num'])
+            if label is None or label.axes not in (None, self.ax):
+                label = self.ax.text(0, 0, '', fontsize=7,
+                                     va='bottom', ha='right', alpha=0.8)
+                self._label_cache[h['num']] = label
+            elif label.axes is None:
+                self.ax.add_artist(label)
+            label.set_position((x_right, h['freq']))
+            label.set_text(f"{h['freq']:.1f} Hz")
+            label.set_color(color)
+            self.register_overlay(label)
+        self._prune_artist_cache(self._line_cache['h'], drawn)
+        self._prune_artist_cache(self._label_cache, drawn)
 
         # (つ -' _ '- )つ    (つ -' _ '- )つ
         # 5. CONTOUR LINES
         # Smoothed ridge representation — drawn on top of ridge lines.
         # (つ -' _ '- )つ    (つ -' _ '- )つ
 
-        if self.show_contour.get() and self.harmonic_contours:
+        drawn = set()
+        if self._show_contour and self.harmonic_contours:
             for harm_num, contour in self.harmonic_contours.items():
                 color = _HARMONIC_COLORS[(harm_num - 1) % len(_HARMONIC_COLORS)]
-                self.ax.plot(
-                    contour['times'], contour['freqs'],
-                    color=color, alpha=0.5, linewidth=1
-                )
+                line  = self._cached_line('contour', harm_num, lambda: self.ax.plot(
+                    [], [], color=color, alpha=0.5, linewidth=1
+                )[0])
+                line.set_data(contour['times'], contour['freqs'])
+                self.register_overlay(line)
+                drawn.add(harm_num)
+        self._prune_artist_cache(self._line_cache['contour'], drawn)
 
         # 6. Shared point annotations from API
         from yaaat.core.visualization import draw_shared_point_annotations
         draw_shared_point_annotations(self)
 
+    def _cached_line(self, kind, key, make):
+        """Return the cached Line2D for (kind, key), attached to self.ax.
+
+        Args:
+            kind: 'h', 'ridge', 'contour' or 'valley'
+            key:  harmonic number, or valley boundary name
+            make: zero-arg callable creating the styled line on self.ax;
+                  called on first use or when the axes were replaced
+
+        Returns:
+            Line2D
+        """
+        line = self._line_cache[kind].get(key)
+        if line is None or line.axes not in (None, self.ax):
+            line = make()
+            self._line_cache[kind][key] = line
+        elif line.axes is None:
+            # Stripped by the previous update_display() pass
+            self.ax.add_line(line)
+        return line
+
+    def _prune_artist_cache(self, cache, keep):
+        """Drop cached artists whose key was not drawn this pass."""
+        for key in cache.keys() - keep:
+            artist = cache.pop(key)
+            if artist.axes is not None:
+                artist.remove()
+
     ##    <(''<)  <( ' ' )>  (>'')>
     # MOUSE INTERACTION HOOKS
     ##    <(''<)  <( ' ' )>  (>'')>
@@ -1081,9 +1470,40 @@ class HarmonicAnnotator(BaseLayer):
             return False
         if event.ydata is not None:
             self.selected_line['freq'] = event.ydata
-            self.update_display()
+            if self._pending_drag_line is None:
+                self.root.after_idle(self._do_drag_draw)
+            self._pending_drag_line = self.selected_line
         return True
 
+    def _do_drag_draw(self):
+        """Draw the dragged line at its latest frequency. Called from after_idle.
+
+        Runs even if the button was released in between, so a small final
+        move that skips the release redraw is still shown.
+        """
+        h, self._pending_drag_line = self._pending_drag_line, None
+        if h is not None:
+            self._move_harmonic_line(h)
+
+    def _move_harmonic_line(self, h):
+        """Move one harmonic line and its label to h['freq'] by blitting.
+
+        Falls back to a full update_display() if the line has not been drawn.
+        """
+        label = self._label_cache.get(h['num'])
+        if h['line'] is None or label is None:
+            self.update_display()
+            return
+        h['line'].set_ydata([h['freq'], h['freq']])
+        label.set_y(h['freq'])
+        label.set_text(f"{h['freq']:.1f} Hz")
+        self.update_overlays()
+
+    def _harmonic_freqs(self):
+        """Frequencies of harmonic_lines as a new float64 array, in list order."""
+        return np.fromiter((h['freq'] for h in self.harmonic_lines),
+                           dtype=np.float64, count=len(self.harmonic_lines))
+
     def on_custom_release(self, event):
         """Finalize drag — rescale harmonics if H1 moved, redetect ridges and valleys."""
         if self.selected_line is None:
@@ -1094,6 +1514,7 @@ class HarmonicAnnotator(BaseLayer):
 
         if abs(new_freq - old_freq) > 1.0:
             self.changes_made = True
+            self._band_cache.clear()
 
             if self.selected_line['num'] == 1:
                 # (つ -' _ '- )つ    (つ -' _ '- )つ
@@ -1103,16 +1524,18 @@ class HarmonicAnnotator(BaseLayer):
                 # (つ -' _ '- )つ    (つ -' _ '- )つ
                 ratio            = new_freq / old_freq if old_freq > 0 else 1.0
                 self.detected_f0 = new_freq
-                for h in self.harmonic_lines:
+                scaled           = self._harmonic_freqs()
+                scaled          *= ratio
+                for h, freq in zip(self.harmonic_lines, scaled.tolist()):
                     if h is not self.selected_line:
-                        h['freq'] *= ratio
+                        h['freq'] = freq
 
             # Redetect ridges and valley boundaries at new harmonic positions
-            if self.show_ridges.get():
+            if self._show_ridges:
                 self.detect_harmonic_ridges()
             self._compute_valley_boundaries()
 
-            if self.show_contour.get():
+            if self._show_contour:
                 self.compute_contours()
 
             self.update_display()
@@ -1135,6 +1558,7 @@ class HarmonicAnnotator(BaseLayer):
             return
 
         exists = any(h['num'] == harm_num for h in self.harmonic_lines)
+        self._band_cache.clear()
 
         if exists:
             if harm_num == 1:
@@ -1153,7 +1577,7 @@ class HarmonicAnnotator(BaseLayer):
             })
             self.harmonic_lines.sort(key=lambda h: h['num'])
 
-            if self.show_ridges.get():
+            if self._show_ridges:
                 self.detect_harmonic_ridges()
 
         # Recompute valley boundaries after harmonic set changes
@@ -1170,7 +1594,8 @@ class HarmonicAnnotator(BaseLayer):
             return
         if messagebox.askyesno("Clear", f"Remove {len(self.harmonic_lines)-1} harmonics?"):
             self.harmonic_lines  = [h for h in self.harmonic_lines if h['num'] == 1]
-            self.harmonic_ridges = {1: self.harmonic_ridges.get(1, {})}
+            self.harmonic_ridges = {k: v for k, v in self.harmonic_ridges.items()
+                                    if k == 1}
             self._compute_valley_boundaries()
             self.update_display()
             self.update_info()
@@ -1195,7 +1620,7 @@ class HarmonicAnnotator(BaseLayer):
 
     def on_ridge_method_change(self):
         """Re-detect ridges with new method. Disable tolerance slider for non-peaks methods."""
-        method = self.ridge_method.get()
+        method = self._ridge_method
         if hasattr(self, 'tol_scale'):
             state = 'normal' if method == 'peaks' else 'disabled'
             self.tol_scale.configure(state=state)
@@ -1203,7 +1628,7 @@ class HarmonicAnnotator(BaseLayer):
         if self.harmonic_lines:
             self.detect_harmonic_ridges()
             self._compute_valley_boundaries()
-            if self.show_contour.get():
+            if self._show_contour:
                 self.compute_contours()
             self.update_display()
 
@@ -1211,12 +1636,8 @@ class HarmonicAnnotator(BaseLayer):
         """Re-detect ridges when tolerance slider changes (peaks method only)."""
         if hasattr(self, 'tol_label'):
             self.tol_label.config(text=f"{self.peak_tolerance.get():.2f}")
-        if self.ridge_method.get() == 'peaks' and self.harmonic_lines:
-            self.detect_harmonic_ridges()
-            self._compute_valley_boundaries()
-            if self.show_contour.get():
-                self.compute_contours()
-            self.update_display()
+        if self._ridge_method == 'peaks' and self.harmonic_lines:
+            self._schedule_recompute(redetect=True)
 
     def on_valley_method_change(self):
         """Recompute valley boundaries with new method."""
@@ -1225,22 +1646,79 @@ class HarmonicAnnotator(BaseLayer):
 
     def on_show_contour_toggle(self):
         """Compute contours on first enable, then redraw."""
-        if self.show_contour.get():
+        if self._show_contour:
             self.compute_contours()
         self.update_display()
 
     def on_contour_method_change(self):
         """Recompute contours with new method."""
-        if self.show_contour.get():
+        if self._show_contour:
             self.compute_contours()
             self.update_display()
 
     def on_contour_smoothness_change(self, value):
         """Recompute contours when smoothness slider changes."""
-        if self.show_contour.get():
+        if self._show_contour:
+            self._schedule_recompute()
+
+    def _schedule_recompute(self, redetect=False):
+        """Debounce slider-driven recomputes.
+
+        Scale widgets fire on every pixel of drag; each tick cancels the
+        pending job so only the settled value pays for the fits and redraw.
+
+        Args:
+            redetect: Also re-detect ridges and valleys, not just contours.
+                Sticky until the pending job runs.
+        """
+        self._pending_redetect = self._pending_redetect or redetect
+        if self._pending_recompute is not None:
+            self.root.after_cancel(self._pending_recompute)
+        self._pending_recompute = self.root.after(
+            _SLIDER_RECOMPUTE_DELAY_MS, self._do_recompute)
+
+    def _do_recompute(self):
+        """Run the debounced recompute. Called from root.after."""
+        redetect = self._pending_redetect
+        self._pending_recompute = None
+        self._pending_redetect  = False
+
+        if redetect:
+            if not self.harmonic_lines:
+                return
+            self.detect_harmonic_ridges()
+            self._compute_valley_boundaries()
+        if self._show_contour:
             self.compute_contours()
+
+        # Bands and valley lines are static artists — new ridges move them
+        bands_stale = redetect and (self._show_bands or self._show_valleys)
+        if bands_stale or not self._blit_series():
             self.update_display()
 
+    def _blit_series(self):
+        """Push current ridge and contour arrays into their drawn artists and blit.
+
+        Returns:
+            bool — False if the drawn artists no longer match the visible
+            series (harmonic added/removed, layer toggled); the caller then
+            needs a full update_display()
+        """
+        ridges   = self.harmonic_ridges if self._show_ridges else {}
+        contours = self.harmonic_contours if self._show_contour else {}
+        ridge_lines   = self._line_cache['ridge']
+        contour_lines = self._line_cache['contour']
+        if (ridges.keys() != ridge_lines.keys() or
+                contours.keys() != contour_lines.keys()):
+            return False
+
+        for harm_num, ridge in ridges.items():
+            ridge_lines[harm_num].set_data(ridge['times'], ridge['freqs'])
+        for harm_num, contour in contours.items():
+            contour_lines[harm_num].set_data(contour['times'], contour['freqs'])
+        self.update_overlays()
+        return True
+
     ##    <(''<)  <( ' ' )>  (>'')>
     # INFO AND LIST UPDATE
     ##    <(''<)  <( ' ' )>  (>'')>
@@ -1258,12 +1736,30 @@ class HarmonicAnnotator(BaseLayer):
         self._update_harmonics_listbox()
 
     def _update_harmonics_listbox(self):
-        """Refresh the active harmonics listbox."""
-        if hasattr(self, 'harmonics_listbox'):
-            self.harmonics_listbox.delete(0, tk.END)
-            for h in sorted(self.harmonic_lines, key=lambda x: x['num']):
-                self.harmonics_listbox.insert(
-                    tk.END, f"H{h['num']}: {h['freq']:.1f} Hz")
+        """Refresh the active harmonics listbox.
+
+        Same row count: only rows whose text changed are replaced. Otherwise
+        the list is cleared and refilled with one multi-item insert.
+        """
+        if not hasattr(self, 'harmonics_listbox'):
+            return
+        rows = [f"H{h['num']}: {h['freq']:.1f} Hz"
+                for h in sorted(self.harmonic_lines, key=lambda x: x['num'])]
+        shown = self._harmonics_list_rows
+        if rows == shown:
+            return
+
+        listbox = self.harmonics_listbox
+        if len(rows) == len(shown):
+            for i, (new, old) in enumerate(zip(rows, shown)):
+                if new != old:
+                    listbox.delete(i)
+                    listbox.insert(i, new)
+        else:
+            listbox.delete(0, tk.END)
+            if rows:
+                listbox.insert(tk.END, *rows)
+        self._harmonics_list_rows = rows
 
     ##    <(''<)  <( ' ' )>  (>'')>
     # SAVE / LOAD
@@ -1309,9 +1805,11 @@ class HarmonicAnnotator(BaseLayer):
             "detected_f0":       float(self.detected_f0) if self.detected_f0 else None,
             "harmonics":         harmonic_data,
             "ridges":            {
-                str(k): v for k, v in self.harmonic_ridges.items()
+                str(k): _series_to_json(v) for k, v in self.harmonic_ridges.items()
+            },
+            "valley_boundaries": {
+                k: _series_to_json(v) for k, v in self.valley_boundaries.items()
             },
-            "valley_boundaries": self.valley_boundaries,
 
             # valley_method recorded for downstream comparative analysis.
             # When FuzzyValley is integrated, this field distinguishes which
@@ -1319,7 +1817,7 @@ class HarmonicAnnotator(BaseLayer):
             "valley_method":     self.valley_method.get(),
 
             "contours":          {
-                str(k): v for k, v in self.harmonic_contours.items()
+                str(k): _series_to_json(v) for k, v in self.harmonic_contours.items()
             },
             "contour_method":    self.contour_method.get(),
             "peak_ratio_result": peak_ratio_data,
@@ -1364,12 +1862,18 @@ class HarmonicAnnotator(BaseLayer):
         self.detected_f0 = data.get('detected_f0')
 
         # Restore ridges — keys stored as strings, convert back to int
+        self._spline_cache.clear()
+        self._polyfit_cache.clear()
+        self._contour_cache.clear()
         self.harmonic_ridges = {
-            int(k): v for k, v in data.get('ridges', {}).items()
+            int(k): _series_from_json(v) for k, v in data.get('ridges', {}).items()
         }
 
         # Restore valley boundaries
-        self.valley_boundaries = data.get('valley_boundaries', {})
+        self.valley_boundaries = {
+            k: _series_from_json(v)
+            for k, v in data.get('valley_boundaries', {}).items()
+        }
 
         # Restore valley method — used to display which method was used
         saved_method = data.get('valley_method')
@@ -1378,7 +1882,7 @@ class HarmonicAnnotator(BaseLayer):
 
         # Restore contours
         self.harmonic_contours = {
-            int(k): v for k, v in data.get('contours', {}).items()
+            int(k): _series_from_json(v) for k, v in data.get('contours', {}).items()
         }
 
         # Restore contour method
@@ -1394,7 +1898,7 @@ class HarmonicAnnotator(BaseLayer):
             self.show_contour.set(bool(saved_spec['show_contour']))
 
         # Recompute contours if enabled after load
-        if self.show_contour.get() and self.harmonic_ridges:
+        if self._show_contour and self.harmonic_ridges:
             self.compute_contours()
 
         self.update_info()
@@ -800,7 +800,10 @@ class PeakAnnotator(BaseLayer):
 
         Full redraw: plots vertical spectrogram with freq on x-axis.
         Overlay-only: removes scatter collections and PSD lines, redraws overlays.
+        Deferred while the tab is hidden, like BaseLayer.update_display().
         """
+        if self._defer_if_hidden(recompute_spec):
+            return
         try:
             if self.y is None:
                 return
@@ -891,7 +894,7 @@ class PeakAnnotator(BaseLayer):
         """Reset zoom to full frequency range and full time extent."""
         if self.y is None:
             return
-        self.zoom_stack = []
+        self.zoom_stack.clear()
         self.ax.set_xlim(self.fmin_display.get(), self.fmax_display.get())
         self.ax.set_ylim(0, len(self.times))
         self.canvas.draw_idle()
@@ -1186,7 +1189,7 @@ class PeakAnnotator(BaseLayer):
         }
 
         tab_data = {
-            "audio_file":      str(self.audio_files[self.current_file_idx]),
+            "audio_file":      self._audio_paths_str[self.current_file_idx],
             "contour_source":  changepoints_path.name,
             "peaks":           self.peak_annotations,
             "peak_stats":      peak_stats,